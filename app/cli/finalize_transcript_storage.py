@@ -0,0 +1,81 @@
+"""예전 릴리스의 meetings.full_transcript 컬럼을 지워 전사 분리(meeting_transcripts)를 마무리한다.
+
+기동 시 마이그레이션은 이전 릴리스로 되돌릴 수 있도록 이 컬럼을 남겨 두고 새 전사도 함께 써 둔다.
+더 이상 되돌리지 않을 때 한 번 실행하며, 실행한 뒤에는 이전 릴리스가 전사를 읽을 수 없다.
+
+- 남은 전사를 한 번 더 meeting_transcripts 로 복사하고, 예전 컬럼에 쓰던 트리거를 지운다
+- 예전 컬럼을 참조하던 meetings.search_vector 는 지웠다가 init_db 가 제목/요약만으로 다시 만든다
+- 그 밖에 컬럼을 참조하는 뷰 등이 있으면 CASCADE 로 함께 지우지 않고 실패한다 (아무것도 바뀌지 않음)
+- 디스크 공간은 VACUUM FULL meetings 후에 반환된다
+
+실행:
+    uv run python -m app.cli.finalize_transcript_storage --yes
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.config.db import engine, init_db
+from app.config.logging import setup_logging
+from app.config.migrations import COPY_LEGACY_TRANSCRIPTS, LEGACY_TRANSCRIPT_COLUMN_EXISTS
+
+
+logger = logging.getLogger("meeting-stt")
+
+_SEARCH_VECTOR_USES_LEGACY_COLUMN = (
+    "SELECT 1 FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = 'meetings' AND column_name = 'search_vector' "
+    "AND generation_expression LIKE '%full_transcript%'"
+)
+
+
+def finalize() -> bool:
+    """예전 컬럼을 지웠으면 True, 이미 없으면 False. 실패하면 트랜잭션 전체가 롤백된다."""
+
+    with engine.begin() as conn:
+        if conn.execute(text(LEGACY_TRANSCRIPT_COLUMN_EXISTS)).first() is None:
+            return False
+        copied = conn.execute(text(COPY_LEGACY_TRANSCRIPTS)).rowcount
+        logger.info("copied %d transcripts from meetings.full_transcript", copied)
+        conn.execute(text("DROP TRIGGER IF EXISTS meeting_transcripts_legacy_mirror ON meeting_transcripts"))
+        conn.execute(text("DROP FUNCTION IF EXISTS mirror_legacy_full_transcript()"))
+        if conn.execute(text(_SEARCH_VECTOR_USES_LEGACY_COLUMN)).first() is not None:
+            conn.execute(text("ALTER TABLE meetings DROP COLUMN search_vector"))
+        # RESTRICT: 알지 못하는 의존 객체가 있으면 지우지 않고 실패
+        conn.execute(text("ALTER TABLE meetings DROP COLUMN full_transcript RESTRICT"))
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--yes", action="store_true", help="되돌릴 수 없는 컬럼 삭제를 실행")
+    args = parser.parse_args()
+
+    setup_logging()
+    if not args.yes:
+        print("meetings.full_transcript 를 지우면 이전 릴리스로 되돌릴 수 없습니다. --yes 로 실행하세요.", file=sys.stderr)
+        sys.exit(2)
+
+    init_db()
+    try:
+        dropped = finalize()
+    except DBAPIError as exc:
+        print(f"failed, nothing changed: {exc.orig}", file=sys.stderr)
+        sys.exit(1)
+    if not dropped:
+        print("meetings.full_transcript 가 이미 없습니다.", file=sys.stderr)
+        return
+
+    # 지운 search_vector 와 인덱스를 다시 만든다
+    init_db()
+    print("meetings.full_transcript dropped; run VACUUM FULL meetings to reclaim disk space", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
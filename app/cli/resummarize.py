@@ -0,0 +1,85 @@
+"""전사가 있는 모든 회의를 현재 system prompt 로 다시 요약한다.
+
+배치마다 결과와 checkpoint 를 커밋하므로 Ctrl-C 등으로 멈추면 실행이 interrupted 로 남고,
+--resume 으로 마지막 checkpoint 다음 회의부터 이어서 처리한다.
+
+실행:
+    uv run python -m app.cli.resummarize --batch-size 100 --concurrency 8
+    uv run python -m app.cli.resummarize --resume-latest
+    uv run python -m app.cli.resummarize --resume 3f0c...
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+import argparse
+import asyncio
+import sys
+
+from fastapi import HTTPException
+
+from app.config.db import SessionLocal, init_db
+from app.config.http import close_http_clients, init_http_clients
+from app.config.logging import setup_logging
+from app.models.meeting import SummaryRefreshStatus
+from app.repository.summary_refresh_repository import get_run, list_runs
+from app.service.summary_refresh_service import claim_refresh_run, create_refresh_run, run_refresh
+
+
+def _select_run(args: argparse.Namespace) -> UUID:
+    with SessionLocal() as db:
+        if args.resume is not None:
+            run = get_run(db, run_id=args.resume)
+            if run is None:
+                raise SystemExit(f"run {args.resume} not found")
+        elif args.resume_latest:
+            run = next(
+                (r for r in list_runs(db) if r.status != SummaryRefreshStatus.COMPLETED.value),
+                None,
+            )
+            if run is None:
+                raise SystemExit("no unfinished run to resume")
+        else:
+            run = create_refresh_run(db, batch_size=args.batch_size, concurrency=args.concurrency)
+            return run.id
+        try:
+            # 서버나 다른 CLI 에서 실행 중인 run 은 이어서 실행하지 않는다
+            return claim_refresh_run(db, run_id=run.id).id
+        except HTTPException as exc:
+            raise SystemExit(f"run {run.id}: {exc.detail}") from None
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    init_db()
+    await init_http_clients()
+    try:
+        run_id = _select_run(args)
+        print(f"summary refresh run {run_id}", file=sys.stderr)
+        result = await run_refresh(run_id)
+    finally:
+        await close_http_clients()
+
+    print(result.model_dump_json(indent=2))
+    return 0 if result.status is SummaryRefreshStatus.COMPLETED else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    resume = parser.add_mutually_exclusive_group()
+    resume.add_argument("--resume", type=UUID, default=None, help="이어서 실행할 run id")
+    resume.add_argument("--resume-latest", action="store_true", help="가장 최근의 끝나지 않은 실행을 이어서 실행")
+    parser.add_argument("--batch-size", type=int, default=None, help="새 실행의 배치 크기 (기본 SUMMARY_REFRESH_BATCH_SIZE)")
+    parser.add_argument("--concurrency", type=int, default=None, help="새 실행의 LLM 동시 호출 수 (기본 SUMMARY_REFRESH_CONCURRENCY)")
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        sys.exit(asyncio.run(main_async(args)))
+    except KeyboardInterrupt:
+        # run_refresh 가 취소되면서 실행을 interrupted 로 저장한다
+        print("interrupted; resume with --resume-latest", file=sys.stderr)
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config.settings import get_settings
@@ -8,16 +9,42 @@ from app.config.settings import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
+
+def _pool_options() -> dict:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+engine = create_engine(settings.database_url, future=True, **_pool_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async def 경로(요청 처리, 워커, WebSocket)용. 같은 URL(postgresql+psycopg)로 psycopg 의 async 드라이버를 쓴다
+async_engine = create_async_engine(settings.database_url, **_pool_options())
+# commit 후 속성을 다시 읽으려고 lazy load(동기 I/O)가 일어나지 않도록 expire 하지 않는다
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
 def init_db() -> None:
     import app.models  # noqa: F401
+    from app.config.migrations import run_migrations
 
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    # create_all 은 이미 있는 테이블에 나중에 추가한 인덱스를 만들지 않으므로 따로 확인
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+async def close_db() -> None:
+    await async_engine.dispose()
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -26,3 +53,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from enum import Enum
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+from prometheus_client import Counter
+from prometheus_client.core import REGISTRY, GaugeMetricFamily
+
+from app.config.settings import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+
+class HttpBackend(str, Enum):
+    AZURE_SPEECH = "azure_speech"
+    WHISPER = "whisper"
+    AZURE_OPENAI = "azure_openai"
+
+
+HTTP_REQUESTS = Counter(
+    "meeting_stt_http_client_requests_total",
+    "외부 백엔드로 보낸 HTTP 요청 수",
+    ["backend", "status"],
+)
+
+# 앱 수명 동안 재사용하는 백엔드별 AsyncClient (startup 에서 생성, shutdown 에서 종료)
+_clients: dict[HttpBackend, httpx.AsyncClient] = {}
+
+
+def _max_connections(backend: HttpBackend) -> int:
+    if backend is HttpBackend.AZURE_SPEECH:
+        return settings.http_max_connections_azure_speech
+    if backend is HttpBackend.WHISPER:
+        return settings.http_max_connections_whisper
+    return settings.http_max_connections_azure_openai
+
+
+def _http2_available() -> bool:
+    # httpx 의 HTTP/2 지원은 선택 의존성(h2)이 설치되어 있어야 동작
+    return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def backend_base_url(backend: HttpBackend) -> str | None:
+    """워밍업 대상이 되는 백엔드 기본 URL. 설정이 없으면 None."""
+
+    if backend is HttpBackend.AZURE_SPEECH:
+        if settings.azure_speech_stt_base_url:
+            return settings.azure_speech_stt_base_url.rstrip("/")
+        if not settings.azure_speech_region:
+            return None
+        return f"https://{settings.azure_speech_region}.stt.speech.microsoft.com"
+    if backend is HttpBackend.WHISPER:
+        return settings.whisper_api_base_url.rstrip("/") if settings.whisper_api_base_url else None
+    return settings.azure_openai_endpoint.rstrip("/") if settings.azure_openai_endpoint else None
+
+
+def _build_client(backend: HttpBackend) -> httpx.AsyncClient:
+    max_connections = max(1, _max_connections(backend))
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(max_connections, settings.http_max_keepalive_connections),
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+
+    async def count_response(response: httpx.Response) -> None:
+        HTTP_REQUESTS.labels(backend=backend.value, status=str(response.status_code)).inc()
+
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(60.0, connect=settings.http_connect_timeout_seconds),
+        http2=_http2_available(),
+        event_hooks={"response": [count_response]},
+    )
+
+
+def get_http_client(backend: HttpBackend) -> httpx.AsyncClient:
+    """백엔드별 공유 AsyncClient 반환.
+
+    startup 이전(스크립트 등)에 호출되면 그 자리에서 생성해 등록한다.
+    """
+
+    client = _clients.get(backend)
+    if client is None or client.is_closed:
+        client = _build_client(backend)
+        _clients[backend] = client
+    return client
+
+
+async def _warm_up(backend: HttpBackend, count: int) -> None:
+    """HEAD 요청으로 커넥션을 미리 열어 첫 요청의 TCP/TLS 핸드셰이크 비용을 없앤다."""
+
+    base_url = backend_base_url(backend)
+    if not base_url or count <= 0:
+        return
+
+    client = get_http_client(backend)
+    results = await asyncio.gather(
+        *(client.head(base_url, timeout=settings.http_connect_timeout_seconds) for _ in range(count)),
+        return_exceptions=True,
+    )
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        logger.warning("HTTP warm-up for %s failed: %s", backend.value, failed[0])
+    else:
+        logger.info("HTTP warm-up for %s opened %d connection(s)", backend.value, count)
+
+
+async def init_http_clients() -> None:
+    """startup 훅: 백엔드별 클라이언트를 만들고, 설정 시 워밍업 커넥션을 연다."""
+
+    if settings.http2_enabled and not _http2_available():
+        logger.info("h2 not installed, HTTP clients fall back to HTTP/1.1")
+
+    for backend in HttpBackend:
+        get_http_client(backend)
+
+    if settings.http_warmup_connections > 0:
+        await asyncio.gather(
+            *(_warm_up(backend, settings.http_warmup_connections) for backend in HttpBackend)
+        )
+
+
+async def close_http_clients() -> None:
+    """shutdown 훅: 열린 커넥션을 모두 정리한다."""
+
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+def _is_http2(connection: object) -> bool:
+    inner = getattr(connection, "_connection", None)
+    return type(inner).__name__ == "AsyncHTTP2Connection"
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list | None:
+    """클라이언트의 httpcore 풀 커넥션 목록. httpx/httpcore 내부 구조가 달라 읽을 수 없으면 None.
+
+    httpx 는 풀 상태를 공개 API 로 노출하지 않으므로 비공개 속성을 읽으며, 버전이 바뀌어도 scrape 가 실패하지 않도록 한다.
+    """
+
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return None
+    try:
+        return list(connections)
+    except TypeError:
+        return None
+
+
+def _is_idle(connection: object) -> bool:
+    is_idle = getattr(connection, "is_idle", None)
+    return bool(is_idle()) if callable(is_idle) else False
+
+
+class _PoolStatsCollector:
+    """scrape 시점에 각 클라이언트의 커넥션 풀 상태를 읽어 Gauge 로 노출."""
+
+    def collect(self):
+        connections = GaugeMetricFamily(
+            "meeting_stt_http_pool_connections",
+            "백엔드별 커넥션 풀의 커넥션 수",
+            labels=["backend", "state"],
+        )
+        http2_connections = GaugeMetricFamily(
+            "meeting_stt_http_pool_http2_connections",
+            "백엔드별 커넥션 풀 중 HTTP/2 로 협상된 커넥션 수",
+            labels=["backend"],
+        )
+        max_connections = GaugeMetricFamily(
+            "meeting_stt_http_pool_max_connections",
+            "백엔드별 커넥션 풀 최대 커넥션 수",
+            labels=["backend"],
+        )
+
+        for backend, client in list(_clients.items()):
+            max_connections.add_metric([backend.value], _max_connections(backend))
+            pool_connections = _pool_connections(client)
+            if pool_connections is None:
+                # 풀 상태를 읽을 수 없으면 0 으로 보이지 않도록 커넥션 수는 내보내지 않는다
+                continue
+            idle = sum(1 for conn in pool_connections if _is_idle(conn))
+
+            connections.add_metric([backend.value, "active"], len(pool_connections) - idle)
+            connections.add_metric([backend.value, "idle"], idle)
+            http2_connections.add_metric(
+                [backend.value], sum(1 for conn in pool_connections if _is_http2(conn))
+            )
+
+        yield connections
+        yield http2_connections
+        yield max_connections
+
+
+REGISTRY.register(_PoolStatsCollector())
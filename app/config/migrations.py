@@ -0,0 +1,179 @@
+"""create_all 이 처리하지 못하는 기존 테이블 변경 (컬럼 추가/이동, 저장 옵션, 확장 기능 의존 인덱스).
+
+모든 문장은 여러 번 실행해도 안전해야 하며(IF NOT EXISTS 등), init_db 에서 매 기동 시 실행한다.
+이전 릴리스로 되돌려도 동작하도록 추가만 하고, 컬럼 삭제 같은 변경은 app/cli 의 일회성 명령으로 실행한다.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.config.settings import get_settings
+from app.models.models import MEETING_SEARCH_VECTOR
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+# 예전 릴리스의 meetings.full_transcript 컬럼 (app/cli/finalize_transcript_storage.py 로 지우기 전까지 남아 있다)
+LEGACY_TRANSCRIPT_COLUMN_EXISTS = (
+    "SELECT 1 FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = 'meetings' AND column_name = 'full_transcript'"
+)
+# 예전 릴리스가 쓰거나 고친 전사를 meeting_transcripts 로 옮긴다 (같은 내용이면 건드리지 않음)
+COPY_LEGACY_TRANSCRIPTS = (
+    "INSERT INTO meeting_transcripts (meeting_id, content) "
+    "SELECT id, full_transcript FROM meetings WHERE full_transcript IS NOT NULL "
+    "ON CONFLICT (meeting_id) DO UPDATE SET content = EXCLUDED.content "
+    "WHERE meeting_transcripts.content IS DISTINCT FROM EXCLUDED.content"
+)
+
+# 한 트랜잭션에서 순서대로 실행. 모두 추가/완화만 하며, 되돌릴 수 없는 삭제는 CLI 로만 한다
+MIGRATIONS: list[str] = [
+    # 전사가 이 크기(바이트)를 넘으면 압축 후 TOAST 로 저장 (기본 약 2KB 미만은 압축 없이 행에 그대로 들어감)
+    "ALTER TABLE meeting_transcripts SET (toast_tuple_target = 256)",
+    # meetings.full_transcript → meeting_transcripts 이동. 예전 컬럼은 여기서 지우지 않는다 (이전 릴리스로 되돌릴 수 있도록).
+    # 컬럼이 남아 있는 동안은 기동할 때마다 예전 릴리스가 쓴 전사를 복사하고, 새 전사는 트리거로 예전 컬럼에도 써 둔다.
+    # 컬럼 삭제는 python -m app.cli.finalize_transcript_storage 로 따로 실행한다
+    """
+    CREATE OR REPLACE FUNCTION mirror_legacy_full_transcript() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE meetings SET full_transcript = NEW.content
+        WHERE id = NEW.meeting_id AND full_transcript IS DISTINCT FROM NEW.content;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    DO $$
+    BEGIN
+        IF EXISTS ({LEGACY_TRANSCRIPT_COLUMN_EXISTS}) THEN
+            {COPY_LEGACY_TRANSCRIPTS};
+            CREATE OR REPLACE TRIGGER meeting_transcripts_legacy_mirror
+            AFTER INSERT OR UPDATE OF content ON meeting_transcripts
+            FOR EACH ROW EXECUTE FUNCTION mirror_legacy_full_transcript();
+        END IF;
+    END
+    $$
+    """,
+    # GET /meetings/search (기존 meetings 테이블에 생성 컬럼 추가. GIN 인덱스는 모델에 선언되어 init_db 가 만든다)
+    f"ALTER TABLE meetings ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS ({MEETING_SEARCH_VECTOR}) STORED",
+    # 녹음 원본 참조 (인덱스는 모델에 선언되어 init_db 가 만든다)
+    "ALTER TABLE meetings ADD COLUMN IF NOT EXISTS audio_sha256 text REFERENCES audio_objects (sha256) ON DELETE RESTRICT",
+    # 세그먼트별 전사 결과 캐시 (GET /meetings/{id}/segments). 예전 항목은 NULL 로 남고 적중 시 전체를 한 구간으로 저장한다
+    "ALTER TABLE transcript_cache ADD COLUMN IF NOT EXISTS segments jsonb",
+    # 일괄 재요약 실행의 heartbeat (resume 이 다른 프로세스에서 실행 중인 run 을 다시 시작하지 않도록)
+    "ALTER TABLE summary_refresh_runs ADD COLUMN IF NOT EXISTS heartbeat_at timestamptz",
+    # 회의 목록/상세 응답 캐시 버전 (app/service/meeting_cache_service.py). 어느 워커/CLI 에서 쓰든 같은 트랜잭션에서 올라간다.
+    # 목록은 'meetings/list' 한 행, 상세는 회의마다 'meetings/<id>' 행을 두어 서로 다른 회의의 쓰기가 같은 행 잠금을 기다리지 않게 한다.
+    # 버전 값은 시퀀스에서 받아 키끼리 겹치지 않고, 기동할 때마다 현재 시각(µs) 이상으로 올려 테이블을 다시 만들어도 예전 ETag 와 겹치지 않는다
+    "CREATE SEQUENCE IF NOT EXISTS cache_version_seq",
+    """
+    SELECT setval(
+        'cache_version_seq',
+        GREATEST((SELECT last_value FROM cache_version_seq), (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)
+    )
+    """,
+    # 예전 방식(모든 쓰기가 'meetings' 한 행을 올리던 statement 트리거) 정리
+    "DROP TRIGGER IF EXISTS meetings_cache_version ON meetings",
+    "DROP TRIGGER IF EXISTS meeting_transcripts_cache_version ON meeting_transcripts",
+    "DROP FUNCTION IF EXISTS bump_meetings_cache_version()",
+    "DELETE FROM cache_versions WHERE name = 'meetings'",
+    # 목록 버전: 목록에 보이는 값(추가/삭제, 제목/요약/생성 시각)이 바뀔 때만 올린다
+    """
+    CREATE OR REPLACE FUNCTION bump_meeting_list_cache_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO cache_versions (name, version) VALUES ('meetings/list', nextval('cache_version_seq'))
+        ON CONFLICT (name) DO UPDATE SET version = EXCLUDED.version;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "CREATE OR REPLACE TRIGGER meetings_list_cache_version AFTER INSERT OR DELETE OR TRUNCATE ON meetings "
+    "FOR EACH STATEMENT EXECUTE FUNCTION bump_meeting_list_cache_version()",
+    "CREATE OR REPLACE TRIGGER meetings_list_update_cache_version AFTER UPDATE OF title, summary, created_at ON meetings "
+    "FOR EACH STATEMENT EXECUTE FUNCTION bump_meeting_list_cache_version()",
+    # 상세 버전: 회의 행이 생기거나 바뀌면 올리고, 지우면 키도 지운다 (없는 회의는 ETag 없이 404)
+    """
+    CREATE OR REPLACE FUNCTION bump_meeting_detail_cache_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            DELETE FROM cache_versions WHERE name LIKE 'meetings/%' AND name <> 'meetings/list';
+        ELSIF TG_OP = 'DELETE' THEN
+            DELETE FROM cache_versions WHERE name = 'meetings/' || OLD.id;
+        ELSIF TG_TABLE_NAME = 'meetings' THEN
+            INSERT INTO cache_versions (name, version) VALUES ('meetings/' || NEW.id, nextval('cache_version_seq'))
+            ON CONFLICT (name) DO UPDATE SET version = EXCLUDED.version;
+        ELSE
+            -- 전사는 회의 행보다 나중에 쓰이므로 이미 있는 키만 올린다
+            UPDATE cache_versions SET version = nextval('cache_version_seq') WHERE name = 'meetings/' || NEW.meeting_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "CREATE OR REPLACE TRIGGER meetings_detail_cache_version AFTER INSERT OR UPDATE OR DELETE ON meetings "
+    "FOR EACH ROW EXECUTE FUNCTION bump_meeting_detail_cache_version()",
+    "CREATE OR REPLACE TRIGGER meetings_truncate_cache_version AFTER TRUNCATE ON meetings "
+    "FOR EACH STATEMENT EXECUTE FUNCTION bump_meeting_detail_cache_version()",
+    "CREATE OR REPLACE TRIGGER meeting_transcripts_detail_cache_version AFTER INSERT OR UPDATE ON meeting_transcripts "
+    "FOR EACH ROW EXECUTE FUNCTION bump_meeting_detail_cache_version()",
+    # 트리거가 생기기 전부터 있던 회의의 키 (처음 한 번만)
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM cache_versions WHERE name = 'meetings/list') THEN
+            INSERT INTO cache_versions (name, version)
+            SELECT 'meetings/' || id, nextval('cache_version_seq') FROM meetings
+            ON CONFLICT (name) DO NOTHING;
+            INSERT INTO cache_versions (name, version) VALUES ('meetings/list', nextval('cache_version_seq'))
+            ON CONFLICT (name) DO NOTHING;
+        END IF;
+    END
+    $$
+    """,
+]
+
+# 확장 기능이 없거나 권한이 없으면 건너뛰는 변경 (해당 기능만 비활성). 하나가 실패하면 뒤의 문장도 실행하지 않는다
+TRIGRAM_MIGRATIONS: list[str] = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_meeting_transcripts_trgm ON meeting_transcripts USING gin (content gin_trgm_ops)",
+]
+
+
+def _set_transcript_compression(engine: Engine) -> None:
+    """전사 압축 방식 지정 (이후 저장되는 값부터 적용). lz4 지원 없이 빌드된 서버면 기본 pglz 를 그대로 쓴다."""
+
+    method = settings.transcript_toast_compression
+    if method not in ("pglz", "lz4"):
+        logger.warning("unknown transcript_toast_compression %r, using server default", method)
+        return
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE meeting_transcripts ALTER COLUMN content SET COMPRESSION {method}"))
+    except DBAPIError as exc:
+        logger.warning("transcript compression %s unavailable, using server default: %s", method, exc.orig)
+
+
+def run_migrations(engine: Engine) -> None:
+    # 기존 전사를 옮기기 전에 압축 방식을 정해 둔다
+    _set_transcript_compression(engine)
+    with engine.begin() as conn:
+        for statement in MIGRATIONS:
+            conn.execute(text(statement))
+
+    if not settings.meeting_search_trigram_enabled:
+        return
+    for statement in TRIGRAM_MIGRATIONS:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(statement))
+        except DBAPIError as exc:
+            logger.warning("pg_trgm unavailable, substring search disabled: %s", exc.orig)
+            return
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import get_settings
+
+
+settings = get_settings()
+
+STAGE_DURATION = Histogram(
+    "meeting_stt_stage_duration_seconds",
+    "녹음 처리 단계별 소요 시간 (audio: 디코딩/리샘플링/VAD, stt, summary, db)",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+# 요청 하나의 단계별 소요 시간(초). ServerTimingMiddleware 가 요청마다 새 dict 를 넣는다
+_timings: ContextVar[dict[str, float] | None] = ContextVar("meeting_stt_timings", default=None)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """블록 실행 시간을 stage 이름으로 기록한다 (메트릭 + 현재 요청의 Server-Timing).
+
+    같은 stage 가 요청 안에서 여러 번 실행되면 합산한다.
+    """
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_DURATION.labels(stage=stage).observe(elapsed)
+        timings = _timings.get()
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + elapsed
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items())
+
+
+class ServerTimingMiddleware:
+    """timed() 로 기록한 단계별 시간을 응답의 Server-Timing 헤더로 내보낸다.
+
+    예: ``Server-Timing: audio;dur=412.3, stt;dur=5210.8, summary;dur=1830.2, db;dur=4.1``
+    (응답 헤더를 보내기 전에 끝난 단계만 포함되므로 SSE 등 스트리밍 응답에는 의미가 없다)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: dict[str, float] = {}
+        token = _timings.set(timings)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and timings:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(timings).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _timings.reset(token)
@@ -8,13 +8,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from app.config.db import init_db
+from app.config.db import close_db, init_db
+from app.config.http import close_http_clients, init_http_clients
 from app.config.logging import setup_logging
 from app.config.settings import get_settings
-from app.routers import meetings, root, admin_stt
+from app.config.timing import ServerTimingMiddleware
+from app.routers import meetings, root, admin_stt, admin_summary
+from app.service.job_service import start_job_workers, stop_job_workers
+from app.service.summary_refresh_service import stop_summary_refresh
+from app.service.summary_service import reset_llm
+from app.service.upload_service import configure_upload_spooling
 
 
 setup_logging()
+configure_upload_spooling()
 
 logger = logging.getLogger("meeting-stt")
 settings = get_settings()
@@ -35,6 +42,10 @@ app.add_middleware(
 )
 
 
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
+
+
 if settings.enable_metrics:
     Instrumentator(
         excluded_handlers=["/metrics"],
@@ -47,8 +58,19 @@ app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     init_db()
+    await init_http_clients()
+    start_job_workers()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await stop_job_workers()
+    await stop_summary_refresh()
+    reset_llm()
+    await close_http_clients()
+    await close_db()
 
 
 @app.exception_handler(HTTPException)
@@ -61,3 +83,4 @@ async def http_exception_logger(request: Request, exc: HTTPException):
 app.include_router(root.router)
 app.include_router(meetings.router)
 app.include_router(admin_stt.router)
+app.include_router(admin_summary.router)
@@ -1 +1,14 @@
-from app.models.models import Meeting, SttUsage  # noqa: F401
+from app.models.models import (  # noqa: F401
+    AudioObject,
+    CacheVersion,
+    Meeting,
+    MeetingJob,
+    MeetingSegment,
+    MeetingTranscript,
+    SttQuotaReservation,
+    SttUsage,
+    SttUsageMonthly,
+    SummaryCacheEntry,
+    SummaryRefreshRun,
+    TranscriptCacheEntry,
+)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -13,14 +14,112 @@ class MeetingRecordResponse(BaseModel):
 class MeetingListItem(BaseModel):
     id: UUID
     title: str | None
+    # 앞부분 meeting_list_summary_preview_chars 자만 (전체 요약은 GET /meetings/{id})
     summary: str | None
     created_at: datetime
 
 
+class MeetingListPage(BaseModel):
+    items: list[MeetingListItem]
+    # 다음 페이지 조회용 cursor (GET /meetings?cursor=...). 마지막 페이지면 None
+    next_cursor: str | None = None
+
+
+class MeetingSearchHit(BaseModel):
+    id: UUID
+    title: str | None
+    created_at: datetime
+    # 일치한 부분 주변 본문. HTML escape 후 일치 부분만 <mark> 로 감싼다
+    snippet: str
+    # 어절 검색의 관련도 (ts_rank_cd). 부분 문자열 검색 결과는 None
+    rank: float | None = None
+
+
+class MeetingSearchPage(BaseModel):
+    items: list[MeetingSearchHit]
+    next_cursor: str | None = None
+
+
 class MeetingDetailResponse(BaseModel):
     id: UUID
     title: str | None
     full_transcript: str | None
     summary: str | None
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+    # 녹음 재생 URL (GET /meetings/{id}/audio). 녹음이 저장되지 않은 회의는 None
+    audio_url: str | None = None
+
+
+class MeetingSegmentItem(BaseModel):
+    # 녹음 기준 시각(초). 실시간 녹음은 스트림 시작 기준
+    start: float
+    end: float
+    text: str
+    backend: str | None = None
+
+
+class MeetingSegmentPage(BaseModel):
+    items: list[MeetingSegmentItem]
+    # 같은 시간 구간의 다음 페이지 조회용 cursor. 마지막 페이지면 None
+    next_cursor: str | None = None
+
+
+class MeetingExportRow(BaseModel):
+    """GET /meetings/export 의 NDJSON 한 줄. fields 로 고르지 않은 컬럼은 빠진다 (id, created_at 은 항상 포함)."""
+
+    id: UUID
+    created_at: datetime
+    title: str | None = None
+    started_at: datetime | None = None
+    ended_at: datetime | None = None
+    summary: str | None = None
+    full_transcript: str | None = None
+    updated_at: datetime | None = None
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    TRANSCRIBING = "transcribing"
+    SUMMARIZING = "summarizing"
+    SAVING = "saving"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class MeetingJobResponse(BaseModel):
+    id: UUID
+    status: JobStatus
+    meeting_id: UUID | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class SummaryRefreshStatus(str, Enum):
+    RUNNING = "running"
+    # 프로세스 종료/취소로 멈춤. checkpoint 부터 다시 이어서 실행할 수 있다
+    INTERRUPTED = "interrupted"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SummaryRefreshRunResponse(BaseModel):
+    id: UUID
+    status: SummaryRefreshStatus
+    deployment: str | None = None
+    prompt_hash: str
+    batch_size: int
+    concurrency: int
+    total: int
+    processed: int
+    failed: int
+    last_meeting_id: UUID | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
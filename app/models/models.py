@@ -1,15 +1,32 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import DateTime, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import BigInteger, Computed, Date, DateTime, ForeignKey, Index, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config.db import Base
 
 
+# 회의 검색(GET /meetings/search)용 tsvector. 한국어 형태소 사전이 없으므로 'simple'(공백/문장부호 분리 + 소문자)로
+# 어절 단위로 색인하고, 검색어를 접두어로 매칭(회의:* → 회의에서, 회의록)해 조사/어미가 붙은 어절도 찾는다
+# 제목(A)/요약(B)은 meetings, 전사(C)는 meeting_transcripts 에 따로 색인한다
+MEETING_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'B')"
+)
+TRANSCRIPT_SEARCH_VECTOR = "setweight(to_tsvector('simple', content), 'C')"
+
+
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        # GET /meetings 의 keyset 페이지네이션 (ORDER BY created_at DESC, id DESC) 용
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+        Index("ix_meetings_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    # INSERT/UPDATE 때마다 생성 컬럼(search_vector)을 RETURNING 으로 받아오지 않도록
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -23,8 +40,17 @@ class Meeting(Base):
         DateTime(timezone=True), nullable=True
     )
 
-    full_transcript: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 녹음 원본 (audio_objects.sha256). 오디오 없이 만든 회의(실시간 녹음 등)는 None
+    audio_sha256: Mapped[str | None] = mapped_column(
+        Text, ForeignKey("audio_objects.sha256", ondelete="RESTRICT"), nullable=True, index=True
+    )
+
+    # 전사 전문은 meeting_transcripts 에 따로 저장 (목록/삭제/조회가 읽는 행을 작게 유지)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # title/summary 가 바뀌면 DB 가 다시 계산. 조회 때는 읽지 않는다
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(MEETING_SEARCH_VECTOR, persisted=True), deferred=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
@@ -34,6 +60,93 @@ class Meeting(Base):
     )
 
 
+class AudioObject(Base):
+    """내용의 SHA-256 으로 저장한 녹음 파일 (app/service/audio_store_service.py). 같은 오디오는 여러 회의가 함께 참조한다.
+
+    참조하는 회의가 남아 있으면 FK(RESTRICT) 때문에 지울 수 없다.
+    """
+
+    __tablename__ = "audio_objects"
+
+    sha256: Mapped[str] = mapped_column(Text, primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_type: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class MeetingTranscript(Base):
+    """회의 전사 전문. 상세 조회/요약/검색에서만 읽는다.
+
+    content 는 TOAST 로 압축 저장된다 (toast_tuple_target 과 lz4 압축은 app/config/migrations.py 에서 설정).
+    실시간 녹음이 끝나기 전의 회의에는 행이 없다.
+    """
+
+    __tablename__ = "meeting_transcripts"
+    __table_args__ = (
+        Index("ix_meeting_transcripts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    __mapper_args__ = {"eager_defaults": False}
+
+    meeting_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True
+    )
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(TRANSCRIPT_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
+
+class MeetingSegment(Base):
+    """전사 세그먼트(발화 구간) 단위 행. 녹음의 특정 시각 주변만 필요할 때 전문을 읽지 않고 조회한다.
+
+    start_seconds/duration_seconds 는 원본 녹음(실시간 녹음은 스트림 시작) 기준 초이다.
+    """
+
+    __tablename__ = "meeting_segments"
+    __table_args__ = (
+        # GET /meetings/{id}/segments 의 시간 구간 조회 + keyset 페이지네이션 (ORDER BY start_seconds, id)
+        Index("ix_meeting_segments_meeting_id_start", "meeting_id", "start_seconds", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    meeting_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False
+    )
+    start_seconds: Mapped[float] = mapped_column(nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    # 이 구간을 전사한 STT 백엔드 (SttBackend 값)
+    backend: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class MeetingJob(Base):
+    """비동기 녹음 처리 작업 (/meetings/record/async). 재시작 시 이 테이블에서 미완료 작업을 복구한다."""
+
+    __tablename__ = "meeting_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    status: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    audio_path: Mapped[str] = mapped_column(Text, nullable=False)
+    duration_seconds: Mapped[float | None] = mapped_column(nullable=True)
+    meeting_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    # 처리 중인 워커가 주기적으로 갱신. 오래 갱신되지 않으면 워커가 죽은 것으로 보고 다른 워커가 가져간다
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
 class SttUsage(Base):
     __tablename__ = "stt_usage"
 
@@ -43,3 +156,116 @@ class SttUsage(Base):
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+
+class SttUsageMonthly(Base):
+    """provider 별 월 사용량 rollup. stt_usage 를 매번 SUM 하지 않도록 원자적으로 갱신한다.
+
+    reserved_seconds 는 진행 중인 요청이 잡아 둔(아직 확정되지 않은) 사용량이다.
+    """
+
+    __tablename__ = "stt_usage_monthly"
+
+    provider: Mapped[str] = mapped_column(Text, primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    used_seconds: Mapped[float] = mapped_column(nullable=False, default=0.0)
+    reserved_seconds: Mapped[float] = mapped_column(nullable=False, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class SttQuotaReservation(Base):
+    """진행 중인 STT 요청이 잡아 둔 쿼터. 워커가 죽어 확정/해제되지 못하면 expires_at 이후 회수된다."""
+
+    __tablename__ = "stt_quota_reservations"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    provider: Mapped[str] = mapped_column(Text, nullable=False)
+    month: Mapped[date] = mapped_column(Date, nullable=False)
+    seconds: Mapped[float] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+
+class TranscriptCacheEntry(Base):
+    """정규화된 PCM 해시 + 백엔드 + 언어로 키를 잡은 STT 결과 캐시 (영속 계층)."""
+
+    __tablename__ = "transcript_cache"
+
+    cache_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    backend: Mapped[str] = mapped_column(Text, nullable=False)
+    language: Mapped[str] = mapped_column(Text, nullable=False)
+    transcript: Mapped[str] = mapped_column(Text, nullable=False)
+    # 세그먼트별 [{"start", "duration", "text", "backend"}] (보낸 오디오 기준 초). 이 컬럼이 생기기 전 항목은 None
+    segments: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
+    audio_seconds: Mapped[float] = mapped_column(nullable=False)
+    hit_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+    last_hit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class SummaryCacheEntry(Base):
+    """정규화 transcript + system prompt + deployment + temperature 로 키를 잡은 요약 결과 캐시 (영속 계층)."""
+
+    __tablename__ = "summary_cache"
+
+    cache_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    deployment: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    # 이 요약을 만드는 데 쓴 토큰 수 (map-reduce 면 모든 호출 합계). 적중 시 절약한 토큰으로 집계
+    total_tokens: Mapped[int] = mapped_column(nullable=False, default=0)
+    hit_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+    last_hit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class SummaryRefreshRun(Base):
+    """기존 회의 일괄 재요약 실행. 배치마다 마지막으로 처리한 회의(created_at, id)를 checkpoint 로 남긴다."""
+
+    __tablename__ = "summary_refresh_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    status: Mapped[str] = mapped_column(Text, nullable=False)
+    deployment: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 실행 시작 시점 system prompt 의 SHA-256 (어떤 프롬프트로 재요약했는지 기록용)
+    prompt_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    batch_size: Mapped[int] = mapped_column(nullable=False)
+    concurrency: Mapped[int] = mapped_column(nullable=False)
+    # 실행 시작 전에 만들어진 회의만 대상으로 한다
+    cutoff: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    total: Mapped[int] = mapped_column(nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(nullable=False, default=0)
+    last_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_meeting_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 실행 중인 워커/CLI 가 주기적으로 갱신. 끊긴 RUNNING 실행만 다른 프로세스가 이어서 실행할 수 있다
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class CacheVersion(Base):
+    """워커 간 공유 캐시 무효화용 버전. 대상 테이블에 쓰기가 있으면 DB 트리거가 version 을 올린다 (app/config/migrations.py)."""
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(Text, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meeting import JobStatus
+from app.models.models import MeetingJob
+
+
+# 워커가 처리 중인 상태 (heartbeat 가 끊기면 다시 가져갈 수 있음)
+ACTIVE_STATUSES = (JobStatus.TRANSCRIBING, JobStatus.SUMMARIZING, JobStatus.SAVING)
+
+
+async def create_job(
+    db: AsyncSession,
+    *,
+    job_id: UUID,
+    audio_path: str,
+    duration_seconds: float | None,
+) -> MeetingJob:
+    """대기 상태의 작업을 생성하고 커밋한 뒤 반환한다."""
+
+    job = MeetingJob(
+        id=job_id,
+        status=JobStatus.QUEUED.value,
+        audio_path=audio_path,
+        duration_seconds=duration_seconds,
+        attempts=0,
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def get_job(db: AsyncSession, *, job_id: UUID) -> Optional[MeetingJob]:
+    """ID로 작업을 조회한다. 없으면 None 반환."""
+
+    return await db.get(MeetingJob, job_id, populate_existing=True)
+
+
+async def count_queued_jobs(db: AsyncSession) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(MeetingJob).where(MeetingJob.status == JobStatus.QUEUED.value)
+    )
+    return result.scalar_one()
+
+
+async def claim_next_job(db: AsyncSession, *, stale_before: datetime) -> Optional[MeetingJob]:
+    """가장 오래된 대기 작업(또는 heartbeat 가 끊긴 처리 중 작업)을 하나 가져와 처리 중으로 표시한다.
+
+    FOR UPDATE SKIP LOCKED 로 잠그므로 여러 워커/프로세스가 동시에 호출해도 같은 작업을 가져가지 않는다.
+    """
+
+    stmt = (
+        select(MeetingJob)
+        .where(
+            or_(
+                MeetingJob.status == JobStatus.QUEUED.value,
+                (MeetingJob.status.in_([s.value for s in ACTIVE_STATUSES]))
+                & (MeetingJob.heartbeat_at < stale_before),
+            )
+        )
+        .order_by(MeetingJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = (await db.execute(stmt)).scalar_one_or_none()
+    if job is None:
+        await db.commit()
+        return None
+
+    job.status = JobStatus.TRANSCRIBING.value
+    job.attempts += 1
+    job.heartbeat_at = datetime.now(timezone.utc)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def update_job_status(
+    db: AsyncSession,
+    *,
+    job_id: UUID,
+    status: JobStatus,
+    meeting_id: UUID | None = None,
+    error: str | None = None,
+) -> None:
+    """작업 상태를 바꾸고 커밋한다. 완료/실패 상태면 finished_at 도 기록."""
+
+    now = datetime.now(timezone.utc)
+    values: dict = {"status": status.value, "heartbeat_at": now}
+    if meeting_id is not None:
+        values["meeting_id"] = meeting_id
+    if error is not None:
+        values["error"] = error
+    if status.is_terminal:
+        values["finished_at"] = now
+    await db.execute(update(MeetingJob).where(MeetingJob.id == job_id).values(**values))
+    await db.commit()
+
+
+async def touch_job(db: AsyncSession, *, job_id: UUID) -> None:
+    """처리 중인 작업의 heartbeat 만 갱신한다."""
+
+    await db.execute(
+        update(MeetingJob)
+        .where(MeetingJob.id == job_id)
+        .values(heartbeat_at=datetime.now(timezone.utc))
+    )
+    await db.commit()
@@ -1,72 +1,410 @@
 from __future__ import annotations
 
+from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Double, Row, and_, cast, delete, exists, func, select, text, tuple_, union
+from sqlalchemy.dialects.postgresql import TSVECTOR, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.models import Meeting
+from app.models.models import AudioObject, Meeting, MeetingSegment, MeetingTranscript
 
 
-def create_meeting(
-    db: Session,
+async def create_meeting(
+    db: AsyncSession,
     *,
     full_transcript: str,
     summary: str,
+    audio_sha256: str | None = None,
+    segments: Sequence[dict] = (),
+    meeting_id: UUID | None = None,
 ) -> Meeting:
-    """회의 레코드를 생성하고 커밋한 뒤, 생성된 Meeting 객체를 반환한다."""
+    """회의 레코드와 전사(전문 + 세그먼트)를 한 트랜잭션으로 생성하고 커밋한 뒤, 생성된 Meeting 객체를 반환한다.
+
+    segments 는 MeetingSegment 컬럼(start_seconds, duration_seconds, text, backend) dict 목록이다.
+    meeting_id 를 주면 그 ID 로 만든다 (비동기 작업이 미리 정해 둔 ID).
+    """
 
     meeting = Meeting(
+        id=meeting_id or uuid4(),
         title=None,
         started_at=None,
         ended_at=None,
-        full_transcript=full_transcript,
         summary=summary,
+        audio_sha256=audio_sha256,
     )
+    db.add_all([meeting, MeetingTranscript(meeting_id=meeting.id, content=full_transcript)])
+    await _insert_segments(db, meeting_id=meeting.id, segments=segments)
+    await db.commit()
+    await db.refresh(meeting)
+    return meeting
+
+
+async def start_meeting(db: AsyncSession, *, started_at: datetime) -> Meeting:
+    """실시간 스트리밍 녹음용으로 내용이 비어 있는 회의 레코드를 먼저 만든다."""
+
+    meeting = Meeting(title=None, started_at=started_at)
     db.add(meeting)
-    db.commit()
-    db.refresh(meeting)
+    await db.commit()
+    await db.refresh(meeting)
     return meeting
 
 
-def list_meetings(
-    db: Session,
+async def finish_meeting(
+    db: AsyncSession,
+    *,
+    meeting_id: UUID,
+    ended_at: datetime,
+    full_transcript: str,
+    summary: str | None,
+    segments: Sequence[dict] = (),
+) -> Optional[Meeting]:
+    """스트리밍이 끝난 회의에 전사/요약 결과와 종료 시각을 기록한다. 회의가 없으면 None 반환."""
+
+    meeting = await get_meeting(db, meeting_id=meeting_id)
+    if meeting is None:
+        return None
+
+    meeting.ended_at = ended_at
+    meeting.summary = summary
+    await db.execute(
+        insert(MeetingTranscript)
+        .values(meeting_id=meeting_id, content=full_transcript)
+        .on_conflict_do_update(index_elements=[MeetingTranscript.meeting_id], set_={"content": full_transcript})
+    )
+    await _insert_segments(db, meeting_id=meeting_id, segments=segments)
+    await db.commit()
+    await db.refresh(meeting)
+    return meeting
+
+
+async def _insert_segments(db: AsyncSession, *, meeting_id: UUID, segments: Sequence[dict]) -> None:
+    if not segments:
+        return
+    # 세그먼트 행이 회의 행을 참조하므로 회의를 먼저 INSERT 한다
+    await db.flush()
+    await db.execute(insert(MeetingSegment), [{"meeting_id": meeting_id, **segment} for segment in segments])
+
+
+async def update_meeting_summary(
+    db: AsyncSession,
+    *,
+    meeting_id: UUID,
+    summary: str,
+) -> Optional[Meeting]:
+    """회의 요약만 갱신한다. 회의가 없으면 None 반환."""
+
+    meeting = await get_meeting(db, meeting_id=meeting_id)
+    if meeting is None:
+        return None
+
+    meeting.summary = summary
+    await db.commit()
+    await db.refresh(meeting)
+    return meeting
+
+
+async def list_meetings(
+    db: AsyncSession,
+    *,
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = 20,
+    preview_chars: int = 200,
+) -> List[Row]:
+    """최근 생성된 순((created_at, id) 내림차순)으로 회의 목록을 조회한다.
+
+    OFFSET 대신 이전 페이지 마지막 행의 (created_at, id) 보다 작은 행부터 읽으므로(keyset),
+    ix_meetings_created_at_id 인덱스를 따라 몇 번째 페이지든 limit 개만 읽는다.
+    전사 전문은 읽지 않고 id/title/created_at 과 요약 앞부분(summary)만 가져온다.
+    """
+
+    stmt = (
+        select(
+            Meeting.id,
+            Meeting.title,
+            Meeting.created_at,
+            func.left(Meeting.summary, preview_chars).label("summary"),
+        )
+        .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Meeting.created_at, Meeting.id) < tuple_(*after))
+
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+# GET /meetings/export 에서 고를 수 있는 컬럼 (id, created_at 은 항상 포함)
+EXPORT_COLUMNS = {
+    "title": Meeting.title,
+    "started_at": Meeting.started_at,
+    "ended_at": Meeting.ended_at,
+    "summary": Meeting.summary,
+    "full_transcript": MeetingTranscript.content.label("full_transcript"),
+    "updated_at": Meeting.updated_at,
+}
+
+
+async def stream_meetings(
+    db: AsyncSession,
+    *,
+    fields: Sequence[str],
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    batch_size: int = 200,
+) -> AsyncIterator[Sequence[Row]]:
+    """created_at 이 [created_from, created_to) 인 회의를 오래된 순으로 batch_size 개씩 돌려준다.
+
+    서버 측 cursor(yield_per)로 읽으므로 전체 건수와 관계없이 한 번에 batch_size 행만 메모리에 올라온다.
+    전사는 fields 에 full_transcript 가 있을 때만 join 한다.
+    """
+
+    stmt = select(Meeting.id, Meeting.created_at, *(EXPORT_COLUMNS[field] for field in fields)).order_by(
+        Meeting.created_at, Meeting.id
+    )
+    if "full_transcript" in fields:
+        stmt = stmt.outerjoin(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+    if created_from is not None:
+        stmt = stmt.where(Meeting.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(Meeting.created_at < created_to)
+
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def search_meetings_fulltext(
+    db: AsyncSession,
     *,
-    skip: int = 0,
+    terms: list[str],
+    after: tuple[float, datetime, UUID] | None = None,
     limit: int = 20,
-) -> List[Meeting]:
-    """최근 생성된 순으로 회의 목록을 조회한다."""
+    rank_window: int = 1000,
+    headline_options: str,
+) -> List[Row]:
+    """모든 검색어(접두어 일치)가 제목/요약(meetings.search_vector)과 전사(meeting_transcripts.search_vector)
+    어딘가에 나오는 회의 중 최근 rank_window 개를 (rank, created_at, id) 내림차순으로 조회한다.
+
+    순위(ts_rank_cd)는 행마다 tsvector 전체를 읽어야 하므로, 흔한 단어로 수만 건이 일치해도 비용이 일정하도록
+    최근 rank_window 개 안에서만 매긴다. 본문(ts_headline 스니펫)은 페이지에 들어가는 행만 읽는다.
+    """
+
+    query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    vector = Meeting.search_vector.op("||")(func.coalesce(MeetingTranscript.search_vector, cast("", TSVECTOR)))
 
-    return (
-        db.query(Meeting)
-        .order_by(Meeting.created_at.desc())
-        .offset(skip)
+    # 두 테이블의 GIN 인덱스를 각각 쓰도록 일치 회의를 따로 최근 rank_window 개까지 모은 뒤 합친다
+    branches = [
+        select(Meeting.id, Meeting.created_at).where(Meeting.search_vector.bool_op("@@")(query)),
+        select(Meeting.id, Meeting.created_at)
+        .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+        .where(MeetingTranscript.search_vector.bool_op("@@")(query)),
+    ]
+    if len(terms) > 1:
+        # 검색어가 제목/요약과 전사에 나뉘어 나오는 회의 (양쪽에 하나 이상씩 있고, 합치면 모두 있음)
+        any_term = func.to_tsquery("simple", " | ".join(f"{term}:*" for term in terms))
+        branches.append(
+            select(Meeting.id, Meeting.created_at)
+            .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+            .where(
+                Meeting.search_vector.bool_op("@@")(any_term),
+                MeetingTranscript.search_vector.bool_op("@@")(any_term),
+                vector.bool_op("@@")(query),
+            )
+        )
+    hits = union(
+        *(branch.order_by(Meeting.created_at.desc(), Meeting.id.desc()).limit(rank_window) for branch in branches)
+    ).subquery()
+    candidates = (
+        select(hits.c.id, hits.c.created_at)
+        .order_by(hits.c.created_at.desc(), hits.c.id.desc())
+        .limit(rank_window)
+        .subquery()
+    )
+
+    # ts_rank_cd 는 real(float4). cursor 로 돌아오는 값은 float8 이므로 같은 타입으로 비교해야 동점 rank 가 어긋나지 않는다
+    rank = cast(func.ts_rank_cd(vector, query), Double)
+    page = (
+        select(candidates.c.id, candidates.c.created_at, rank.label("rank"))
+        .join(Meeting, Meeting.id == candidates.c.id)
+        .outerjoin(MeetingTranscript, MeetingTranscript.meeting_id == candidates.c.id)
+        .order_by(rank.desc(), candidates.c.created_at.desc(), candidates.c.id.desc())
         .limit(limit)
-        .all()
     )
+    if after is not None:
+        page = page.where(tuple_(rank, candidates.c.created_at, candidates.c.id) < tuple_(*after))
+    page = page.subquery()
+
+    document = func.concat_ws(" ", Meeting.title, Meeting.summary, MeetingTranscript.content)
+    result = await db.execute(
+        select(
+            page.c.id,
+            Meeting.title,
+            page.c.created_at,
+            page.c.rank,
+            func.ts_headline("simple", document, query, headline_options).label("snippet"),
+        )
+        .join(Meeting, Meeting.id == page.c.id)
+        .outerjoin(MeetingTranscript, MeetingTranscript.meeting_id == page.c.id)
+        .order_by(page.c.rank.desc(), page.c.created_at.desc(), page.c.id.desc())
+    )
+    return list(result.all())
 
 
-def get_meeting(
-    db: Session,
+async def search_meetings_substring(
+    db: AsyncSession,
+    *,
+    terms: list[str],
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = 20,
+    snippet_chars: int = 160,
+) -> List[Row]:
+    """전사에 모든 검색어를 부분 문자열로 포함하는 회의를 최근 순으로 조회한다 (ix_meeting_transcripts_trgm, pg_trgm 필요).
+
+    snippet 은 첫 번째 검색어 주변 snippet_chars 자.
+    """
+
+    document = MeetingTranscript.content
+    patterns = ["%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for term in terms]
+    position = func.strpos(func.lower(document), terms[0].lower())
+    stmt = (
+        select(
+            Meeting.id,
+            Meeting.title,
+            Meeting.created_at,
+            func.substr(document, func.greatest(position - snippet_chars // 3, 1), snippet_chars).label("snippet"),
+        )
+        .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+        .where(and_(*(document.ilike(pattern) for pattern in patterns)))
+        .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Meeting.created_at, Meeting.id) < tuple_(*after))
+
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+async def has_index(db: AsyncSession, name: str) -> bool:
+    result = await db.execute(text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": name})
+    return result.first() is not None
+
+
+async def get_meeting(
+    db: AsyncSession,
     *,
     meeting_id: UUID,
 ) -> Optional[Meeting]:
     """ID로 단일 회의를 조회한다. 없으면 None 반환."""
 
-    return db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    return await db.get(Meeting, meeting_id)
 
 
-def delete_meeting(
-    db: Session,
+async def list_meeting_segments(
+    db: AsyncSession,
     *,
     meeting_id: UUID,
-) -> bool:
-    """ID로 회의를 삭제하고, 삭제 여부를 bool로 반환한다."""
+    start_seconds: float | None = None,
+    end_seconds: float | None = None,
+    after: tuple[float, int] | None = None,
+    limit: int = 50,
+) -> list[MeetingSegment]:
+    """[start_seconds, end_seconds) 와 겹치는 세그먼트를 시각 순((start_seconds, id) 오름차순)으로 limit 개 조회한다.
 
-    meeting = get_meeting(db, meeting_id=meeting_id)
-    if meeting is None:
-        return False
+    한 회의의 세그먼트는 서로 겹치지 않으므로, start_seconds 이전에 시작한 마지막 세그먼트를
+    ix_meeting_segments_meeting_id_start 에서 한 번 찾아 그 위치부터 읽는다 (녹음 길이와 무관하게 필요한 행만 읽음).
+    after 는 이전 페이지 마지막 행의 (start_seconds, id) 이다 (keyset).
+    """
+
+    stmt = (
+        select(MeetingSegment)
+        .where(MeetingSegment.meeting_id == meeting_id)
+        .order_by(MeetingSegment.start_seconds, MeetingSegment.id)
+        .limit(limit)
+    )
+    if start_seconds is not None:
+        first_start = (
+            select(func.max(MeetingSegment.start_seconds))
+            .where(MeetingSegment.meeting_id == meeting_id, MeetingSegment.start_seconds <= start_seconds)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(
+            MeetingSegment.start_seconds >= func.coalesce(first_start, start_seconds),
+            MeetingSegment.start_seconds + MeetingSegment.duration_seconds > start_seconds,
+        )
+    if end_seconds is not None:
+        stmt = stmt.where(MeetingSegment.start_seconds < end_seconds)
+    if after is not None:
+        stmt = stmt.where(tuple_(MeetingSegment.start_seconds, MeetingSegment.id) > tuple_(*after))
 
-    db.delete(meeting)
-    db.commit()
-    return True
\ No newline at end of file
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def get_meeting_transcript(
+    db: AsyncSession,
+    *,
+    meeting_id: UUID,
+) -> Optional[str]:
+    """회의 전사 전문을 조회한다. 아직 전사가 없으면(실시간 녹음 중) None 반환."""
+
+    result = await db.execute(
+        select(MeetingTranscript.content).where(MeetingTranscript.meeting_id == meeting_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def delete_meeting(
+    db: AsyncSession,
+    *,
+    meeting_id: UUID,
+) -> tuple[bool, str | None]:
+    """ID로 회의를 삭제하고(전사는 FK ON DELETE CASCADE), (삭제 여부, 참조하던 오디오 해시)를 반환한다."""
+
+    result = await db.execute(delete(Meeting).where(Meeting.id == meeting_id).returning(Meeting.audio_sha256))
+    row = result.first()
+    await db.commit()
+    return row is not None, row.audio_sha256 if row is not None else None
+
+
+async def lock_audio_object(
+    db: AsyncSession,
+    *,
+    sha256: str,
+    size_bytes: int,
+    content_type: str,
+) -> None:
+    """오디오 행을 만들거나(이미 있으면 그대로) 잠근다. 커밋하지 않는다.
+
+    DO UPDATE 로 행 잠금을 잡으므로, 커밋 전까지 delete_unreferenced_audio_object 가 같은 행을 지우지 못한다
+    (이미 지우는 중이면 그 트랜잭션이 끝날 때까지 기다린 뒤 새로 만든다).
+    """
+
+    stmt = insert(AudioObject).values(sha256=sha256, size_bytes=size_bytes, content_type=content_type)
+    await db.execute(
+        stmt.on_conflict_do_update(index_elements=[AudioObject.sha256], set_={"size_bytes": stmt.excluded.size_bytes})
+    )
+
+
+async def delete_unreferenced_audio_object(db: AsyncSession, *, sha256: str) -> bool:
+    """참조하는 회의가 없는 오디오 행을 지운다. 커밋하지 않는다 (호출한 쪽이 파일을 지운 뒤 커밋).
+
+    그 사이 다른 요청이 같은 오디오로 회의를 만들었으면 FK 때문에 지워지지 않고 False.
+    """
+
+    try:
+        async with db.begin_nested():
+            result = await db.execute(
+                delete(AudioObject).where(
+                    AudioObject.sha256 == sha256,
+                    ~exists().where(Meeting.audio_sha256 == sha256),
+                )
+            )
+    except IntegrityError:
+        return False
+    return result.rowcount > 0
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Row, func, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.models.meeting import SummaryRefreshStatus
+from app.models.models import Meeting, MeetingTranscript, SummaryRefreshRun
+
+
+def create_run(
+    db: Session,
+    *,
+    deployment: str | None,
+    prompt_hash: str,
+    batch_size: int,
+    concurrency: int,
+) -> SummaryRefreshRun:
+    """지금까지 만들어진(전사가 끝난) 회의 전체를 대상으로 하는 실행을 만들고 커밋한다."""
+
+    cutoff = datetime.now(timezone.utc)
+    total = db.execute(
+        select(func.count())
+        .select_from(Meeting)
+        .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+        .where(Meeting.created_at <= cutoff)
+    ).scalar_one()
+
+    run = SummaryRefreshRun(
+        status=SummaryRefreshStatus.RUNNING.value,
+        deployment=deployment,
+        prompt_hash=prompt_hash,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        cutoff=cutoff,
+        total=total,
+        processed=0,
+        failed=0,
+        heartbeat_at=cutoff,
+    )
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    return run
+
+
+def get_run(db: Session, *, run_id: UUID) -> Optional[SummaryRefreshRun]:
+    return db.get(SummaryRefreshRun, run_id, populate_existing=True)
+
+
+def list_runs(db: Session, *, limit: int = 20) -> list[SummaryRefreshRun]:
+    return list(
+        db.execute(
+            select(SummaryRefreshRun).order_by(SummaryRefreshRun.created_at.desc()).limit(limit)
+        ).scalars()
+    )
+
+
+def iter_meeting_batches(
+    db: Session,
+    run: SummaryRefreshRun,
+) -> Iterator[Sequence[Row]]:
+    """run 의 checkpoint 이후 회의를 (created_at, id) 순서로 batch_size 개씩 돌려준다.
+
+    server-side cursor(yield_per)로 읽으므로 회의가 수만 건이어도 한 번에 batch 하나만 메모리에 올라간다.
+    읽기 전용 세션을 따로 넘겨야 한다 (결과를 쓰는 세션이 커밋해도 커서가 닫히지 않도록).
+    """
+
+    stmt = (
+        select(Meeting.id, Meeting.created_at, MeetingTranscript.content.label("full_transcript"))
+        .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+        .where(Meeting.created_at <= run.cutoff)
+        .order_by(Meeting.created_at, Meeting.id)
+        .execution_options(yield_per=run.batch_size)
+    )
+    if run.last_meeting_id is not None:
+        stmt = stmt.where(
+            tuple_(Meeting.created_at, Meeting.id) > tuple_(run.last_created_at, run.last_meeting_id)
+        )
+
+    yield from db.execute(stmt).partitions()
+
+
+def save_batch(
+    db: Session,
+    run: SummaryRefreshRun,
+    *,
+    summaries: dict[UUID, str],
+    failed: int,
+    last_created_at: datetime,
+    last_meeting_id: UUID,
+    error: str | None = None,
+) -> None:
+    """배치 결과(요약 일괄 UPDATE)와 checkpoint 를 한 트랜잭션으로 커밋한다."""
+
+    if summaries:
+        db.execute(
+            update(Meeting),
+            [{"id": meeting_id, "summary": summary} for meeting_id, summary in summaries.items()],
+        )
+    run.processed += len(summaries) + failed
+    run.failed += failed
+    run.last_created_at = last_created_at
+    run.last_meeting_id = last_meeting_id
+    if error is not None:
+        run.error = error
+    db.commit()
+
+
+def claim_run(db: Session, *, run_id: UUID, stale_before: datetime) -> bool:
+    """끝나지 않은 실행을 RUNNING 으로 표시하고 heartbeat 를 갱신한다. 가져오지 못하면 False.
+
+    heartbeat 가 stale_before 이후인 RUNNING 실행은 다른 워커/프로세스가 처리 중이므로 가져오지 않는다.
+    UPDATE 한 문장으로 판정하므로 여러 프로세스가 동시에 resume 해도 하나만 성공한다.
+    """
+
+    result = db.execute(
+        update(SummaryRefreshRun)
+        .where(
+            SummaryRefreshRun.id == run_id,
+            SummaryRefreshRun.status != SummaryRefreshStatus.COMPLETED.value,
+            or_(
+                SummaryRefreshRun.status != SummaryRefreshStatus.RUNNING.value,
+                SummaryRefreshRun.heartbeat_at.is_(None),
+                SummaryRefreshRun.heartbeat_at < stale_before,
+            ),
+        )
+        .values(
+            status=SummaryRefreshStatus.RUNNING.value,
+            heartbeat_at=datetime.now(timezone.utc),
+            finished_at=None,
+        )
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def touch_run(db: Session, *, run_id: UUID) -> None:
+    """실행 중인 run 의 heartbeat 만 갱신한다."""
+
+    db.execute(
+        update(SummaryRefreshRun)
+        .where(SummaryRefreshRun.id == run_id)
+        .values(heartbeat_at=datetime.now(timezone.utc))
+    )
+    db.commit()
+
+
+def update_run_status(
+    db: Session,
+    run: SummaryRefreshRun,
+    status: SummaryRefreshStatus,
+    *,
+    error: str | None = None,
+) -> SummaryRefreshRun:
+    run.status = status.value
+    run.heartbeat_at = datetime.now(timezone.utc)
+    if error is not None:
+        run.error = error
+    run.finished_at = datetime.now(timezone.utc) if status is not SummaryRefreshStatus.RUNNING else None
+    db.commit()
+    db.refresh(run)
+    return run
@@ -8,7 +8,9 @@ from sqlalchemy.orm import Session
 from app.config.db import get_db
 from app.config.settings import get_settings
 from app.models.models import SttUsage
-from app.service.stt_service import get_azure_speech_usage_hours, SttBackend
+from app.service.quota_service import get_quota_usage
+from app.service.stt_routing_service import stt_router
+from app.service.stt_service import SttBackend, choose_backend
 
 
 router = APIRouter(prefix="/admin/stt", tags=["admin-stt"])
@@ -19,15 +21,18 @@ def get_stt_usage(db: Session = Depends(get_db)) -> dict:
     """현재 월 기준 Azure Speech STT 사용량/쿼터/잔여 시간 조회."""
 
     settings = get_settings()
-    used_hours = get_azure_speech_usage_hours(db)
+    # 월별 rollup 행 하나만 읽으며, 화면 polling 이 잦아도 짧게 캐시된 값을 사용
+    usage = get_quota_usage(db, SttBackend.AZURE_SPEECH.value)
     quota_hours = settings.stt_free_quota_hours_per_month
-    remaining = max(quota_hours - used_hours, 0.0)
+    remaining = max(quota_hours - usage.used_hours - usage.reserved_hours, 0.0)
 
     now_utc = datetime.now(timezone.utc)
 
     return {
         "provider": SttBackend.AZURE_SPEECH.value,
-        "used_hours_this_month": used_hours,
+        "used_hours_this_month": usage.used_hours,
+        # 진행 중인 전사 요청이 잡아 둔(아직 확정되지 않은) 사용량
+        "reserved_hours": usage.reserved_hours,
         "quota_hours_per_month": quota_hours,
         "remaining_hours": remaining,
         "now_utc": now_utc.isoformat(),
@@ -57,3 +62,13 @@ def get_stt_usage_history(limit: int = 50, db: Session = Depends(get_db)) -> lis
         )
 
     return results
+
+
+@router.get("/backends")
+def get_stt_backends() -> dict:
+    """STT 백엔드별 circuit 상태 / 최근 오류율 / 처리 속도(RTF) 조회 (워커 프로세스 단위)."""
+
+    return {
+        "preferred": choose_backend().value,
+        "backends": stt_router.snapshot(),
+    }
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app.config.db import get_db
+from app.models.meeting import SummaryRefreshRunResponse
+from app.service.summary_refresh_service import (
+    cancel_refresh,
+    get_run_response,
+    list_run_responses,
+    resume_refresh,
+    start_refresh,
+)
+
+
+router = APIRouter(prefix="/admin/summaries", tags=["admin-summaries"])
+
+
+@router.post("/refresh", response_model=SummaryRefreshRunResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_summary_refresh(
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+    db: Session = Depends(get_db),
+) -> SummaryRefreshRunResponse:
+    """전사가 있는 모든 회의를 현재 prompt 로 다시 요약하는 작업을 백그라운드에서 시작."""
+
+    return await start_refresh(db, batch_size=batch_size, concurrency=concurrency)
+
+
+@router.get("/refresh", response_model=list[SummaryRefreshRunResponse])
+def list_summary_refreshes(db: Session = Depends(get_db)) -> list[SummaryRefreshRunResponse]:
+    return list_run_responses(db)
+
+
+@router.get("/refresh/{run_id}", response_model=SummaryRefreshRunResponse)
+def get_summary_refresh(run_id: UUID, db: Session = Depends(get_db)) -> SummaryRefreshRunResponse:
+    return get_run_response(db, run_id=run_id)
+
+
+@router.post("/refresh/{run_id}/resume", response_model=SummaryRefreshRunResponse, status_code=status.HTTP_202_ACCEPTED)
+async def resume_summary_refresh(run_id: UUID, db: Session = Depends(get_db)) -> SummaryRefreshRunResponse:
+    """중단(interrupted)/실패한 실행을 마지막 checkpoint 다음 회의부터 이어서 실행.
+
+    다른 워커/프로세스에서 실행 중(heartbeat 가 summary_refresh_stale_seconds 안에 갱신됨)이면 409.
+    """
+
+    return await resume_refresh(db, run_id=run_id)
+
+
+@router.post("/refresh/{run_id}/cancel", response_model=SummaryRefreshRunResponse)
+async def cancel_summary_refresh(run_id: UUID, db: Session = Depends(get_db)) -> SummaryRefreshRunResponse:
+    return await cancel_refresh(db, run_id=run_id)
@@ -1,13 +1,31 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status, HTTPException
+from fastapi import APIRouter, Depends, File, Form, Header, Query, UploadFile, status, HTTPException, Response, WebSocket
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.db import get_async_db
 from app.models.meeting import (
     MeetingDetailResponse,
-    MeetingListItem,
+    MeetingJobResponse,
+    MeetingListPage,
+    MeetingSearchPage,
     MeetingRecordResponse,
+    MeetingSegmentPage,
 )
-from app.service.meeting_service import MeetingService, get_meeting_service_dep
+from app.service.audio_store_service import meeting_audio_response
+from app.service.job_service import get_job_response, job_events, submit_job
+from app.service.meeting_service import (
+    MeetingService,
+    export_meetings_ndjson,
+    get_meeting_service_dep,
+    get_summary_source,
+    parse_export_fields,
+    stream_meeting_summary,
+)
+from app.service.realtime_service import run_realtime_session
+from app.service.upload_service import open_upload
 
 
 router = APIRouter(prefix="/meetings", tags=["meetings"])
@@ -16,37 +34,175 @@ router = APIRouter(prefix="/meetings", tags=["meetings"])
 @router.post("/record", response_model=MeetingRecordResponse, status_code=status.HTTP_201_CREATED)
 async def record_meeting(
     audio: UploadFile = File(...),
-    duration_seconds: float = Form(...),
+    # 참고용. 쿼터/과금은 서버가 WAV 헤더로 계산한 길이를 사용
+    duration_seconds: float | None = Form(None),
     service: MeetingService = Depends(get_meeting_service_dep),
 ) -> MeetingRecordResponse:
-    audio_bytes = await audio.read()
+    # 업로드를 bytes 로 통째로 읽지 않고, 임시 파일을 mmap 한 memoryview 로 넘긴다
+    async with open_upload(audio) as audio_buffer:
+        # STT + 요약 + 저장까지는 서비스 계층에서 처리
+        return await service.record_meeting(audio_bytes=audio_buffer, duration_seconds=duration_seconds)
+
+
+@router.post(
+    "/record/async",
+    response_model=MeetingJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def record_meeting_async(
+    response: Response,
+    audio: UploadFile = File(...),
+    duration_seconds: float | None = Form(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> MeetingJobResponse:
+    """업로드만 저장하고 바로 202 를 반환. STT → 요약 → 저장은 백그라운드 워커가 처리한다."""
+
+    job = await submit_job(db, upload=audio, duration_seconds=duration_seconds)
+    response.headers["Location"] = f"/meetings/jobs/{job.id}"
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=MeetingJobResponse)
+async def get_job(job_id: UUID, db: AsyncSession = Depends(get_async_db)) -> MeetingJobResponse:
+    return await get_job_response(db, job_id=job_id)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: UUID, db: AsyncSession = Depends(get_async_db)) -> StreamingResponse:
+    """작업 상태 변경(queued → transcribing → summarizing → saving → completed/failed)을 SSE 로 전송."""
+
+    await get_job_response(db, job_id=job_id)
+    return StreamingResponse(
+        job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/stream")
+async def stream_meeting(
+    websocket: WebSocket,
+    sample_rate: int = 48000,
+    defer_summary: bool = False,
+) -> None:
+    """녹음 중 PCM(16bit LE mono)을 받아 무음 지점마다 세그먼트를 전사하고 partial 결과를 바로 돌려준다.
+
+    stop 메시지(또는 연결 종료) 후 남은 세그먼트를 전사/요약해 회의를 저장하고 final 이벤트를 보낸다.
+    defer_summary=true 이면 요약은 /meetings/{id}/summary/stream 으로 따로 받는다.
+    """
+
+    await run_realtime_session(websocket, sample_rate=sample_rate, defer_summary=defer_summary)
+
+
+@router.get("/", response_model=MeetingListPage)
+async def list_meetings(
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1),
+    if_none_match: str | None = Header(None),
+    service: MeetingService = Depends(get_meeting_service_dep),
+) -> Response:
+    """최근 회의 목록. 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨 조회한다 (limit 은 meeting_list_max_limit 까지).
 
-    # STT + 요약 + 저장까지는 서비스 계층에서 처리
-    return await service.record_meeting(audio_bytes=audio_bytes, duration_seconds=duration_seconds)
+    응답의 ETag 를 If-None-Match 로 보내면 그 뒤로 회의가 바뀌지 않았을 때 304 (본문 없음).
+    """
 
+    return await service.list_meetings(cursor=cursor, limit=limit, if_none_match=if_none_match)
 
-@router.get("/", response_model=list[MeetingListItem])
-def list_meetings(
-    skip: int = 0,
-    limit: int = 20,
+
+@router.get("/search", response_model=MeetingSearchPage)
+async def search_meetings(
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1),
     service: MeetingService = Depends(get_meeting_service_dep),
-) -> list[MeetingListItem]:
-    return service.list_meetings(skip=skip, limit=limit)
+) -> MeetingSearchPage:
+    """제목/요약/전사 검색. 일치 부분을 <mark> 로 표시한 snippet 과 함께 관련도 순으로 반환한다."""
+
+    return await service.search_meetings(query=q, cursor=cursor, limit=limit)
+
+
+@router.get("/export")
+async def export_meetings(
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    fields: str | None = None,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """회의 전체를 NDJSON(한 줄에 회의 하나, 오래된 순)으로 스트리밍. 분석용 일괄 내보내기.
+
+    created_at 이 [created_from, created_to) 인 회의만, fields(쉼표 구분: title, started_at, ended_at, summary,
+    full_transcript, updated_at)로 컬럼을 고른다 (id, created_at 은 항상 포함). gzip=true 이면 gzip 으로 압축해 보낸다.
+    """
+
+    headers = {"X-Accel-Buffering": "no"}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        export_meetings_ndjson(
+            fields=parse_export_fields(fields),
+            created_from=created_from,
+            created_to=created_to,
+            gzip=gzip,
+        ),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
 
 
 @router.get("/{meeting_id}", response_model=MeetingDetailResponse)
-def get_meeting(
+async def get_meeting(
     meeting_id: UUID,
+    if_none_match: str | None = Header(None),
     service: MeetingService = Depends(get_meeting_service_dep),
-) -> MeetingDetailResponse:
-    return service.get_meeting(meeting_id=meeting_id)
+) -> Response:
+    return await service.get_meeting(meeting_id=meeting_id, if_none_match=if_none_match)
+
+
+@router.get("/{meeting_id}/audio")
+async def get_meeting_audio(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """회의 녹음 재생 (audio/wav). Range 요청을 지원해 긴 녹음도 탐색한 구간만 받는다."""
+
+    return await meeting_audio_response(db, meeting_id=meeting_id)
+
+
+@router.get("/{meeting_id}/segments", response_model=MeetingSegmentPage)
+async def list_meeting_segments(
+    meeting_id: UUID,
+    start: float | None = Query(None, ge=0),
+    end: float | None = Query(None, gt=0),
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1),
+    service: MeetingService = Depends(get_meeting_service_dep),
+) -> MeetingSegmentPage:
+    """녹음의 [start, end) 초 구간과 겹치는 전사 세그먼트 (시각 순). 생략하면 처음/끝까지.
+
+    전사 전문을 읽지 않으므로 긴 회의에서도 재생 위치 주변 자막만 가져올 수 있다.
+    다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨 조회한다.
+    """
+
+    return await service.list_segments(meeting_id=meeting_id, start=start, end=end, cursor=cursor, limit=limit)
+
+
+@router.get("/{meeting_id}/summary/stream")
+async def stream_summary(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)) -> StreamingResponse:
+    """회의 요약을 생성하면서 토큰을 SSE(event: delta)로 전송. 완료되면 저장 후 event: done.
+
+    요약이 없는 회의(실시간 녹음 직후 등)를 열 때 화면이 첫 토큰부터 바로 표시할 수 있다.
+    """
+
+    transcript = await get_summary_source(db, meeting_id=meeting_id)
+    return StreamingResponse(
+        stream_meeting_summary(meeting_id=meeting_id, transcript=transcript),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_meeting(
+async def delete_meeting(
     meeting_id: UUID,
     service: MeetingService = Depends(get_meeting_service_dep),
 ) -> None:
-    service.delete_meeting(meeting_id=meeting_id)
+    await service.delete_meeting(meeting_id=meeting_id)
 
     return None
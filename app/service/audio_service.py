@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TypeVar
+import asyncio
+import io
+import struct
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from fastapi import HTTPException, status
+
+from app.config.settings import get_settings
+
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+_executor: ThreadPoolExecutor | None = None
+
+# 업로드 버퍼 (bytes 또는 mmap 된 파일의 memoryview)
+AudioBuffer = bytes | bytearray | memoryview
+
+# 긴 녹음을 변환할 때 한 번에 처리하는 프레임 수 (중간 배열 크기를 일정하게 유지)
+_BLOCK_FRAMES = 1 << 20
+
+# WAVE 포맷 태그 (fmt 청크의 AudioFormat)
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass(frozen=True)
+class PcmAudio:
+    """디코딩된 16bit PCM 오디오.
+
+    samples 는 (프레임 수, 채널 수) 형태의 int16 배열이다.
+    """
+
+    samples: np.ndarray
+    sample_rate: int
+
+    @property
+    def channels(self) -> int:
+        return int(self.samples.shape[1])
+
+    @property
+    def num_frames(self) -> int:
+        return int(self.samples.shape[0])
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.num_frames / float(self.sample_rate)
+
+    def slice_frames(self, start: int, end: int) -> PcmAudio:
+        """[start, end) 프레임 구간을 복사 없이(view) 잘라낸다."""
+
+        return PcmAudio(samples=self.samples[start:end], sample_rate=self.sample_rate)
+
+
+def _invalid_audio(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"지원하지 않는 오디오 형식입니다: {detail}",
+    )
+
+
+def decode_wav(data: AudioBuffer) -> PcmAudio:
+    """RIFF/WAVE 바이트를 파싱해 PcmAudio 로 변환한다.
+
+    - 16bit PCM 과 32bit float 을 지원하며, float 은 int16 으로 변환한다.
+    - 스트리밍 인코더가 data 청크 크기를 0/0xFFFFFFFF 로 남기는 경우 버퍼 끝까지를 데이터로 본다.
+    - 16bit PCM 은 복사 없이 입력 버퍼(mmap 된 업로드 파일 등)를 그대로 참조한다.
+    """
+
+    buf = memoryview(data)
+    if len(buf) < 12 or bytes(buf[0:4]) != b"RIFF" or bytes(buf[8:12]) != b"WAVE":
+        raise _invalid_audio("RIFF/WAVE 헤더가 아닙니다.")
+
+    fmt: tuple[int, int, int, int] | None = None
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id = bytes(buf[pos : pos + 4])
+        (chunk_size,) = struct.unpack_from("<I", buf, pos + 4)
+        body_start = pos + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16:
+                raise _invalid_audio("fmt 청크가 손상되었습니다.")
+            audio_format, channels, sample_rate, _, _, bits = struct.unpack_from(
+                "<HHIIHH", buf, body_start
+            )
+            if audio_format == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # WAVEFORMATEXTENSIBLE: SubFormat GUID 의 앞 2바이트가 실제 포맷 태그
+                (audio_format,) = struct.unpack_from("<H", buf, body_start + 24)
+            fmt = (audio_format, channels, sample_rate, bits)
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise _invalid_audio("data 청크 앞에 fmt 청크가 없습니다.")
+            body_end = body_start + chunk_size
+            if chunk_size in (0, 0xFFFFFFFF) or body_end > len(buf):
+                body_end = len(buf)
+            return _pcm_from_chunk(buf[body_start:body_end], *fmt)
+
+        # 청크는 짝수 바이트 경계로 정렬된다.
+        pos = body_start + chunk_size + (chunk_size & 1)
+
+    raise _invalid_audio("data 청크를 찾을 수 없습니다.")
+
+
+def _pcm_from_chunk(
+    body: memoryview,
+    audio_format: int,
+    channels: int,
+    sample_rate: int,
+    bits: int,
+) -> PcmAudio:
+    if channels < 1 or sample_rate <= 0:
+        raise _invalid_audio(f"channels={channels}, sample_rate={sample_rate}")
+
+    if audio_format == _WAVE_FORMAT_PCM and bits == 16:
+        usable = len(body) - len(body) % (2 * channels)
+        samples = np.frombuffer(body[:usable], dtype="<i2")
+    elif audio_format == _WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        usable = len(body) - len(body) % (4 * channels)
+        floats = np.frombuffer(body[:usable], dtype="<f4")
+        samples = np.empty(len(floats), dtype=np.int16)
+        for start in range(0, len(floats), _BLOCK_FRAMES):
+            block = floats[start : start + _BLOCK_FRAMES]
+            samples[start : start + len(block)] = np.clip(block, -1.0, 1.0) * 32767.0
+    else:
+        raise _invalid_audio(f"format={audio_format}, bits={bits}")
+
+    return PcmAudio(samples=samples.reshape(-1, channels), sample_rate=sample_rate)
+
+
+def _wav_header(channels: int, sample_rate: int, pcm_bytes: int) -> bytes:
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + pcm_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        _WAVE_FORMAT_PCM,
+        channels,
+        sample_rate,
+        sample_rate * channels * 2,
+        channels * 2,
+        16,
+        b"data",
+        pcm_bytes,
+    )
+
+
+def encode_wav(audio: PcmAudio) -> bytes:
+    """PcmAudio 를 16bit PCM WAV 바이트로 인코딩한다."""
+
+    pcm = np.ascontiguousarray(audio.samples, dtype="<i2").tobytes()
+    return _wav_header(audio.channels, audio.sample_rate, len(pcm)) + pcm
+
+
+class WavStream:
+    """PcmAudio 를 16bit PCM WAV 로 조각조각 내보내는 httpx 요청 body.
+
+    encode_wav 처럼 전체 바이트를 한 번에 만들지 않고 샘플 배열을 chunk_bytes 단위로 잘라 보내며,
+    반복할 때마다 처음부터 다시 생성되므로 같은 객체로 재시도할 수 있다.
+    길이를 미리 알 수 있으므로 Content-Length 헤더와 함께 사용한다 (chunked 전송 회피).
+    """
+
+    def __init__(self, audio: PcmAudio, chunk_bytes: int = 64 * 1024) -> None:
+        self._samples = np.ascontiguousarray(audio.samples, dtype="<i2")
+        self._header = _wav_header(audio.channels, audio.sample_rate, self._samples.nbytes)
+        self._chunk_bytes = chunk_bytes
+
+    def __len__(self) -> int:
+        return len(self._header) + self._samples.nbytes
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._header
+        view = memoryview(self._samples).cast("B")
+        for start in range(0, len(view), self._chunk_bytes):
+            yield bytes(view[start : start + self._chunk_bytes])
+
+
+def encode_flac(audio: PcmAudio) -> bytes:
+    """PcmAudio 를 FLAC(무손실 압축)으로 인코딩한다.
+
+    선택 의존성 soundfile(libsndfile)이 필요하며, 없으면 ImportError 를 그대로 올린다.
+    """
+
+    import soundfile
+
+    out = io.BytesIO()
+    soundfile.write(out, audio.samples, audio.sample_rate, format="FLAC", subtype="PCM_16")
+    return out.getvalue()
+
+
+def to_mono(audio: PcmAudio) -> PcmAudio:
+    """여러 채널을 평균해 mono 로 다운믹스한다."""
+
+    if audio.channels == 1:
+        return audio
+
+    # int32 로 누적해 오버플로 없이 평균 (float 중간 배열을 만들지 않음).
+    # 블록 단위로 처리해 int32 중간 배열이 녹음 길이에 비례해 커지지 않게 한다.
+    mixed = np.empty((audio.num_frames, 1), dtype=np.int16)
+    for start in range(0, audio.num_frames, _BLOCK_FRAMES):
+        block = audio.samples[start : start + _BLOCK_FRAMES]
+        mixed[start : start + len(block), 0] = block.sum(axis=1, dtype=np.int32) // audio.channels
+    return PcmAudio(samples=mixed, sample_rate=audio.sample_rate)
+
+
+def _lowpass_kernel(cutoff: float, num_taps: int) -> np.ndarray:
+    """cutoff(샘플당 cycle, 0~0.5) 의 Hamming windowed-sinc FIR 커널."""
+
+    n = np.arange(num_taps, dtype=np.float64) - (num_taps - 1) / 2.0
+    kernel = np.sinc(2.0 * cutoff * n) * np.hamming(num_taps)
+    return (kernel / kernel.sum()).astype(np.float32)
+
+
+def resample(
+    audio: PcmAudio,
+    target_rate: int,
+    *,
+    num_taps: int = 101,
+    block_seconds: float = 5.0,
+    downmix: bool = False,
+) -> PcmAudio:
+    """anti-aliasing 저역통과 FIR + 선형 보간으로 샘플레이트를 변환한다.
+
+    다운샘플링 시에는 필터 출력 전체를 계산하지 않고, 출력 샘플 위치에 필요한 값만
+    sliding window @ kernel 로 계산한다 (정수 배 변환이면 보간 없이 stride view 로 처리).
+    긴 녹음에서도 메모리 사용량이 일정하도록 block_seconds 단위로 나눠 처리한다.
+    downmix=True 이면 블록마다 채널 평균을 내어 mono 로 출력한다
+    (원본 길이의 mono 중간 배열을 따로 만들지 않음).
+    """
+
+    if audio.sample_rate == target_rate or audio.num_frames == 0:
+        return to_mono(audio) if downmix else audio
+
+    def read(lo: int, hi: int, ch: int | None) -> np.ndarray:
+        if ch is None:
+            return audio.samples[lo:hi].mean(axis=1, dtype=np.float32)
+        return audio.samples[lo:hi, ch].astype(np.float32)
+
+    channels: list[int | None] = [None] if downmix and audio.channels > 1 else list(range(audio.channels))
+    ratio = audio.sample_rate / float(target_rate)
+    out_frames = int(audio.num_frames * target_rate // audio.sample_rate)
+    out = np.empty((out_frames, len(channels)), dtype=np.int16)
+
+    # 다운샘플링일 때만 새 나이퀴스트 주파수 아래로 필터링 (여유 10%)
+    kernel = _lowpass_kernel(0.45 / ratio, num_taps) if ratio > 1.0 else None
+    half = num_taps // 2
+    step = int(ratio) if ratio.is_integer() else 0
+    block = max(1, int(block_seconds * target_rate))
+
+    for out_start in range(0, out_frames, block):
+        out_end = min(out_frames, out_start + block)
+        positions = np.arange(out_start, out_end, dtype=np.float64) * ratio
+        in_lo = int(positions[0])
+        in_hi = min(audio.num_frames, int(positions[-1]) + 2)
+        local = positions - in_lo
+        base = local.astype(np.int64)
+        frac = (local - base).astype(np.float32)
+
+        for index, ch in enumerate(channels):
+            chunk = read(in_lo, in_hi, ch)
+            if kernel is None:
+                values = np.interp(local, np.arange(len(chunk), dtype=np.float64), chunk)
+            else:
+                # 블록 앞뒤로 필터 반경만큼의 실제 샘플(신호 끝에서는 0)을 붙여 경계 왜곡 방지
+                left = read(max(0, in_lo - half), in_lo, ch)
+                right = read(in_hi, in_hi + half + 1, ch)
+                padded = np.concatenate(
+                    (
+                        np.zeros(half - len(left), dtype=np.float32),
+                        left,
+                        chunk,
+                        right,
+                        np.zeros(half + 1 - len(right), dtype=np.float32),
+                    )
+                )
+                windows = sliding_window_view(padded, num_taps)
+                if step:
+                    values = windows[base[0] : base[-1] + 1 : step] @ kernel
+                else:
+                    v0 = windows[base] @ kernel
+                    v1 = windows[base + 1] @ kernel
+                    values = v0 + frac * (v1 - v0)
+            out[out_start:out_end, index] = np.clip(np.rint(values), -32768, 32767)
+
+    return PcmAudio(samples=out, sample_rate=target_rate)
+
+
+def preprocess_audio(data: AudioBuffer, *, target_rate: int) -> PcmAudio:
+    """업로드된 WAV 를 STT 입력 형태(mono, target_rate, 16bit)로 정규화한다.
+
+    재생 길이는 클라이언트가 보낸 값이 아니라 RIFF 헤더/데이터 크기에서 계산된다
+    (PcmAudio.duration_seconds).
+    """
+
+    audio = decode_wav(data)
+    return resample(audio, target_rate, downmix=True)
+
+
+def _window_energies(audio: PcmAudio, window_frames: int) -> np.ndarray:
+    """window_frames 단위 구간별 평균 에너지(채널 평균 신호의 제곱 평균).
+
+    긴 녹음 전체를 float 으로 복사하지 않도록 구간 경계에 맞춘 _BLOCK_FRAMES 크기 블록 단위로 계산한다.
+    """
+
+    num_windows = audio.num_frames // window_frames
+    energies = np.empty(num_windows, dtype=np.float64)
+    block_windows = max(1, _BLOCK_FRAMES // window_frames)
+    for start in range(0, num_windows, block_windows):
+        end = min(num_windows, start + block_windows)
+        mono = audio.samples[start * window_frames : end * window_frames].mean(axis=1, dtype=np.float32)
+        np.square(mono, out=mono)
+        energies[start:end] = mono.reshape(end - start, window_frames).mean(axis=1)
+    return energies
+
+
+def split_on_silence(
+    audio: PcmAudio,
+    *,
+    max_seconds: float,
+    min_seconds: float,
+    window_ms: int = 20,
+    smoothing_ms: int = 300,
+) -> list[PcmAudio]:
+    """긴 오디오를 에너지가 가장 낮은 지점에서 잘라 max_seconds 이하 세그먼트로 나눈다.
+
+    각 세그먼트의 끝은 [시작 + min_seconds, 시작 + max_seconds] 구간 안에서
+    smoothing_ms 로 평활화한 에너지가 최소인 위치로 정한다.
+    반환되는 세그먼트는 원본 배열의 view 이므로 추가 복사가 없다.
+    """
+
+    if audio.duration_seconds <= max_seconds:
+        return [audio]
+
+    window_frames = max(1, audio.sample_rate * window_ms // 1000)
+    energies = _window_energies(audio, window_frames)
+
+    smoothing = max(1, smoothing_ms // window_ms)
+    if smoothing > 1 and len(energies) >= smoothing:
+        kernel = np.ones(smoothing, dtype=np.float64) / smoothing
+        energies = np.convolve(energies, kernel, mode="same")
+
+    max_windows = max(1, int(max_seconds * 1000) // window_ms)
+    min_windows = min(max_windows, max(1, int(min_seconds * 1000) // window_ms))
+    total_windows = len(energies)
+
+    segments: list[PcmAudio] = []
+    start = 0
+    while audio.num_frames - start * window_frames > max_windows * window_frames:
+        lo = start + min_windows
+        hi = min(start + max_windows, total_windows)
+        cut = lo + int(np.argmin(energies[lo:hi])) if hi > lo else hi
+        segments.append(audio.slice_frames(start * window_frames, cut * window_frames))
+        start = cut
+
+    segments.append(audio.slice_frames(start * window_frames, audio.num_frames))
+    return segments
+
+
+async def run_in_audio_pool(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """CPU 위주의 오디오 처리(디코딩/리샘플링/VAD)를 전용 스레드 풀에서 실행한다.
+
+    numpy 연산은 대부분 GIL 을 풀기 때문에 여러 업로드를 병렬로 처리할 수 있고,
+    이벤트 루프와 기본 executor 를 막지 않는다.
+    """
+
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.audio_worker_threads),
+            thread_name_prefix="audio",
+        )
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
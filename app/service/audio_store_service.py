@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple
+from uuid import UUID, uuid4
+import errno
+import hashlib
+import logging
+import os
+import shutil
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config.settings import get_settings
+from app.repository.meeting_respository import (
+    delete_unreferenced_audio_object,
+    get_meeting,
+    lock_audio_object,
+)
+from app.service.audio_service import AudioBuffer
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+# 녹음 업로드는 WAV 만 받는다 (audio_service.decode_wav)
+AUDIO_CONTENT_TYPE = "audio/wav"
+# 내용이 바뀌지 않는 파일이므로 브라우저가 다시 받지 않아도 된다
+_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+class AudioDigest(NamedTuple):
+    sha256: str
+    size_bytes: int
+
+
+def audio_path(sha256: str) -> Path:
+    """한 디렉터리에 파일이 몰리지 않도록 해시 앞 4자리로 두 단계 나눈 경로 (ab/cd/abcd…)."""
+
+    return Path(settings.audio_store_dir) / sha256[:2] / sha256[2:4] / sha256
+
+
+def _digest(source: AudioBuffer | Path) -> AudioDigest:
+    if isinstance(source, Path):
+        digest = hashlib.sha256()
+        size = 0
+        with open(source, "rb") as file:
+            while chunk := file.read(settings.upload_chunk_bytes):
+                digest.update(chunk)
+                size += len(chunk)
+        return AudioDigest(digest.hexdigest(), size)
+    return AudioDigest(hashlib.sha256(source).hexdigest(), len(source))
+
+
+def _write(source: AudioBuffer | Path, path: Path) -> None:
+    """path 에 파일이 없으면 임시 파일에 쓴 뒤 rename 으로 한 번에 드러낸다 (읽는 쪽이 쓰다 만 파일을 보지 않음).
+
+    source 가 파일이면 같은 파일 시스템일 때 hard link 로 복사 없이 저장한다.
+    """
+
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        if isinstance(source, Path):
+            try:
+                os.link(source, tmp)
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                    raise
+                shutil.copyfile(source, tmp)
+        else:
+            with open(tmp, "wb") as file:
+                file.write(source)
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+async def store_audio(db: AsyncSession, source: AudioBuffer | Path) -> str | None:
+    """녹음을 내용 해시로 저장하고 해시를 반환한다. 커밋은 회의 생성과 함께 호출한 쪽에서 한다.
+
+    같은 오디오가 이미 있으면 다시 쓰지 않는다. 저장에 실패해도 회의는 만들 수 있도록 None 을 반환한다.
+    """
+
+    if not settings.audio_store_enabled:
+        return None
+    try:
+        digest = await run_in_threadpool(_digest, source)
+        async with db.begin_nested():
+            # 행을 먼저 잠가야 동시에 진행 중인 삭제(release_audio)가 방금 확인한 파일을 지우지 않는다
+            await lock_audio_object(
+                db, sha256=digest.sha256, size_bytes=digest.size_bytes, content_type=AUDIO_CONTENT_TYPE
+            )
+            await run_in_threadpool(_write, source, audio_path(digest.sha256))
+    except OSError:
+        logger.exception("failed to store meeting audio, saving meeting without it")
+        return None
+    return digest.sha256
+
+
+async def release_audio(db: AsyncSession, *, sha256: str) -> None:
+    """회의 삭제 후 더 이상 참조하는 회의가 없는 오디오 파일을 지운다."""
+
+    if await delete_unreferenced_audio_object(db, sha256=sha256):
+        # 행 잠금을 쥔 채(커밋 전) 지워야, 같은 오디오를 새로 저장하는 요청이 커밋 후 파일을 다시 쓴다
+        await run_in_threadpool(audio_path(sha256).unlink, missing_ok=True)
+    await db.commit()
+
+
+async def meeting_audio_response(db: AsyncSession, *, meeting_id: UUID) -> Response:
+    """회의 녹음 재생 응답. Range 요청은 해당 구간만 보내므로 긴 녹음에서 탐색해도 파일 전체를 읽지 않는다.
+
+    audio_store_accel_redirect_prefix 가 있으면 앞단 nginx 가 sendfile 로 직접 보내도록 경로만 넘긴다.
+    """
+
+    meeting = await get_meeting(db, meeting_id=meeting_id)
+    if meeting is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+    if meeting.audio_sha256 is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="저장된 녹음이 없는 회의입니다.")
+
+    sha256 = meeting.audio_sha256
+    headers = {"ETag": f'"{sha256}"', "Cache-Control": _IMMUTABLE_CACHE_CONTROL}
+    if settings.audio_store_accel_redirect_prefix:
+        relative = audio_path(sha256).relative_to(settings.audio_store_dir).as_posix()
+        headers["X-Accel-Redirect"] = settings.audio_store_accel_redirect_prefix.rstrip("/") + "/" + relative
+        return Response(media_type=AUDIO_CONTENT_TYPE, headers=headers)
+
+    path = audio_path(sha256)
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except FileNotFoundError:
+        logger.warning("audio file for meeting %s is missing: %s", meeting_id, path)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="녹음 파일을 찾을 수 없습니다.") from None
+    # FileResponse 가 Range/If-Range 를 처리하고, 서버가 http.response.pathsend 를 지원하면 파일 전송을 서버에 넘긴다
+    return FileResponse(path, media_type=AUDIO_CONTENT_TYPE, headers=headers, stat_result=stat_result)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+import threading
+import time
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TtlLruCache(Generic[K, V]):
+    """크기 제한(LRU) + 선택적 TTL 을 가진 프로세스 내 캐시.
+
+    이벤트 루프와 오디오 스레드 풀 양쪽에서 접근할 수 있도록 내부 잠금을 사용한다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            stored_at, value = item
+            if self._ttl_seconds is not None and time.monotonic() - stored_at > self._ttl_seconds:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID, uuid4
+import asyncio
+import json
+import logging
+
+from fastapi import HTTPException, UploadFile, status
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import AsyncSessionLocal
+from app.config.settings import get_settings
+from app.config.timing import timed
+from app.models.meeting import JobStatus, MeetingJobResponse
+from app.models.models import MeetingJob
+from app.repository.job_repository import (
+    claim_next_job,
+    count_queued_jobs,
+    create_job,
+    get_job,
+    touch_job,
+    update_job_status,
+)
+from app.repository.meeting_respository import get_meeting
+from app.service.meeting_service import create_meeting
+from app.service.stt_service import TranscriptSegment, transcribe
+from app.service.summary_service import IncrementalSummarizer
+from app.service.upload_service import copy_upload, map_path
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+JOBS_RUNNING = Gauge("meeting_stt_jobs_running", "처리 중인 비동기 녹음 작업 수")
+JOB_DURATION = Histogram(
+    "meeting_stt_job_duration_seconds",
+    "비동기 녹음 작업 처리 시간 (claim → 완료/실패)",
+    ["status"],
+)
+
+_workers: list[asyncio.Task] = []
+_wakeup: asyncio.Event | None = None
+# job_id → SSE 구독자별 Event. 같은 프로세스에서 상태가 바뀌면 DB polling 을 기다리지 않고 바로 깨운다
+_subscribers: dict[UUID, set[asyncio.Event]] = {}
+
+
+def _to_response(job: MeetingJob) -> MeetingJobResponse:
+    return MeetingJobResponse(
+        id=job.id,
+        status=JobStatus(job.status),
+        # meeting_id 는 저장 전에 미리 기록되므로 완료된 뒤에만 노출
+        meeting_id=job.meeting_id if job.status == JobStatus.COMPLETED.value else None,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+def _upload_dir() -> Path:
+    path = Path(settings.meeting_job_upload_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _notify(job_id: UUID) -> None:
+    for event in _subscribers.get(job_id, ()):
+        event.set()
+
+
+@contextmanager
+def _subscribe(job_id: UUID) -> Iterator[asyncio.Event]:
+    event = asyncio.Event()
+    _subscribers.setdefault(job_id, set()).add(event)
+    try:
+        yield event
+    finally:
+        listeners = _subscribers.get(job_id)
+        if listeners is not None:
+            listeners.discard(event)
+            if not listeners:
+                del _subscribers[job_id]
+
+
+async def submit_job(
+    db: AsyncSession,
+    *,
+    upload: UploadFile,
+    duration_seconds: float | None = None,
+) -> MeetingJobResponse:
+    """업로드를 디스크에 저장하고 대기 작업을 만든다. 실제 처리는 백그라운드 워커가 수행."""
+
+    if await count_queued_jobs(db) >= settings.meeting_job_max_queued:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+        )
+
+    job_id = uuid4()
+    audio_path = _upload_dir() / f"{job_id}.wav"
+    try:
+        # 복사 중 실패(연결 끊김 등)하면 쓰다 만 파일도 지운다
+        await copy_upload(upload, audio_path)
+        job = await create_job(
+            db,
+            job_id=job_id,
+            audio_path=str(audio_path),
+            duration_seconds=duration_seconds,
+        )
+    except BaseException:
+        audio_path.unlink(missing_ok=True)
+        raise
+
+    if _wakeup is not None:
+        _wakeup.set()
+    return _to_response(job)
+
+
+async def get_job_response(db: AsyncSession, *, job_id: UUID) -> MeetingJobResponse:
+    job = await get_job(db, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return _to_response(job)
+
+
+async def _set_status(job_id: UUID, job_status: JobStatus, **fields) -> JobStatus:
+    """상태 갱신마다 세션을 짧게 열고 닫는다 (STT/요약을 기다리는 동안 트랜잭션/연결을 붙잡지 않도록)."""
+
+    async with AsyncSessionLocal() as db:
+        await update_job_status(db, job_id=job_id, status=job_status, **fields)
+    logger.info("meeting job %s -> %s", job_id, job_status.value)
+    _notify(job_id)
+    return job_status
+
+
+async def _heartbeat(job_id: UUID) -> None:
+    """처리 중인 작업의 heartbeat 를 주기적으로 갱신 (작업 세션과 별도 세션 사용)."""
+
+    interval = settings.meeting_job_stale_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        async with AsyncSessionLocal() as db:
+            await touch_job(db, job_id=job_id)
+
+
+async def _run_job(job: MeetingJob) -> None:
+    if job.attempts > settings.meeting_job_max_attempts:
+        await _set_status(job.id, JobStatus.FAILED, error="처리 중 워커가 반복해서 중단되어 작업을 포기했습니다.")
+        Path(job.audio_path).unlink(missing_ok=True)
+        return
+
+    if job.meeting_id is not None:
+        # 이전 시도가 회의를 저장한 뒤 COMPLETED 로 바꾸기 전에 중단됐으면 다시 만들지 않고 완료 처리
+        async with AsyncSessionLocal() as db:
+            saved = await get_meeting(db, meeting_id=job.meeting_id) is not None
+        if saved:
+            await _set_status(job.id, JobStatus.COMPLETED, meeting_id=job.meeting_id)
+            Path(job.audio_path).unlink(missing_ok=True)
+            return
+
+    _notify(job.id)
+    started = asyncio.get_running_loop().time()
+    heartbeat = asyncio.create_task(_heartbeat(job.id))
+    JOBS_RUNNING.inc()
+    try:
+        # 작업 상태는 _set_status 가 짧은 세션으로 갱신하고, STT 쿼터/캐시와 회의 저장은 별도 async 세션으로 처리
+        async with IncrementalSummarizer() as summarizer, AsyncSessionLocal() as meeting_db:
+            segments: list[TranscriptSegment] = []
+            with map_path(job.audio_path) as audio_buffer:
+                transcript = await transcribe(
+                    audio_bytes=audio_buffer,
+                    db=meeting_db,
+                    duration_seconds=job.duration_seconds,
+                    on_segment=summarizer.add,
+                    segments=segments,
+                )
+
+            await _set_status(job.id, JobStatus.SUMMARIZING)
+            with timed("summary"):
+                summary = await summarizer.finish(transcript)
+
+            # 회의 ID 를 저장 전에 작업에 기록해 두면, 저장 직후 워커가 죽어도 재시도가 같은 회의를 알아본다
+            meeting_id = job.meeting_id or uuid4()
+            await _set_status(job.id, JobStatus.SAVING, meeting_id=meeting_id)
+            with timed("db"):
+                # 보관 파일을 hard link 로 오디오 저장소에 넣으므로 아래에서 지워도 녹음은 남는다
+                meeting = await create_meeting(
+                    meeting_db,
+                    transcript=transcript,
+                    summary=summary,
+                    audio=Path(job.audio_path),
+                    segments=segments,
+                    meeting_id=meeting_id,
+                )
+        final_status = await _set_status(job.id, JobStatus.COMPLETED, meeting_id=meeting.id)
+    except asyncio.CancelledError:
+        # 종료(shutdown) 중이면 다음 기동 때 바로 다시 처리되도록 대기 상태로 되돌린다.
+        # 한 번 더 취소되더라도 상태 갱신은 끝까지 진행한다
+        await asyncio.shield(_set_status(job.id, JobStatus.QUEUED))
+        raise
+    except HTTPException as exc:
+        final_status = await _set_status(job.id, JobStatus.FAILED, error=str(exc.detail))
+    except FileNotFoundError:
+        final_status = await _set_status(job.id, JobStatus.FAILED, error="업로드된 오디오 파일을 찾을 수 없습니다.")
+    except Exception:
+        logger.exception("meeting job %s failed", job.id)
+        final_status = await _set_status(job.id, JobStatus.FAILED, error="처리 중 오류가 발생했습니다.")
+    finally:
+        heartbeat.cancel()
+        JOBS_RUNNING.dec()
+
+    JOB_DURATION.labels(status=final_status.value).observe(asyncio.get_running_loop().time() - started)
+    Path(job.audio_path).unlink(missing_ok=True)
+
+
+async def _worker_loop(index: int) -> None:
+    while True:
+        try:
+            # claim 전에 clear 해야 그 사이 들어온 작업의 wakeup 을 놓치지 않는다
+            _wakeup.clear()
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.meeting_job_stale_seconds)
+            async with AsyncSessionLocal() as db:
+                job = await claim_next_job(db, stale_before=stale_before)
+            if job is not None:
+                if job.attempts > 1:
+                    logger.warning("meeting job %s recovered (attempt %d)", job.id, job.attempts)
+                await _run_job(job)
+                continue
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("meeting job worker %d error", index)
+
+        # 다른 프로세스에 들어온 작업이나 heartbeat 가 끊긴 작업도 가져가도록 주기적으로 다시 확인
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=settings.meeting_job_poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_job_workers() -> None:
+    """앱 startup 에서 호출. meeting_job_workers 개의 워커가 jobs 테이블에서 작업을 가져가 처리한다.
+
+    재시작 전에 처리 중이던 작업은 heartbeat 가 meeting_job_stale_seconds 동안 끊기면 다시 처리된다.
+    """
+
+    global _wakeup
+
+    if _workers or settings.meeting_job_workers <= 0:
+        return
+
+    _wakeup = asyncio.Event()
+    for index in range(settings.meeting_job_workers):
+        _workers.append(asyncio.create_task(_worker_loop(index), name=f"meeting-job-worker-{index}"))
+    logger.info("started %d meeting job workers", len(_workers))
+
+
+async def stop_job_workers() -> None:
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+
+def _format_event(job: MeetingJobResponse) -> str:
+    return f"event: status\ndata: {json.dumps(job.model_dump(mode='json'), ensure_ascii=False)}\n\n"
+
+
+async def job_events(job_id: UUID) -> AsyncIterator[str]:
+    """작업 상태가 바뀔 때마다 SSE 이벤트를 보내고, 완료/실패 시 스트림을 닫는다.
+
+    상태의 기준은 항상 DB 이며, 같은 프로세스의 워커가 처리하면 즉시 깨어나고
+    다른 프로세스가 처리 중이면 meeting_job_poll_seconds 간격으로 다시 조회한다.
+    """
+
+    last_status: JobStatus | None = None
+    with _subscribe(job_id) as changed:
+        while True:
+            changed.clear()
+            async with AsyncSessionLocal() as db:
+                job = await get_job(db, job_id=job_id)
+                snapshot = _to_response(job) if job is not None else None
+
+            if snapshot is None:
+                return
+            if snapshot.status is not last_status:
+                last_status = snapshot.status
+                yield _format_event(snapshot)
+            if snapshot.status.is_terminal:
+                return
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=settings.meeting_job_poll_seconds)
+            except asyncio.TimeoutError:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
+                yield ": keep-alive\n\n"
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+
+import openai
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config.settings import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+T = TypeVar("T")
+
+LLM_QUEUE_DEPTH = Gauge("meeting_stt_llm_queue_depth", "Azure OpenAI 호출 슬롯을 기다리는 요청 수")
+LLM_QUEUE_WAIT = Histogram(
+    "meeting_stt_llm_queue_wait_seconds",
+    "Azure OpenAI 호출 전 limiter 대기 시간 (429 후 재시도 대기 포함)",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+LLM_IN_FLIGHT = Gauge("meeting_stt_llm_in_flight", "진행 중인 Azure OpenAI 호출 수")
+LLM_CONCURRENCY_LIMIT = Gauge("meeting_stt_llm_concurrency_limit", "AIMD 로 조정되는 Azure OpenAI 동시 호출 한도")
+LLM_THROTTLED = Counter("meeting_stt_llm_throttled_total", "Azure OpenAI 가 돌려준 429 응답 수")
+
+# Retry-After 헤더가 없는 429 뒤 전체 호출을 멈추는 시간(초)
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+@dataclass
+class _TokenBucket:
+    """분당 한도(rpm/tpm)를 초당 rate 로 채우는 토큰 버킷. 한 번에 최대 1분치(capacity)까지 쓸 수 있다."""
+
+    capacity: float
+    level: float
+    updated: float
+
+    @classmethod
+    def per_minute(cls, limit: int, now: float) -> _TokenBucket | None:
+        return cls(capacity=float(limit), level=float(limit), updated=now) if limit > 0 else None
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60.0)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # 한 요청이 1분치보다 크면 버킷이 가득 찼을 때 보낸다 (영원히 막히지 않도록)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * 60.0 / self.capacity)
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        # 음수는 실제 사용량이 추정보다 컸다는 뜻이며, 그만큼 다음 요청이 기다린다
+        self.level -= amount
+
+
+@dataclass
+class _Lease:
+    started: float
+    tokens: int
+
+
+def _retry_after(exc: openai.APIStatusError) -> float | None:
+    headers = exc.response.headers
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return max(0.0, float(headers[name]) * scale)
+        except (KeyError, ValueError):
+            continue
+    return None
+
+
+class LlmLimiter:
+    """Azure OpenAI 호출 앞단의 공유 limiter.
+
+    - 요청/토큰 수를 분당 한도(rpm/tpm)의 토큰 버킷으로 제한 (토큰은 호출 전 추정치로 잡고 응답의 사용량으로 정산)
+    - 동시 호출 한도는 AIMD: 성공하면 한도당 +1/한도 씩 늘리고, 429 를 받으면 절반으로 줄임
+    - 429 의 Retry-After 동안은 모든 호출을 멈추고, 실패시키는 대신 처음 받은 순번 그대로 대기열(FIFO)에 다시 넣어 재시도
+    - 대기열에서 queue_timeout 을 넘기면 503
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int,
+        tpm: int,
+        initial_concurrency: int,
+        max_concurrency: int,
+        queue_timeout: float,
+        max_retries: int,
+    ) -> None:
+        now = time.monotonic()
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(min(max(1, initial_concurrency), self.max_concurrency))
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+        self.in_flight = 0
+        self._requests = _TokenBucket.per_minute(rpm, now)
+        self._tokens = _TokenBucket.per_minute(tpm, now)
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        # 도착 순번(ticket) 오름차순. 재시도하는 요청도 처음 받은 순번으로 돌아가 뒤에 온 요청보다 먼저 나간다
+        self._waiters: deque[int] = deque()
+        self._tickets = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        LLM_CONCURRENCY_LIMIT.set(self.limit)
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = None
+
+    def _admit_delay(self, tokens: int, now: float) -> float | None:
+        """지금 보낼 수 있으면 0, 시간이 지나면 보낼 수 있으면 대기 시간, 다른 호출이 끝나야 하면 None."""
+
+        if self.in_flight >= int(self.limit):
+            return None
+        delay = self._blocked_until - now
+        if self._requests is not None:
+            delay = max(delay, self._requests.wait_time(1, now))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.wait_time(tokens, now))
+        return max(0.0, delay)
+
+    async def _acquire(self, tokens: int, deadline: float, ticket: int) -> _Lease:
+        self._waiters.insert(bisect.bisect(self._waiters, ticket), ticket)
+        LLM_QUEUE_DEPTH.set(len(self._waiters))
+        started = time.monotonic()
+        try:
+            while True:
+                if self._wakeup is None:
+                    self._wakeup = asyncio.Event()
+                wakeup = self._wakeup
+                now = time.monotonic()
+
+                delay = self._admit_delay(tokens, now) if self._waiters[0] == ticket else None
+                if delay == 0.0:
+                    if self._requests is not None:
+                        self._requests.take(1, now)
+                    if self._tokens is not None:
+                        self._tokens.take(tokens, now)
+                    self.in_flight += 1
+                    LLM_IN_FLIGHT.set(self.in_flight)
+                    LLM_QUEUE_WAIT.observe(now - started)
+                    return _Lease(started=now, tokens=tokens)
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail="요약 요청이 많아 Azure OpenAI 호출 대기 시간을 초과했습니다. 잠시 후 다시 시도해 주세요.",
+                    )
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=remaining if delay is None else min(delay, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters.remove(ticket)
+            LLM_QUEUE_DEPTH.set(len(self._waiters))
+            # 맨 앞이 바뀌었으니 다음 대기자가 다시 확인하도록 깨운다
+            self._notify()
+
+    def _release(self, lease: _Lease, *, used_tokens: int | None = None, succeeded: bool = False) -> None:
+        self.in_flight -= 1
+        LLM_IN_FLIGHT.set(self.in_flight)
+        if used_tokens and self._tokens is not None:
+            self._tokens.take(used_tokens - lease.tokens, time.monotonic())
+        if succeeded:
+            self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+            LLM_CONCURRENCY_LIMIT.set(self.limit)
+        self._notify()
+
+    def _throttled(self, lease: _Lease, retry_after: float | None) -> None:
+        now = time.monotonic()
+        LLM_THROTTLED.inc()
+        # 같은 시점에 함께 보낸 호출들의 429 로 여러 번 줄이지 않도록, 마지막 감소 이후 시작한 호출만 반영
+        if lease.started >= self._last_decrease:
+            self.limit = max(1.0, self.limit / 2)
+            self._last_decrease = now
+            LLM_CONCURRENCY_LIMIT.set(self.limit)
+            logger.warning("Azure OpenAI throttled; concurrency limit -> %d", int(self.limit))
+        self._blocked_until = max(self._blocked_until, now + (retry_after if retry_after is not None else _DEFAULT_RETRY_AFTER))
+        self._release(lease)
+
+    def _on_error(self, lease: _Lease, exc: BaseException, attempt: int) -> float | None:
+        """호출 실패 처리. 다시 시도할 거면 재시도 전 대기 시간(초), 아니면 None."""
+
+        if isinstance(exc, openai.RateLimitError):
+            self._throttled(lease, _retry_after(exc))
+            # 대기는 _blocked_until 로 limiter 가 처리
+            return 0.0
+
+        self._release(lease)
+        if attempt < self.max_retries and isinstance(exc, (openai.APIConnectionError, openai.InternalServerError)):
+            return 0.5 * 2**attempt
+        return None
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        tokens: int,
+        usage: Callable[[T], int] | None = None,
+    ) -> T:
+        """슬롯을 얻은 뒤 fn() 을 호출한다. 429 는 대기열로 돌아가 재시도, 5xx/네트워크 오류는 max_retries 번까지 재시도."""
+
+        deadline = time.monotonic() + self.queue_timeout
+        ticket = next(self._tickets)
+        attempt = 0
+        while True:
+            lease = await self._acquire(tokens, deadline, ticket)
+            try:
+                result = await fn()
+            except Exception as exc:
+                delay = self._on_error(lease, exc, attempt)
+                if delay is None:
+                    raise
+                if not isinstance(exc, openai.RateLimitError):
+                    # 429 는 limiter 가 기다렸다 다시 보내므로 재시도 횟수로 세지 않는다
+                    attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._release(lease)
+                raise
+
+            self._release(lease, used_tokens=usage(result) if usage else None, succeeded=True)
+            return result
+
+    async def stream(
+        self,
+        open_stream: Callable[[], AsyncIterator[T]],
+        *,
+        tokens: int,
+        usage: Callable[[T], int] | None = None,
+    ) -> AsyncIterator[T]:
+        """call 의 스트리밍 버전. 첫 조각을 받기 전에 실패한 경우에만 재시도한다."""
+
+        deadline = time.monotonic() + self.queue_timeout
+        ticket = next(self._tickets)
+        attempt = 0
+        while True:
+            lease = await self._acquire(tokens, deadline, ticket)
+            received = False
+            used = 0
+            try:
+                async for item in open_stream():
+                    received = True
+                    if usage is not None:
+                        used += usage(item)
+                    yield item
+            except Exception as exc:
+                if received:
+                    self._release(lease)
+                    raise
+                delay = self._on_error(lease, exc, attempt)
+                if delay is None:
+                    raise
+                if not isinstance(exc, openai.RateLimitError):
+                    # 429 는 limiter 가 기다렸다 다시 보내므로 재시도 횟수로 세지 않는다
+                    attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._release(lease)
+                raise
+
+            self._release(lease, used_tokens=used, succeeded=True)
+            return
+
+
+llm_limiter = LlmLimiter(
+    rpm=settings.summary_llm_rpm,
+    tpm=settings.summary_llm_tpm,
+    initial_concurrency=settings.summary_llm_initial_concurrency,
+    max_concurrency=settings.summary_llm_max_concurrency,
+    queue_timeout=settings.summary_llm_queue_timeout_seconds,
+    max_retries=settings.summary_llm_max_retries,
+)
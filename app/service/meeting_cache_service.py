@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+from uuid import UUID
+
+from fastapi import Response, status
+from prometheus_client import Counter
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import get_settings
+from app.models.models import CacheVersion
+from app.service.cache_service import TtlLruCache
+
+
+settings = get_settings()
+
+# 트리거가 올리는 버전 키 (app/config/migrations.py).
+# 목록은 추가/삭제와 제목/요약 변경 시, 회의 상세는 그 회의나 전사가 바뀔 때만 올라간다
+MEETING_LIST_CACHE_VERSION = "meetings/list"
+
+
+def meeting_detail_cache_version(meeting_id: UUID) -> str:
+    return f"meetings/{meeting_id}"
+
+
+MEETING_RESPONSE_CACHE_LOOKUPS = Counter(
+    "meeting_stt_meeting_response_cache_lookups_total",
+    "회의 목록/상세 응답 캐시 조회 수 (not_modified 는 304 로 본문 없이 응답)",
+    ["endpoint", "result"],
+)
+
+
+# (endpoint, 요청 파라미터..., 버전) → 직렬화된 JSON 본문
+_memory_cache: TtlLruCache[tuple[Hashable, ...], bytes] | None = (
+    TtlLruCache(max_entries=settings.meeting_response_cache_max_entries)
+    if settings.meeting_response_cache_max_entries > 0
+    else None
+)
+
+
+async def get_cache_version(db: AsyncSession, name: str) -> int | None:
+    """현재 데이터 버전. 모든 워커가 같은 행을 보므로 다른 워커의 생성/삭제도 바로 반영된다.
+
+    버전 행이 없으면(마이그레이션 전, 없는 회의) None → 캐시/ETag 없이 처리.
+    """
+
+    result = await db.execute(select(CacheVersion.version).where(CacheVersion.name == name))
+    return result.scalar_one_or_none()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match(쉼표로 나열된 ETag 목록 또는 *)에 etag 가 있는지. 비교는 weak 비교(W/ 무시)."""
+
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def _json_response(body: bytes, etag: str | None) -> Response:
+    headers = {}
+    if etag is not None:
+        # 브라우저가 매번 If-None-Match 로 재검증하도록 (바뀌지 않았으면 304)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_meeting_response(
+    db: AsyncSession,
+    *,
+    endpoint: str,
+    version_key: str,
+    key: tuple[Hashable, ...],
+    if_none_match: str | None,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """version_key 의 버전을 ETag 로 쓰는 read-through 캐시.
+
+    요청 파라미터(cursor 등)는 호출 측이 먼저 검증해야 한다. 잘못된 요청이 304 로 응답되지 않도록.
+
+    - If-None-Match 가 현재 버전과 같으면 DB 조회/직렬화 없이 304
+    - 같은 버전의 같은 요청(endpoint + key)이 프로세스 캐시에 있으면 직렬화된 본문을 그대로 반환
+    - 없으면 build() 결과를 직렬화해 저장. 버전이 키에 들어가므로 쓰기 후에는 예전 항목이 적중하지 않고 LRU 로 밀려난다
+
+    버전을 본문보다 먼저 읽으므로, 사이에 커밋된 쓰기는 새 본문이 예전 버전으로 저장될 뿐 반대(새 버전에 예전 본문)는 생기지 않는다.
+    """
+
+    version = await get_cache_version(db, version_key)
+    if version is None:
+        MEETING_RESPONSE_CACHE_LOOKUPS.labels(endpoint=endpoint, result="bypass").inc()
+        return _json_response((await build()).model_dump_json().encode(), None)
+
+    etag = f'"{version}"'
+    if etag_matches(if_none_match, etag):
+        MEETING_RESPONSE_CACHE_LOOKUPS.labels(endpoint=endpoint, result="not_modified").inc()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    cache_key = (endpoint, *key, version)
+    body = _memory_cache.get(cache_key) if _memory_cache is not None else None
+    if body is None:
+        MEETING_RESPONSE_CACHE_LOOKUPS.labels(endpoint=endpoint, result="miss").inc()
+        body = (await build()).model_dump_json().encode()
+        if _memory_cache is not None:
+            _memory_cache.set(cache_key, body)
+    else:
+        MEETING_RESPONSE_CACHE_LOOKUPS.labels(endpoint=endpoint, result="hit").inc()
+    return _json_response(body, etag)
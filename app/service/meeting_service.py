@@ -1,129 +1,544 @@
 from __future__ import annotations
 
-from typing import List
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
 from uuid import UUID
+import base64
+import binascii
+import html
+import json
+import logging
+import re
+import zlib
 
-from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.db import get_db
+from app.config.db import AsyncSessionLocal, get_async_db
+from app.config.settings import get_settings
+from app.config.timing import timed
 from app.models.meeting import (
     MeetingDetailResponse,
+    MeetingExportRow,
     MeetingListItem,
+    MeetingListPage,
     MeetingRecordResponse,
+    MeetingSearchHit,
+    MeetingSearchPage,
+    MeetingSegmentItem,
+    MeetingSegmentPage,
 )
 from app.repository.meeting_respository import (
+    EXPORT_COLUMNS,
     create_meeting as repo_create_meeting,
     list_meetings as repo_list_meetings,
     get_meeting as repo_get_meeting,
+    get_meeting_transcript as repo_get_meeting_transcript,
     delete_meeting as repo_delete_meeting,
+    has_index,
+    list_meeting_segments as repo_list_meeting_segments,
+    search_meetings_fulltext,
+    search_meetings_substring,
+    stream_meetings as repo_stream_meetings,
+    update_meeting_summary as repo_update_meeting_summary,
 )
-from app.service.stt_service import transcribe
-from app.service.summary_service import summarize_meeting
+from app.service.audio_service import AudioBuffer
+from app.service.audio_store_service import release_audio, store_audio
+from app.service.meeting_cache_service import (
+    MEETING_LIST_CACHE_VERSION,
+    cached_meeting_response,
+    meeting_detail_cache_version,
+)
+from app.service.stt_service import TranscriptSegment, transcribe
+from app.service.summary_service import IncrementalSummarizer, stream_summary
+
 
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
 
 EMPTY_TRANSCRIPT_MESSAGE = "인식된 발화가 없습니다."
 
 
-def create_meeting(
-    db: Session,
+async def create_meeting(
+    db: AsyncSession,
     *,
     transcript: str,
     summary: str,
+    audio: AudioBuffer | Path | None = None,
+    segments: Sequence[TranscriptSegment] = (),
+    meeting_id: UUID | None = None,
 ) -> MeetingRecordResponse:
+    """회의를 저장한다. audio(업로드 원본 또는 보관 파일)가 있으면 재생용으로 함께 보관한다.
+
+    segments(transcribe 가 모은 세그먼트별 전사)는 GET /meetings/{id}/segments 용으로 함께 저장한다.
+    meeting_id 를 주면 그 ID 로 회의를 만든다.
+    """
+
     display_transcript = transcript.strip() if isinstance(transcript, str) else transcript
     if not display_transcript:
         display_transcript = EMPTY_TRANSCRIPT_MESSAGE
 
-    meeting = repo_create_meeting(
+    audio_sha256 = await store_audio(db, audio) if audio is not None else None
+    meeting = await repo_create_meeting(
         db,
         full_transcript=display_transcript,
         summary=summary,
+        audio_sha256=audio_sha256,
+        segments=[asdict(segment) for segment in segments],
+        meeting_id=meeting_id,
     )
 
     return MeetingRecordResponse(
         id=meeting.id,
-        transcript=meeting.full_transcript,
+        transcript=display_transcript,
         summary=meeting.summary,
     )
 
 
-def list_meetings_service(
-    db: Session,
+def _encode_cursor(*values: str | float | datetime | UUID) -> str:
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value if isinstance(value, (str, float)) else str(value) for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _parse_cursor_value(kind: type, value: object) -> object:
+    if kind is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("cursor rank")
+        return float(value)
+    # 나머지(datetime/UUID/int id/str)는 문자열로만 인코딩한다. UUID(5) 처럼 잘못된 타입은 ValueError 가 아닌 예외를 낸다
+    if not isinstance(value, str):
+        raise ValueError("cursor value")
+    if kind is datetime:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            raise ValueError("cursor without timezone")
+        return parsed
+    return kind(value)
+
+
+def _decode_cursor(cursor: str, *kinds: type) -> tuple:
+    """클라이언트는 cursor 를 그대로 돌려주기만 한다. 형식이 바뀌어도 API 는 그대로 유지할 수 있도록 내부 값은 감춘다."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(kinds):
+            raise ValueError("cursor length")
+        return tuple(_parse_cursor_value(kind, value) for kind, value in zip(kinds, values))
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 입니다.") from None
+
+
+def _page_limit(limit: int) -> int:
+    return max(1, min(limit, settings.meeting_list_max_limit))
+
+
+async def list_meetings_service(
+    db: AsyncSession,
     *,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 20,
-) -> List[MeetingListItem]:
-    meetings = repo_list_meetings(db, skip=skip, limit=limit)
+) -> MeetingListPage:
+    limit = _page_limit(limit)
+    after = _decode_cursor(cursor, datetime, UUID) if cursor else None
+    # 한 건 더 읽어 다음 페이지가 있는지 확인
+    rows = await repo_list_meetings(
+        db,
+        after=after,
+        limit=limit + 1,
+        preview_chars=settings.meeting_list_summary_preview_chars,
+    )
 
-    return [
+    items = [
         MeetingListItem(
             id=m.id,
             title=m.title,
             summary=m.summary,
             created_at=m.created_at,
         )
-        for m in meetings
+        for m in rows[:limit]
     ]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = _encode_cursor(items[-1].created_at, items[-1].id)
+    return MeetingListPage(items=items, next_cursor=next_cursor)
+
+
+# ts_headline 이 일치 부분을 감싸는 표시. 본문을 HTML escape 한 뒤 <mark> 로 바꾼다
+_MARK_START, _MARK_END = "\x02", "\x03"
+_HEADLINE_OPTIONS = (
+    f"MaxFragments=2, MaxWords=12, MinWords=4, FragmentDelimiter=\" … \", "
+    f"StartSel={_MARK_START}, StopSel={_MARK_END}"
+)
+# pg_trgm 은 3글자 미만 패턴에서 trigram 을 뽑지 못해 인덱스 대신 전체를 훑으므로 부분 문자열 검색에서 제외
+_TRIGRAM_MIN_CHARS = 3
+_SEARCH_FULLTEXT, _SEARCH_SUBSTRING = "fulltext", "substring"
+
+# ix_meeting_transcripts_trgm 존재 여부 (프로세스당 한 번 확인)
+_substring_search_available: bool | None = None
+
 
+def _search_terms(query: str) -> list[str]:
+    # to_tsquery 연산자(&, |, !, :, 괄호 등)는 버리고 단어만 남긴다
+    return re.findall(r"\w+", query)[:16]
 
-def get_meeting_service(
-    db: Session,
+
+def _render_snippet(text: str | None) -> str:
+    escaped = html.escape(text or "", quote=False)
+    return escaped.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def _highlight_terms(text: str | None, terms: list[str]) -> str:
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    marked = pattern.sub(lambda m: f"{_MARK_START}{m.group(0)}{_MARK_END}", text or "")
+    return _render_snippet(marked)
+
+
+async def _substring_available(db: AsyncSession) -> bool:
+    global _substring_search_available
+
+    if not settings.meeting_search_trigram_enabled:
+        return False
+    if _substring_search_available is None:
+        _substring_search_available = await has_index(db, "ix_meeting_transcripts_trgm")
+    return _substring_search_available
+
+
+async def search_meetings_service(
+    db: AsyncSession,
+    *,
+    query: str,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> MeetingSearchPage:
+    """제목/요약/전사 검색. 결과는 관련도 순, 다음 페이지는 next_cursor 로 이어서 조회한다.
+
+    1. 검색어마다 어절 접두어 검색 (search_vector GIN: "회의" → 회의, 회의에서, 회의록).
+       일치한 회의 중 최근 meeting_search_rank_window 개를 관련도(ts_rank_cd) 순으로
+    2. 1에 결과가 없고 pg_trgm 인덱스가 있으면 전사에서 어절 중간까지 부분 문자열 검색 (3글자 이상 검색어만). 최근 순
+    """
+
+    limit = _page_limit(limit)
+    terms = _search_terms(query)
+    if not terms:
+        return MeetingSearchPage(items=[])
+
+    if cursor:
+        mode, rank, created_at, meeting_id = _decode_cursor(cursor, str, float, datetime, UUID)
+        if mode not in (_SEARCH_FULLTEXT, _SEARCH_SUBSTRING):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 입니다.")
+        after = (rank, created_at, meeting_id)
+    else:
+        mode, after = _SEARCH_FULLTEXT, None
+
+    if mode == _SEARCH_FULLTEXT:
+        rows = await search_meetings_fulltext(
+            db,
+            terms=terms,
+            after=after,
+            limit=limit + 1,
+            rank_window=settings.meeting_search_rank_window,
+            headline_options=_HEADLINE_OPTIONS,
+        )
+        items = [
+            MeetingSearchHit(
+                id=row.id,
+                title=row.title,
+                created_at=row.created_at,
+                snippet=_render_snippet(row.snippet),
+                rank=row.rank,
+            )
+            for row in rows[:limit]
+        ]
+        if items or cursor or not all(len(term) >= _TRIGRAM_MIN_CHARS for term in terms):
+            next_cursor = None
+            if len(rows) > limit:
+                next_cursor = _encode_cursor(mode, items[-1].rank, items[-1].created_at, items[-1].id)
+            return MeetingSearchPage(items=items, next_cursor=next_cursor)
+        if not await _substring_available(db):
+            return MeetingSearchPage(items=[])
+
+    rows = await search_meetings_substring(
+        db,
+        terms=terms,
+        after=after[1:] if after is not None else None,
+        limit=limit + 1,
+    )
+    items = [
+        MeetingSearchHit(
+            id=row.id,
+            title=row.title,
+            created_at=row.created_at,
+            snippet=_highlight_terms(row.snippet, terms),
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = _encode_cursor(_SEARCH_SUBSTRING, 0.0, items[-1].created_at, items[-1].id)
+    return MeetingSearchPage(items=items, next_cursor=next_cursor)
+
+
+async def get_meeting_service(
+    db: AsyncSession,
     *,
     meeting_id: UUID,
 ) -> MeetingDetailResponse:
-    meeting = repo_get_meeting(db, meeting_id=meeting_id)
+    meeting = await repo_get_meeting(db, meeting_id=meeting_id)
     if meeting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+    # 전사 전문은 상세 조회에서만 따로 읽는다
+    transcript = await repo_get_meeting_transcript(db, meeting_id=meeting_id)
 
     return MeetingDetailResponse(
         id=meeting.id,
         title=meeting.title,
-        full_transcript=meeting.full_transcript,
+        full_transcript=transcript,
         summary=meeting.summary,
         created_at=meeting.created_at,
         updated_at=meeting.updated_at,
+        audio_url=f"/meetings/{meeting.id}/audio" if meeting.audio_sha256 else None,
     )
 
 
-def delete_meeting_service(
-    db: Session,
+async def list_meeting_segments_service(
+    db: AsyncSession,
+    *,
+    meeting_id: UUID,
+    start: float | None = None,
+    end: float | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> MeetingSegmentPage:
+    """녹음의 [start, end) 초 구간과 겹치는 세그먼트를 시각 순으로 페이지 단위로 반환한다 (전사 전문은 읽지 않음)."""
+
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start 는 end 보다 작아야 합니다.")
+    meeting = await repo_get_meeting(db, meeting_id=meeting_id)
+    if meeting is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+
+    limit = _page_limit(limit)
+    after = _decode_cursor(cursor, float, int) if cursor else None
+    rows = await repo_list_meeting_segments(
+        db,
+        meeting_id=meeting_id,
+        start_seconds=start,
+        end_seconds=end,
+        after=after,
+        limit=limit + 1,
+    )
+
+    items = [
+        MeetingSegmentItem(
+            start=row.start_seconds,
+            end=row.start_seconds + row.duration_seconds,
+            text=row.text,
+            backend=row.backend,
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = _encode_cursor(last.start_seconds, last.id)
+    return MeetingSegmentPage(items=items, next_cursor=next_cursor)
+
+
+async def delete_meeting_service(
+    db: AsyncSession,
     *,
     meeting_id: UUID,
 ) -> None:
-    deleted = repo_delete_meeting(db, meeting_id=meeting_id)
+    deleted, audio_sha256 = await repo_delete_meeting(db, meeting_id=meeting_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+    if audio_sha256 is not None:
+        await release_audio(db, sha256=audio_sha256)
+
+
+async def get_summary_source(db: AsyncSession, *, meeting_id: UUID) -> str:
+    """요약할 회의 전사를 반환. 회의가 없으면 404, 실시간 녹음이 아직 끝나지 않았으면 409."""
+
+    transcript = await repo_get_meeting_transcript(db, meeting_id=meeting_id)
+    if transcript is None:
+        if await repo_get_meeting(db, meeting_id=meeting_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="아직 전사가 끝나지 않은 회의입니다.")
+
+    # 발화가 없을 때 저장하는 안내 문구는 요약하지 않는다
+    return "" if transcript == EMPTY_TRANSCRIPT_MESSAGE else transcript
+
+
+def _sse(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def stream_meeting_summary(*, meeting_id: UUID, transcript: str) -> AsyncIterator[str]:
+    """요약 토큰을 SSE(event: delta)로 전달하고, 끝까지 생성되면 Meeting.summary 에 저장한 뒤 done 이벤트를 보낸다.
+
+    중간에 클라이언트가 끊기면 저장하지 않는다 (다음 조회 때 다시 생성, 완료된 요약은 캐시에서 재사용).
+    """
+
+    parts: list[str] = []
+    try:
+        async for text in stream_summary(transcript):
+            parts.append(text)
+            yield _sse("delta", {"text": text})
+    except HTTPException as exc:
+        logger.warning("summary stream for %s failed: %s", meeting_id, exc.detail)
+        yield _sse("error", {"detail": exc.detail})
+        return
+
+    summary = "".join(parts).strip()
+    async with AsyncSessionLocal() as db:
+        await repo_update_meeting_summary(db, meeting_id=meeting_id, summary=summary)
+    yield _sse("done", {"id": str(meeting_id), "summary": summary})
+
+
+def parse_export_fields(fields: str | None) -> list[str]:
+    """쉼표로 구분한 내보내기 컬럼. 없으면 전체. 모르는 컬럼이 있으면 스트리밍을 시작하기 전에 400."""
+
+    if not fields:
+        return list(EXPORT_COLUMNS)
+    selected = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in selected if field not in EXPORT_COLUMNS and field not in ("id", "created_at")]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 fields: {', '.join(unknown)} (가능: {', '.join(EXPORT_COLUMNS)})",
+        )
+    return [field for field in selected if field in EXPORT_COLUMNS]
+
+
+async def export_meetings_ndjson(
+    *,
+    fields: list[str],
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """회의를 오래된 순으로 한 줄에 하나씩(NDJSON) 내보낸다.
+
+    응답이 끝날 때까지 이어지므로 요청 세션이 아닌 자체 세션을 연다. 서버 측 cursor 에서 meeting_export_batch_size 행씩
+    읽어 바로 보내므로 메모리 사용량은 전체 건수와 관계없이 일정하다. gzip 이면 배치마다 sync flush 해 압축 중에도
+    받은 줄까지 바로 풀 수 있다.
+    """
+
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if gzip else None
+    async with AsyncSessionLocal() as db:
+        async for rows in repo_stream_meetings(
+            db,
+            fields=fields,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=settings.meeting_export_batch_size,
+        ):
+            chunk = "".join(
+                MeetingExportRow(**row._mapping).model_dump_json(exclude_unset=True) + "\n" for row in rows
+            ).encode()
+            if compressor is not None:
+                chunk = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
 
 
 class MeetingService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
-    async def record_meeting(self, *, audio_bytes: bytes, duration_seconds: float) -> MeetingRecordResponse:
-        """STT + 요약 + 회의 저장까지 한 번에 처리하는 고수준 유즈케이스."""
+    async def record_meeting(
+        self,
+        *,
+        audio_bytes: AudioBuffer,
+        duration_seconds: float | None = None,
+    ) -> MeetingRecordResponse:
+        """STT + 요약 + 회의 저장까지 한 번에 처리하는 고수준 유즈케이스.
+
+        긴 녹음은 전사가 끝난 세그먼트부터 요약을 시작한다 (IncrementalSummarizer).
+        """
+
+        segments: list[TranscriptSegment] = []
+        async with IncrementalSummarizer() as summarizer:
+            transcript = await transcribe(
+                audio_bytes=audio_bytes,
+                db=self._db,
+                duration_seconds=duration_seconds,
+                # 사용자가 결과를 기다리는 동기 요청이므로 hedging 대상
+                latency_critical=True,
+                on_segment=summarizer.add,
+                segments=segments,
+            )
 
-        transcript = await transcribe(
-            audio_bytes=audio_bytes,
-            db=self._db,
-            duration_seconds=duration_seconds,
+            # 파이프라인 모드에서는 STT 와 겹치지 않은 나머지(마지막 구간 + reduce)만 측정된다
+            with timed("summary"):
+                summary = await summarizer.finish(transcript)
+
+        with timed("db"):
+            return await create_meeting(
+                self._db, transcript=transcript, summary=summary, audio=audio_bytes, segments=segments
+            )
+
+    async def list_meetings(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        if_none_match: str | None = None,
+    ) -> Response:
+        """목록 페이지 JSON. 회의가 생성/삭제/수정되지 않았으면 캐시된 본문 또는 304 를 반환한다."""
+
+        # 잘못된 cursor 는 버전이 같아도 304 가 아니라 400
+        if cursor:
+            _decode_cursor(cursor, datetime, UUID)
+        return await cached_meeting_response(
+            self._db,
+            endpoint="list",
+            version_key=MEETING_LIST_CACHE_VERSION,
+            key=(cursor, _page_limit(limit)),
+            if_none_match=if_none_match,
+            build=lambda: list_meetings_service(self._db, cursor=cursor, limit=limit),
         )
 
-        summary = await summarize_meeting(transcript)
+    async def search_meetings(self, *, query: str, cursor: str | None = None, limit: int = 20) -> MeetingSearchPage:
+        return await search_meetings_service(self._db, query=query, cursor=cursor, limit=limit)
 
-        return create_meeting(self._db, transcript=transcript, summary=summary)
+    async def get_meeting(self, *, meeting_id: UUID, if_none_match: str | None = None) -> Response:
+        """회의 상세 JSON. 없는 회의의 404 는 캐시하지 않는다."""
 
-    def list_meetings(self, *, skip: int = 0, limit: int = 20) -> List[MeetingListItem]:
-        return list_meetings_service(self._db, skip=skip, limit=limit)
+        return await cached_meeting_response(
+            self._db,
+            endpoint="detail",
+            version_key=meeting_detail_cache_version(meeting_id),
+            key=(meeting_id,),
+            if_none_match=if_none_match,
+            build=lambda: get_meeting_service(self._db, meeting_id=meeting_id),
+        )
 
-    def get_meeting(self, *, meeting_id: UUID) -> MeetingDetailResponse:
-        return get_meeting_service(self._db, meeting_id=meeting_id)
+    async def list_segments(
+        self,
+        *,
+        meeting_id: UUID,
+        start: float | None = None,
+        end: float | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> MeetingSegmentPage:
+        return await list_meeting_segments_service(
+            self._db, meeting_id=meeting_id, start=start, end=end, cursor=cursor, limit=limit
+        )
 
-    def delete_meeting(self, *, meeting_id: UUID) -> None:
-        delete_meeting_service(self._db, meeting_id=meeting_id)
+    async def delete_meeting(self, *, meeting_id: UUID) -> None:
+        await delete_meeting_service(self._db, meeting_id=meeting_id)
 
 
-def get_meeting_service_dep(db: Session = Depends(get_db)) -> MeetingService:
+def get_meeting_service_dep(db: AsyncSession = Depends(get_async_db)) -> MeetingService:
     """FastAPI DI용 MeetingService provider."""
 
     return MeetingService(db)
\ No newline at end of file
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import logging
+import time
+import uuid
+
+from prometheus_client import Counter
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Update
+
+from app.config.settings import get_settings
+from app.models.models import SttQuotaReservation, SttUsage, SttUsageMonthly
+from app.service.cache_service import TtlLruCache
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+QUOTA_RESERVATIONS = Counter(
+    "meeting_stt_quota_reservations_total",
+    "STT 쿼터 예약 처리 수",
+    ["provider", "result"],
+)
+
+# 만료 예약 회수는 예약할 때마다가 아니라 일정 간격으로만 수행
+_SWEEP_INTERVAL_SECONDS = 60.0
+_last_swept_at = 0.0
+
+
+@dataclass(frozen=True)
+class QuotaUsage:
+    used_seconds: float
+    reserved_seconds: float
+
+    @property
+    def used_hours(self) -> float:
+        return self.used_seconds / 3600.0
+
+    @property
+    def reserved_hours(self) -> float:
+        return self.reserved_seconds / 3600.0
+
+
+@dataclass(frozen=True)
+class QuotaReservation:
+    id: uuid.UUID
+    provider: str
+    month: date
+    seconds: float
+
+
+# 조회(관리 화면 polling 등)용 현재 월 사용량 캐시. 쿼터 예약 자체는 항상 DB 에서 원자적으로 판정한다.
+_usage_cache: TtlLruCache[tuple[str, date], QuotaUsage] = TtlLruCache(
+    max_entries=16,
+    ttl_seconds=settings.stt_quota_cache_seconds,
+)
+
+
+def current_month(now: datetime | None = None) -> date:
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return date(now.year, now.month, 1)
+
+
+def month_range(month: date) -> tuple[datetime, datetime]:
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    if month.month == 12:
+        end = datetime(month.year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        end = datetime(month.year, month.month + 1, 1, tzinfo=timezone.utc)
+    return start, end
+
+
+def _create_rollup(db: Session, provider: str, month: date) -> None:
+    """해당 월 rollup 행을 만든다. 기존 stt_usage 이력은 이때 한 번만 SUM 해서 채운다."""
+
+    start, end = month_range(month)
+    backfill = select(
+        literal(provider),
+        literal(month),
+        func.coalesce(func.sum(SttUsage.duration_seconds), 0.0),
+        literal(0.0),
+    ).where(
+        SttUsage.provider == provider,
+        SttUsage.occurred_at >= start,
+        SttUsage.occurred_at < end,
+    )
+    stmt = (
+        insert(SttUsageMonthly)
+        .from_select(["provider", "month", "used_seconds", "reserved_seconds"], backfill)
+        .on_conflict_do_nothing(index_elements=[SttUsageMonthly.provider, SttUsageMonthly.month])
+    )
+    db.execute(stmt)
+
+
+def _rollup_exists(db: Session, provider: str, month: date) -> bool:
+    stmt = select(literal(1)).where(
+        SttUsageMonthly.provider == provider,
+        SttUsageMonthly.month == month,
+    )
+    return db.execute(stmt).first() is not None
+
+
+def _update_rollup(db: Session, provider: str, month: date, stmt: Update):
+    """rollup 행에 조건부 UPDATE ... RETURNING 을 실행. 월의 첫 요청이면 행을 만든 뒤 한 번 더 실행."""
+
+    row = db.execute(stmt).one_or_none()
+    if row is None and not _rollup_exists(db, provider, month):
+        _create_rollup(db, provider, month)
+        row = db.execute(stmt).one_or_none()
+    return row
+
+
+def get_quota_usage(db: Session, provider: str, now: datetime | None = None) -> QuotaUsage:
+    """월 사용량/예약량. rollup 행 하나만 읽고, stt_quota_cache_seconds 동안 프로세스 내에 캐시한다."""
+
+    month = current_month(now)
+    cached = _usage_cache.get((provider, month))
+    if cached is not None:
+        return cached
+
+    row = db.get(SttUsageMonthly, (provider, month), populate_existing=True)
+    if row is None:
+        _create_rollup(db, provider, month)
+        db.commit()
+        row = db.get(SttUsageMonthly, (provider, month), populate_existing=True)
+
+    usage = QuotaUsage(used_seconds=row.used_seconds, reserved_seconds=row.reserved_seconds)
+    _usage_cache.set((provider, month), usage)
+    return usage
+
+
+def reserve_quota(
+    db: Session,
+    provider: str,
+    seconds: float,
+    *,
+    limit_seconds: float,
+) -> QuotaReservation | None:
+    """used + reserved + seconds 가 한도 이내일 때만 seconds 만큼 예약한다. 한도를 넘으면 None.
+
+    판정과 증가를 한 UPDATE 문으로 처리하므로 여러 워커가 동시에 예약해도 한도를 넘지 않는다.
+    """
+
+    _release_expired(db)
+
+    month = current_month()
+    stmt = (
+        update(SttUsageMonthly)
+        .where(
+            SttUsageMonthly.provider == provider,
+            SttUsageMonthly.month == month,
+            SttUsageMonthly.used_seconds + SttUsageMonthly.reserved_seconds + seconds <= limit_seconds,
+        )
+        .values(reserved_seconds=SttUsageMonthly.reserved_seconds + seconds)
+        .returning(SttUsageMonthly.used_seconds, SttUsageMonthly.reserved_seconds)
+    )
+    row = _update_rollup(db, provider, month, stmt)
+    if row is None:
+        db.commit()
+        _usage_cache.pop((provider, month))
+        QUOTA_RESERVATIONS.labels(provider=provider, result="rejected").inc()
+        return None
+
+    reservation = SttQuotaReservation(
+        id=uuid.uuid4(),
+        provider=provider,
+        month=month,
+        seconds=seconds,
+        expires_at=datetime.now(timezone.utc)
+        + timedelta(seconds=settings.stt_quota_reservation_ttl_seconds),
+    )
+    db.add(reservation)
+    db.commit()
+
+    _usage_cache.set(
+        (provider, month),
+        QuotaUsage(used_seconds=row.used_seconds, reserved_seconds=row.reserved_seconds),
+    )
+    QUOTA_RESERVATIONS.labels(provider=provider, result="granted").inc()
+    return QuotaReservation(id=reservation.id, provider=provider, month=month, seconds=seconds)
+
+
+def _add_used_seconds(db: Session, provider: str, seconds: float) -> None:
+    month = current_month()
+    stmt = (
+        update(SttUsageMonthly)
+        .where(SttUsageMonthly.provider == provider, SttUsageMonthly.month == month)
+        .values(used_seconds=SttUsageMonthly.used_seconds + seconds)
+        .returning(SttUsageMonthly.used_seconds)
+    )
+    _update_rollup(db, provider, month, stmt)
+    db.add(SttUsage(provider=provider, duration_seconds=seconds))
+    _usage_cache.pop((provider, month))
+
+
+def _unreserve(db: Session, provider: str, month: date, seconds: float) -> None:
+    db.execute(
+        update(SttUsageMonthly)
+        .where(SttUsageMonthly.provider == provider, SttUsageMonthly.month == month)
+        .values(reserved_seconds=func.greatest(SttUsageMonthly.reserved_seconds - seconds, 0.0))
+    )
+    _usage_cache.pop((provider, month))
+
+
+def commit_quota(db: Session, reservation: QuotaReservation, used_seconds: float) -> None:
+    """예약을 실제 사용량(used_seconds)으로 확정한다. 0 이면 예약만 해제.
+
+    예약보다 적게 썼으면(실패한 세그먼트, 다른 백엔드로 failover 등) 차액은 자동으로 반환된다.
+    """
+
+    deleted = db.execute(
+        delete(SttQuotaReservation)
+        .where(SttQuotaReservation.id == reservation.id)
+        .returning(SttQuotaReservation.seconds)
+    ).one_or_none()
+    # 만료되어 이미 회수된 예약이면 reserved 는 건드리지 않는다
+    if deleted is not None:
+        _unreserve(db, reservation.provider, reservation.month, deleted.seconds)
+
+    if used_seconds > 0:
+        _add_used_seconds(db, reservation.provider, used_seconds)
+    db.commit()
+
+    result = "committed" if used_seconds > 0 else "released"
+    QUOTA_RESERVATIONS.labels(provider=reservation.provider, result=result).inc()
+
+
+def release_quota(db: Session, reservation: QuotaReservation) -> None:
+    commit_quota(db, reservation, 0.0)
+
+
+def record_usage(db: Session, provider: str, seconds: float) -> None:
+    """예약 없이 사용량을 바로 기록 (rollup 과 stt_usage 이력을 같은 트랜잭션에서 갱신)."""
+
+    _add_used_seconds(db, provider, seconds)
+    db.commit()
+
+
+def _release_expired(db: Session) -> None:
+    """워커가 죽어 확정/해제되지 못한 예약을 회수. DELETE ... RETURNING 이라 여러 워커가 동시에 돌려도 한 번만 반환된다."""
+
+    global _last_swept_at
+
+    now = time.monotonic()
+    if now - _last_swept_at < _SWEEP_INTERVAL_SECONDS:
+        return
+    _last_swept_at = now
+
+    expired = db.execute(
+        delete(SttQuotaReservation)
+        .where(SttQuotaReservation.expires_at < datetime.now(timezone.utc))
+        .returning(SttQuotaReservation.provider, SttQuotaReservation.month, SttQuotaReservation.seconds)
+    ).all()
+    for row in expired:
+        _unreserve(db, row.provider, row.month, row.seconds)
+        QUOTA_RESERVATIONS.labels(provider=row.provider, result="expired").inc()
+    if expired:
+        logger.warning("released %d expired STT quota reservations", len(expired))
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import asyncio
+import json
+import logging
+
+import numpy as np
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
+from prometheus_client import Counter, Histogram
+
+from app.config.db import AsyncSessionLocal
+from app.config.settings import get_settings
+from app.repository.meeting_respository import finish_meeting, start_meeting
+from app.service.audio_service import PcmAudio, resample, run_in_audio_pool, split_on_silence
+from app.service.meeting_service import EMPTY_TRANSCRIPT_MESSAGE
+from app.service.stt_service import TranscriptSegment, to_source_timeline, transcribe_audio
+from app.service.summary_service import IncrementalSummarizer
+from app.service.vad_service import SpeechAudio, detect_speech_regions, extract_speech
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+REALTIME_SEGMENTS = Counter(
+    "meeting_stt_realtime_segments_total",
+    "실시간 스트리밍에서 잘라낸 세그먼트 수",
+    ["result"],
+)
+REALTIME_FINALIZE_SECONDS = Histogram(
+    "meeting_stt_realtime_finalize_seconds",
+    "스트림 종료(stop) 후 최종 전사/요약 저장까지 걸린 시간",
+)
+
+# 클라이언트가 보낼 수 있는 입력 샘플레이트 범위
+_MIN_SAMPLE_RATE = 8000
+_MAX_SAMPLE_RATE = 192000
+
+
+@dataclass(frozen=True)
+class StreamSegment:
+    index: int
+    start_seconds: float
+    audio: PcmAudio
+
+    @property
+    def end_seconds(self) -> float:
+        return self.start_seconds + self.audio.duration_seconds
+
+
+class SegmentCutter:
+    """들어오는 PCM 을 모아 두었다가 발화가 끝난(무음이 이어지는) 지점에서 세그먼트로 잘라낸다.
+
+    - 누적 길이가 stt_realtime_min_segment_seconds 이상이고 마지막 발화 구간 뒤로
+      stt_realtime_silence_ms 이상 무음이 이어지면 그 발화 끝에서 자른다
+    - 계속 말해서 stt_segment_max_seconds 를 넘기면 split_on_silence 로 에너지가 가장 낮은 지점에서 자른다
+    - 발화가 전혀 없는 구간은 전사하지 않고 버린다
+    판정은 새 오디오가 stt_realtime_check_ms 만큼 쌓일 때마다만 수행한다.
+
+    push 는 버퍼에 붙이기만 하고, 판정(cut)과 flush 는 CPU 작업이라 호출 측이 오디오 스레드 풀에서 실행한다.
+    스레드 안전하지 않으므로 한 번에 하나의 호출만 진행해야 한다.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        self.sample_rate = sample_rate
+        self._chunks: list[np.ndarray] = []
+        self._pending_frames = 0
+        self._unchecked_frames = 0
+        # 스트림 시작 기준 pending 오디오의 시작 프레임
+        self._offset_frames = 0
+        self._next_index = 0
+        self._check_frames = sample_rate * settings.stt_realtime_check_ms // 1000
+        self._silence_frames = sample_rate * settings.stt_realtime_silence_ms // 1000
+        self._min_frames = int(sample_rate * settings.stt_realtime_min_segment_seconds)
+
+    @property
+    def received_seconds(self) -> float:
+        return (self._offset_frames + self._pending_frames) / float(self.sample_rate)
+
+    def push(self, pcm: np.ndarray) -> bool:
+        """PCM 을 버퍼에 붙인다. 판정할 만큼 새 오디오가 쌓였으면 True (이때 cut 을 호출)."""
+
+        if len(pcm) == 0:
+            return False
+        self._chunks.append(pcm)
+        self._pending_frames += len(pcm)
+        self._unchecked_frames += len(pcm)
+        if self._unchecked_frames < self._check_frames:
+            return False
+        self._unchecked_frames = 0
+        return True
+
+    def flush(self) -> list[StreamSegment]:
+        """스트림 종료 시 남은 오디오를 마지막 세그먼트로 내보낸다."""
+
+        pending = self._pending()
+        self._chunks = []
+        self._pending_frames = 0
+        if pending.num_frames == 0:
+            return []
+        return [self._emit(pending)]
+
+    def _pending(self) -> PcmAudio:
+        samples = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.int16)
+        return PcmAudio(samples=samples.reshape(-1, 1), sample_rate=self.sample_rate)
+
+    def _emit(self, audio: PcmAudio) -> StreamSegment:
+        segment = StreamSegment(
+            index=self._next_index,
+            start_seconds=self._offset_frames / float(self.sample_rate),
+            audio=audio,
+        )
+        self._next_index += 1
+        return segment
+
+    def _advance(self, pending: PcmAudio, frames: int) -> PcmAudio:
+        self._offset_frames += frames
+        return pending.slice_frames(frames, pending.num_frames)
+
+    def cut(self) -> list[StreamSegment]:
+        pending = self._pending()
+        segments: list[StreamSegment] = []
+
+        while pending.num_frames >= self._min_frames:
+            if pending.duration_seconds >= settings.stt_segment_max_seconds:
+                first = split_on_silence(
+                    pending,
+                    max_seconds=settings.stt_segment_max_seconds,
+                    min_seconds=settings.stt_realtime_min_segment_seconds,
+                )[0]
+                segments.append(self._emit(first))
+                pending = self._advance(pending, first.num_frames)
+                continue
+
+            regions = detect_speech_regions(pending)
+            if not regions:
+                # 발화 없이 무음만 쌓였으면 버리되, 막 시작된 발화가 잘리지 않게 끝부분은 남긴다
+                pending = self._advance(pending, pending.num_frames - self._silence_frames)
+                break
+
+            speech_end = regions[-1][1]
+            if pending.num_frames - speech_end < self._silence_frames:
+                break
+            segments.append(self._emit(pending.slice_frames(0, speech_end)))
+            pending = self._advance(pending, speech_end)
+
+        # 남은 오디오만 새 배열로 복사해 두고, 잘라낸 세그먼트가 큰 버퍼를 붙잡지 않게 한다
+        self._chunks = [pending.samples[:, 0].copy()] if pending.num_frames else []
+        self._pending_frames = pending.num_frames
+        return segments
+
+
+def _normalize_segment(audio: PcmAudio) -> tuple[PcmAudio, SpeechAudio | None]:
+    """세그먼트를 STT 입력 형태(stt_target_sample_rate, 무음 제거)로 변환. 오디오 스레드 풀에서 실행.
+
+    무음을 제거했으면 전사 세그먼트 시각을 스트림 기준으로 되돌릴 수 있도록 SpeechAudio 도 반환한다.
+    """
+
+    audio = resample(audio, settings.stt_target_sample_rate, downmix=True)
+    if not settings.stt_vad_enabled:
+        return audio, None
+    speech = extract_speech(audio)
+    return speech.audio, speech
+
+
+class RealtimeSession:
+    """WebSocket 하나에 대응하는 실시간 전사 세션.
+
+    프로토콜:
+    - 클라이언트 → 서버: binary 메시지는 16bit little-endian mono PCM (sample_rate 는 접속 query 로 지정),
+      text 메시지 {"type": "stop"} 은 녹음 종료
+    - 서버 → 클라이언트: {"type": "started", "meeting_id"}, 세그먼트마다 {"type": "partial", "index", "start", "end", "text"},
+      종료 시 {"type": "final", "meeting_id", "transcript", "summary"}, 오류 시 {"type": "error", "detail"}
+    - defer_summary=True 이면 요약하지 않고 summary=null 로 final 을 보낸다.
+      클라이언트가 GET /meetings/{id}/summary/stream(SSE)으로 요약을 받아 저장한다.
+    """
+
+    def __init__(self, websocket: WebSocket, sample_rate: int, *, defer_summary: bool = False) -> None:
+        self._websocket = websocket
+        self._defer_summary = defer_summary
+        self._cutter = SegmentCutter(sample_rate)
+        self._semaphore = asyncio.Semaphore(max(1, settings.stt_segment_concurrency))
+        self._send_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+        # 오디오 스레드 풀에서 진행 중인 cutter 판정
+        self._cutting: asyncio.Future | None = None
+        self._texts: dict[int, str] = {}
+        self._segments: dict[int, list[TranscriptSegment]] = {}
+        # 긴 회의는 녹음 중에 구간 요약을 진행해 두고 종료 후에는 마지막 구간 + reduce 만 남긴다
+        self._summarizer = IncrementalSummarizer()
+        self._connected = True
+
+    async def _send(self, event: dict) -> None:
+        if not self._connected:
+            return
+        try:
+            async with self._send_lock:
+                await self._websocket.send_text(json.dumps(event, ensure_ascii=False))
+        except (WebSocketDisconnect, RuntimeError):
+            self._connected = False
+
+    def _schedule(self, segments: list[StreamSegment]) -> None:
+        for segment in segments:
+            self._tasks.append(asyncio.create_task(self._transcribe(segment)))
+
+    async def _transcribe(self, segment: StreamSegment) -> None:
+        async with self._semaphore:
+            audio, speech = await run_in_audio_pool(_normalize_segment, segment.audio)
+            if audio.num_frames == 0:
+                REALTIME_SEGMENTS.labels(result="silent").inc()
+                self._summarizer.add(segment.index, "")
+                return
+
+            # 세그먼트 작업이 동시에 돌기 때문에 DB 세션은 작업마다 따로 연다
+            timed: list[TranscriptSegment] = []
+            async with AsyncSessionLocal() as db:
+                try:
+                    text = await transcribe_audio(audio, db, latency_critical=True, segments=timed)
+                except HTTPException as exc:
+                    REALTIME_SEGMENTS.labels(result="error").inc()
+                    logger.warning("realtime segment %d failed: %s", segment.index, exc.detail)
+                    self._summarizer.add(segment.index, "")
+                    await self._send({"type": "error", "index": segment.index, "detail": exc.detail})
+                    return
+
+        REALTIME_SEGMENTS.labels(result="transcribed").inc()
+        text = text.strip()
+        self._texts[segment.index] = text
+        self._segments[segment.index] = to_source_timeline(timed, speech, offset_seconds=segment.start_seconds)
+        if not self._defer_summary:
+            self._summarizer.add(segment.index, text)
+        await self._send(
+            {
+                "type": "partial",
+                "index": segment.index,
+                "start": round(segment.start_seconds, 2),
+                "end": round(segment.end_seconds, 2),
+                "text": text,
+            }
+        )
+
+    async def _cut(self) -> list[StreamSegment]:
+        # 수신 루프가 결과를 기다린 뒤에야 다음 PCM 을 넣으므로 cutter 는 한 번에 한 스레드만 다룬다.
+        # 수신 루프가 취소돼도 스레드의 판정은 계속되므로 shield 해 두고 flush 전에 끝나기를 기다린다
+        self._cutting = asyncio.ensure_future(run_in_audio_pool(self._cutter.cut))
+        return await asyncio.shield(self._cutting)
+
+    async def _receive(self) -> None:
+        """stop 메시지나 연결 종료까지 PCM 을 받아 세그먼트로 잘라 전사를 시작한다."""
+
+        while True:
+            message = await self._websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                self._connected = False
+                return
+
+            data = message.get("bytes")
+            if data is not None:
+                usable = len(data) - len(data) % 2
+                pcm = np.frombuffer(data[:usable], dtype="<i2")
+                if self._cutter.push(pcm):
+                    self._schedule(await self._cut())
+                continue
+
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except ValueError:
+                control = {}
+            if control.get("type") == "stop":
+                return
+
+    async def run(self) -> None:
+        started_at = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            meeting = await start_meeting(db, started_at=started_at)
+        meeting_id = meeting.id
+        await self._send({"type": "started", "meeting_id": str(meeting_id)})
+
+        try:
+            await self._receive()
+        except WebSocketDisconnect:
+            self._connected = False
+        finally:
+            # 종료 후에는 마지막 세그먼트만 전사하면 되므로 최종 결과까지의 시간이 짧다
+            stopped = asyncio.get_running_loop().time()
+            if self._cutting is not None and not self._cutting.done():
+                self._schedule(await self._cutting)
+            self._schedule(await run_in_audio_pool(self._cutter.flush))
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+            transcript = " ".join(
+                self._texts[index] for index in sorted(self._texts) if self._texts[index]
+            )
+            summary: str | None = None
+            if transcript and not self._defer_summary:
+                try:
+                    summary = await self._summarizer.finish(transcript)
+                except HTTPException as exc:
+                    # 요약이 실패해도 전사 결과는 저장한다
+                    logger.warning("realtime summary failed for %s: %s", meeting_id, exc.detail)
+            await self._summarizer.aclose()
+
+            async with AsyncSessionLocal() as db:
+                await finish_meeting(
+                    db,
+                    meeting_id=meeting_id,
+                    ended_at=datetime.now(timezone.utc),
+                    full_transcript=transcript or EMPTY_TRANSCRIPT_MESSAGE,
+                    summary=summary,
+                    segments=[
+                        asdict(item) for index in sorted(self._segments) for item in self._segments[index]
+                    ],
+                )
+            REALTIME_FINALIZE_SECONDS.observe(asyncio.get_running_loop().time() - stopped)
+            logger.info(
+                "realtime meeting %s finalized (%.1fs audio, %d segments)",
+                meeting_id,
+                self._cutter.received_seconds,
+                len(self._tasks),
+            )
+
+        await self._send(
+            {
+                "type": "final",
+                "meeting_id": str(meeting_id),
+                "transcript": transcript or EMPTY_TRANSCRIPT_MESSAGE,
+                "summary": summary,
+            }
+        )
+        if self._connected:
+            await self._websocket.close()
+
+
+async def run_realtime_session(websocket: WebSocket, *, sample_rate: int, defer_summary: bool = False) -> None:
+    await websocket.accept()
+    if not _MIN_SAMPLE_RATE <= sample_rate <= _MAX_SAMPLE_RATE:
+        await websocket.send_text(
+            json.dumps({"type": "error", "detail": f"지원하지 않는 sample_rate 입니다: {sample_rate}"})
+        )
+        await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+        return
+
+    await RealtimeSession(websocket, sample_rate, defer_summary=defer_summary).run()
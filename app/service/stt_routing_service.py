@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+import asyncio
+import logging
+import time
+
+from fastapi import HTTPException
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config.settings import get_settings
+from app.service.audio_service import PcmAudio
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+STT_BACKEND_LATENCY = Histogram(
+    "meeting_stt_backend_latency_seconds",
+    "STT 백엔드 호출 지연 시간 (세그먼트 단위)",
+    ["backend", "outcome"],
+)
+STT_CIRCUIT_STATE = Gauge(
+    "meeting_stt_backend_circuit_open",
+    "STT 백엔드 circuit breaker 상태 (0=closed, 1=open, 0.5=half-open)",
+    ["backend"],
+)
+STT_HEDGED_REQUESTS = Counter(
+    "meeting_stt_hedged_requests_total",
+    "지연 대비 보조 백엔드로 보낸 hedged 요청 수",
+    ["winner"],
+)
+
+
+@dataclass(frozen=True)
+class SegmentText:
+    """백엔드 호출 한 번의 전사 결과.
+
+    offset/duration 은 보낸 오디오 안에서 인식된 발화 구간(초)이며, 백엔드가 알려주지 않으면 None.
+    """
+
+    text: str
+    offset_seconds: float | None = None
+    duration_seconds: float | None = None
+
+
+SegmentCall = Callable[[PcmAudio], Awaitable[SegmentText]]
+
+
+class SttBackendError(HTTPException):
+    """STT 백엔드 호출 실패 (502).
+
+    retryable 은 5xx/429/네트워크 오류처럼 다른 백엔드로 넘기거나 다시 시도할 만한 실패인지 여부이며,
+    circuit breaker 는 retryable 실패만 센다. (인증 오류 등 4xx 는 재시도해도 결과가 같음)
+    """
+
+    def __init__(self, detail: str, *, retryable: bool, upstream_status: int | None = None) -> None:
+        super().__init__(status_code=502, detail=detail)
+        self.retryable = retryable
+        self.upstream_status = upstream_status
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class BackendHealth:
+    """백엔드별 최근 지연/오류 통계와 circuit breaker 상태.
+
+    지연은 세그먼트 길이에 비례하므로 오디오 1초당 처리 시간(real-time factor)으로 저장한다.
+    샘플은 (시각, 값) 으로 저장하고 stt_router_window_seconds 가 지난 것은 통계에서 빼서,
+    후순위로 밀려 요청을 받지 못하는 백엔드도 시간이 지나면 다시 1순위 후보가 되도록 한다.
+    """
+
+    backend: str
+    rtf_samples: deque[tuple[float, float]] = field(
+        default_factory=lambda: deque(maxlen=settings.stt_router_window)
+    )
+    outcomes: deque[tuple[float, bool]] = field(
+        default_factory=lambda: deque(maxlen=settings.stt_router_window)
+    )
+    consecutive_failures: int = 0
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probe_in_flight: bool = False
+
+    @staticmethod
+    def _recent(samples: deque, now: float) -> list:
+        since = now - settings.stt_router_window_seconds
+        return [value for at, value in samples if at >= since]
+
+    def rtf_percentile(self, q: float, now: float | None = None) -> float | None:
+        ordered = sorted(self._recent(self.rtf_samples, now or time.monotonic()))
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def sample_count(self, now: float | None = None) -> int:
+        return len(self._recent(self.rtf_samples, now or time.monotonic()))
+
+    def error_rate(self, now: float | None = None) -> float:
+        recent = self._recent(self.outcomes, now or time.monotonic())
+        if not recent:
+            return 0.0
+        return 1.0 - sum(recent) / len(recent)
+
+    def allows_request(self, now: float) -> bool:
+        if self.state is CircuitState.OPEN:
+            if now - self.opened_at < settings.stt_circuit_open_seconds:
+                return False
+            # cooldown 이 지나면 한 건만 시험 삼아 보낸다
+            self._set_state(CircuitState.HALF_OPEN)
+        if self.state is CircuitState.HALF_OPEN:
+            return not self.probe_in_flight
+        return True
+
+    def record_latency(self, latency: float, audio_seconds: float, now: float) -> None:
+        self.rtf_samples.append((now, latency / max(audio_seconds, 1.0)))
+
+    def record_success(self, latency: float, audio_seconds: float, now: float) -> None:
+        self.record_latency(latency, audio_seconds, now)
+        self.outcomes.append((now, True))
+        self.consecutive_failures = 0
+        if self.state is not CircuitState.CLOSED:
+            logger.info("STT circuit for %s closed", self.backend)
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self, now: float) -> None:
+        self.outcomes.append((now, False))
+        self.consecutive_failures += 1
+        if self.state is CircuitState.HALF_OPEN or (
+            self.consecutive_failures >= settings.stt_circuit_failure_threshold
+        ):
+            if self.state is not CircuitState.OPEN:
+                logger.warning(
+                    "STT circuit for %s opened (%d consecutive failures)",
+                    self.backend,
+                    self.consecutive_failures,
+                )
+            self.opened_at = now
+            self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        value = {CircuitState.CLOSED: 0.0, CircuitState.HALF_OPEN: 0.5, CircuitState.OPEN: 1.0}[state]
+        STT_CIRCUIT_STATE.labels(backend=self.backend).set(value)
+
+    def snapshot(self) -> dict:
+        return {
+            "backend": self.backend,
+            "state": self.state.value,
+            "error_rate": round(self.error_rate(), 3),
+            "rtf_p50": self.rtf_percentile(0.5),
+            "rtf_p95": self.rtf_percentile(0.95),
+            "samples": self.sample_count(),
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+@dataclass(frozen=True)
+class RoutedResult:
+    text: str
+    backend: str
+    offset_seconds: float | None = None
+    duration_seconds: float | None = None
+
+    @classmethod
+    def of(cls, result: SegmentText, backend: str) -> RoutedResult:
+        return cls(result.text, backend, result.offset_seconds, result.duration_seconds)
+
+
+class SttRouter:
+    """지연/오류율 기반 STT 백엔드 라우터.
+
+    - 후보는 circuit 이 열리지 않은 백엔드를 설정 우선순위(Azure → Whisper)대로 두되,
+      최근 오류율이 stt_router_max_error_rate 를 넘거나 p50 처리 속도(RTF)가
+      stt_router_slow_rtf 보다 느린 백엔드는 뒤로 보낸다
+    - retryable 실패 시 다음 후보로 자동 failover (한 요청에서 hedging 으로 보낸 백엔드를 포함해 같은 백엔드는 한 번만)
+    - hedge=True 이면 1순위 백엔드의 p95 지연이 지나도 응답이 없을 때 2순위에도 같은 세그먼트를 보내고
+      먼저 성공한 결과를 사용한다
+    """
+
+    def __init__(self) -> None:
+        self._health: dict[str, BackendHealth] = {}
+
+    def health(self, backend: str) -> BackendHealth:
+        if backend not in self._health:
+            self._health[backend] = BackendHealth(backend=backend)
+        return self._health[backend]
+
+    def rank(self, backends: Sequence[str]) -> list[str]:
+        """요청을 보낼 수 있는 백엔드를 우선순위대로 정렬 (circuit open 은 제외)."""
+
+        now = time.monotonic()
+        available = [b for b in backends if self.health(b).allows_request(now)]
+
+        def demoted(backend: str) -> tuple[bool, bool]:
+            health = self.health(backend)
+            p50 = health.rtf_percentile(0.5, now)
+            return (
+                health.error_rate(now) > settings.stt_router_max_error_rate,
+                p50 is not None and p50 > settings.stt_router_slow_rtf,
+            )
+
+        # sorted 는 안정 정렬이므로 같은 등급 안에서는 설정 우선순위가 유지된다
+        return sorted(available, key=demoted)
+
+    def _untried(self, candidates: Sequence[str], tried: set[str]) -> list[str]:
+        """아직 보내지 않았고 지금 circuit breaker 가 허용하는 후보.
+
+        rank 이후에 circuit 이 열렸거나 다른 요청이 half-open probe 를 보내는 중일 수 있어 넘길 때마다 다시 확인한다.
+        """
+
+        now = time.monotonic()
+        return [b for b in candidates if b not in tried and self.health(b).allows_request(now)]
+
+    def snapshot(self) -> list[dict]:
+        return [health.snapshot() for health in self._health.values()]
+
+    async def _call(
+        self,
+        backend: str,
+        call: SegmentCall,
+        audio: PcmAudio,
+        usage: dict[str, float],
+    ) -> SegmentText:
+        health = self.health(backend)
+        probing = health.state is CircuitState.HALF_OPEN
+        if probing:
+            health.probe_in_flight = True
+
+        started = time.monotonic()
+        try:
+            result = await call(audio)
+        except SttBackendError as exc:
+            STT_BACKEND_LATENCY.labels(backend=backend, outcome="error").observe(time.monotonic() - started)
+            if exc.retryable:
+                health.record_failure(time.monotonic())
+            raise
+        except asyncio.CancelledError:
+            # hedging 에서 진 요청: 걸린 시간은 최소한 이만큼이므로 지연 통계에 하한값으로 남긴다
+            cancelled_at = time.monotonic()
+            STT_BACKEND_LATENCY.labels(backend=backend, outcome="cancelled").observe(cancelled_at - started)
+            health.record_latency(cancelled_at - started, audio.duration_seconds, cancelled_at)
+            raise
+        finally:
+            if probing:
+                health.probe_in_flight = False
+
+        finished = time.monotonic()
+        latency = finished - started
+        STT_BACKEND_LATENCY.labels(backend=backend, outcome="success").observe(latency)
+        health.record_success(latency, audio.duration_seconds, finished)
+        # hedging 에서 진 요청도 백엔드는 처리(과금)했으므로 성공한 호출은 모두 사용량에 포함
+        usage[backend] = usage.get(backend, 0.0) + audio.duration_seconds
+        return result
+
+    def _hedge_delay(self, backend: str, audio: PcmAudio) -> float | None:
+        health = self.health(backend)
+        p95 = health.rtf_percentile(0.95)
+        if p95 is None or health.sample_count() < settings.stt_hedge_min_samples:
+            return None
+        return p95 * max(audio.duration_seconds, 1.0)
+
+    async def _hedged(
+        self,
+        primary: str,
+        secondary: str,
+        calls: dict[str, SegmentCall],
+        audio: PcmAudio,
+        delay: float,
+        usage: dict[str, float],
+        tried: set[str],
+    ) -> RoutedResult:
+        tasks = {asyncio.create_task(self._call(primary, calls[primary], audio, usage)): primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and not self.health(secondary).allows_request(time.monotonic()):
+                logger.info("STT hedging to %s skipped: circuit breaker does not allow requests", secondary)
+            elif not done:
+                logger.info("STT hedging %s -> %s after %.2fs", primary, secondary, delay)
+                tried.add(secondary)
+                secondary_task = asyncio.create_task(self._call(secondary, calls[secondary], audio, usage))
+                tasks[secondary_task] = secondary
+
+            pending = set(tasks)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        if len(tasks) > 1:
+                            STT_HEDGED_REQUESTS.labels(winner=tasks[task]).inc()
+                        return RoutedResult.of(task.result(), tasks[task])
+                    errors.append(exc)
+            raise errors[-1]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def transcribe(
+        self,
+        audio: PcmAudio,
+        calls: dict[str, SegmentCall],
+        *,
+        hedge: bool = False,
+        usage: dict[str, float] | None = None,
+    ) -> RoutedResult:
+        """세그먼트 하나를 가장 적합한 백엔드로 보내고, retryable 실패 시 다음 후보로 넘긴다.
+
+        usage 를 넘기면 백엔드별로 성공 처리된 오디오 길이(초)를 누적한다 (쿼터/과금 기록용).
+        """
+
+        if usage is None:
+            usage = {}
+
+        candidates = self.rank(list(calls))
+        if not candidates:
+            raise SttBackendError(
+                "모든 STT 백엔드의 circuit breaker 가 열려 있습니다.",
+                retryable=True,
+            )
+
+        # 이 요청에서 이미 보낸 백엔드 (hedging 으로 보낸 2순위 포함). 실패한 백엔드로 다시 failover 하지 않는다
+        tried: set[str] = set()
+        backend = candidates[0]
+        while True:
+            tried.add(backend)
+            remaining = self._untried(candidates, tried)
+            try:
+                delay = self._hedge_delay(backend, audio) if hedge and remaining else None
+                if delay is not None:
+                    return await self._hedged(backend, remaining[0], calls, audio, delay, usage, tried)
+                result = await self._call(backend, calls[backend], audio, usage)
+                return RoutedResult.of(result, backend)
+            except SttBackendError as exc:
+                remaining = self._untried(candidates, tried)
+                if not exc.retryable or not remaining:
+                    raise
+                logger.warning("STT failover %s -> %s: %s", backend, remaining[0], exc.detail)
+                backend = remaining[0]
+
+
+stt_router = SttRouter()
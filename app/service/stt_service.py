@@ -1,16 +1,51 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 import asyncio
+import logging
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import httpx
 
+from app.config.http import HttpBackend, backend_base_url, get_http_client
 from app.config.settings import get_settings
-from app.models.models import SttUsage
+from app.config.timing import timed
+from app.service.audio_service import (
+    AudioBuffer,
+    PcmAudio,
+    WavStream,
+    encode_flac,
+    preprocess_audio,
+    run_in_audio_pool,
+    split_on_silence,
+)
+from app.service.quota_service import (
+    QuotaReservation,
+    commit_quota,
+    get_quota_usage,
+    record_usage,
+    reserve_quota,
+)
+from app.service.stt_routing_service import (
+    RoutedResult,
+    SegmentCall,
+    SegmentText,
+    SttBackendError,
+    stt_router,
+)
+from app.service.transcript_cache_service import (
+    CachedTranscript,
+    audio_fingerprint,
+    get_cached_transcript,
+    store_transcript,
+    transcript_cache_key,
+)
+from app.service.vad_service import SpeechAudio, extract_speech
 
 
 class SttBackend(str, Enum):
@@ -19,76 +54,122 @@ class SttBackend(str, Enum):
 
 
 settings = get_settings()
+logger = logging.getLogger("meeting-stt")
 
+# 인식 결과 없음(무음 구간 등)을 의미하는 Azure Speech RecognitionStatus 값
+_AZURE_NO_SPEECH_STATUSES = {"NoMatch", "InitialSilenceTimeout", "BabbleTimeout"}
 
-def _current_month_range(now: datetime | None = None) -> tuple[datetime, datetime]:
-    if now is None:
-        now = datetime.now(timezone.utc)
-    start = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
-    if now.month == 12:
-        end = datetime(now.year + 1, 1, 1, tzinfo=timezone.utc)
-    else:
-        end = datetime(now.year, now.month + 1, 1, tzinfo=timezone.utc)
-    return start, end
+# 다른 백엔드로 failover 하거나 다시 시도할 만한 업스트림 응답 코드
+_RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# 세그먼트 전사가 끝날 때마다 (세그먼트 번호, 텍스트)로 호출 (예: IncrementalSummarizer.add)
+SegmentCallback = Callable[[int, str], None]
+
+# Azure Speech detailed 응답의 Offset/Duration 단위 (100ns tick)
+_AZURE_TICKS_PER_SECOND = 10_000_000
+
+
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """전사 결과의 한 구간 (meeting_segments 한 행). 시각은 초 단위."""
+
+    start_seconds: float
+    duration_seconds: float
+    text: str
+    backend: str | None = None
 
 
 def get_azure_speech_usage_hours(db: Session, now: datetime | None = None) -> float:
-    start, end = _current_month_range(now)
-    total_seconds: float = (
-        db.query(func.coalesce(func.sum(SttUsage.duration_seconds), 0.0))
-        .filter(
-            SttUsage.provider == SttBackend.AZURE_SPEECH.value,
-            SttUsage.occurred_at >= start,
-            SttUsage.occurred_at < end,
-        )
-        .scalar()
-    )
-    return total_seconds / 3600.0
+    """이번 달 Azure Speech 확정 사용 시간 (월별 rollup 행 조회, 짧게 캐시됨)."""
+
+    return get_quota_usage(db, SttBackend.AZURE_SPEECH.value, now).used_hours
 
 
 def register_azure_speech_usage(db: Session, duration_seconds: float) -> None:
-    usage = SttUsage(provider=SttBackend.AZURE_SPEECH.value, duration_seconds=duration_seconds)
-    db.add(usage)
-    db.commit()
+    record_usage(db, SttBackend.AZURE_SPEECH.value, duration_seconds)
 
 
 def choose_backend() -> SttBackend:
-    """Flag 기반으로 STT 백엔드를 선택.
+    """설정된 백엔드 중 라우터가 현재 1순위로 고르는 백엔드.
 
-    우선순위:
-    - use_speech_service=True 이면 Azure Speech
-    - 아니면 Whisper
+    우선순위는 Azure Speech → Whisper 이며, circuit 이 열렸거나 최근 느린/불안정한 백엔드는 뒤로 밀린다.
+    모든 circuit 이 열려 있으면 설정 우선순위의 첫 번째를 반환한다.
     """
 
-    if settings.use_speech_service:
-        return SttBackend.AZURE_SPEECH
-    return SttBackend.WHISPER
+    backends = _configured_backends()
+    ranked = stt_router.rank([backend.value for backend in backends])
+    return SttBackend(ranked[0]) if ranked else backends[0]
 
 
-def ensure_can_use_azure_speech(db: Session, next_duration_seconds: float) -> None:
-    """월 5시간(기본값) 무료 쿼터를 넘기지 않도록 검사.
+def reserve_azure_speech_quota(db: Session, duration_seconds: float) -> QuotaReservation:
+    """월 5시간(기본값) 무료 쿼터 안에서 이번 요청 길이만큼 Azure Speech 사용량을 예약.
 
-    flag가 켜져 있고, 현재 사용량 + 이번 요청 길이가
+    현재 사용량 + 진행 중인 다른 요청의 예약 + 이번 요청 길이가
     설정된 무료 시간(stt_free_quota_hours_per_month)을 넘으면 예외 발생.
+    예약은 전사가 끝난 뒤 commit_quota 로 실제 처리 길이만큼 확정해야 한다.
     """
 
-    allowed_hours = settings.stt_free_quota_hours_per_month
-    used_hours = get_azure_speech_usage_hours(db)
-    next_hours = next_duration_seconds / 3600.0
-
-    if used_hours + next_hours > allowed_hours:
+    reservation = reserve_quota(
+        db,
+        SttBackend.AZURE_SPEECH.value,
+        duration_seconds,
+        limit_seconds=settings.stt_free_quota_hours_per_month * 3600.0,
+    )
+    if reservation is None:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Azure Speech STT 무료 사용량을 초과하여 사용할 수 없습니다.",
         )
+    return reservation
+
+
+def _request_timeout(audio_seconds: float | None) -> float:
+    """오디오 길이에 비례하는 요청 타임아웃 (길이를 모르면 최대 세그먼트 길이 기준)."""
 
+    if audio_seconds is None:
+        audio_seconds = settings.stt_segment_max_seconds
+    return (
+        settings.stt_request_timeout_base_seconds
+        + settings.stt_request_timeout_per_audio_second * audio_seconds
+    )
+
+
+async def _post(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    label: str,
+    timeout: float,
+    **kwargs,
+) -> httpx.Response:
+    """POST 후 200 응답을 반환. 실패는 모두 SttBackendError.
+
+    여기서는 재시도하지 않는다. 네트워크 오류와 5xx/429 응답은 retryable 오류로 올려 라우터가 다른 백엔드로 넘기고,
+    재시도는 세그먼트 단위(_transcribe_segment_with_retry)에서만 한다.
+    """
+
+    try:
+        resp = await client.post(url, timeout=timeout, **kwargs)
+    except httpx.RequestError as exc:
+        # 네트워크 계층 오류 (ReadError 등)를 502로 변환
+        raise SttBackendError(f"{label} 네트워크 오류: {exc}", retryable=True) from exc
+
+    if resp.status_code != 200:
+        raise SttBackendError(
+            f"{label} 호출 실패: {resp.status_code} {resp.text}",
+            retryable=resp.status_code in _RETRYABLE_STATUSES,
+            upstream_status=resp.status_code,
+        )
+    return resp
 
-# 아래 두 함수는 실제 Azure Speech / Whisper API 연동 시 사용될 자리입니다.
-# 현재는 인터페이스만 정의하고, 구체 구현은 이후 단계에서 추가합니다.
 
-async def transcribe_with_azure_speech(audio_bytes: bytes) -> str:
+async def transcribe_with_azure_speech(
+    audio_bytes: bytes | WavStream,
+    audio_seconds: float | None = None,
+) -> SegmentText:
     """Azure Speech Service REST API로 음성을 텍스트로 변환.
 
+    detailed 형식으로 요청해 발화가 놓인 구간(Offset/Duration)도 함께 반환한다.
     참고: https://learn.microsoft.com/azure/ai-services/speech-service/rest-speech-to-text
     """
 
@@ -98,11 +179,11 @@ async def transcribe_with_azure_speech(audio_bytes: bytes) -> str:
             detail="Azure Speech 설정이 올바르지 않습니다.",
         )
 
-    region = settings.azure_speech_region
     language = settings.azure_speech_language
 
+    # 기본은 리전 엔드포인트, azure_speech_stt_base_url 이 있으면 그 주소 사용
     url = (
-        f"https://{region}.stt.speech.microsoft.com/"
+        f"{backend_base_url(HttpBackend.AZURE_SPEECH)}/"
         "speech/recognition/conversation/cognitiveservices/v1"
     )
 
@@ -110,48 +191,34 @@ async def transcribe_with_azure_speech(audio_bytes: bytes) -> str:
         "Ocp-Apim-Subscription-Key": settings.azure_speech_key,
         # 프런트엔드에서 업로드하는 WAV(PCM) 포맷에 맞춰 Content-Type 설정
         "Content-Type": "audio/wav",
+        # WavStream 도 길이를 알고 있으므로 chunked 대신 Content-Length 로 전송
+        "Content-Length": str(len(audio_bytes)),
         "Accept": "application/json",
     }
 
-    params = {"language": language}
-
-    # 일시적인 네트워크 끊김(ReadError 등)을 완화하기 위해 간단한 재시도 로직 적용
-    max_retries = 3
-    last_exc: Exception | None = None
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for attempt in range(1, max_retries + 1):
-            try:
-                resp = await client.post(
-                    url,
-                    params=params,
-                    headers=headers,
-                    content=audio_bytes,
-                )
-                break
-            except httpx.RequestError as exc:
-                last_exc = exc
-                if attempt >= max_retries:
-                    # 네트워크 계층 오류 (ReadError 등)를 502로 변환
-                    raise HTTPException(
-                        status_code=status.HTTP_502_BAD_GATEWAY,
-                        detail=f"Azure Speech STT 네트워크 오류(재시도 {max_retries}회 실패): {exc}",
-                    ) from exc
-                # 간단한 선형 백오프 (1초, 2초, ...)
-                await asyncio.sleep(attempt)
-
-    if resp.status_code != 200:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Azure Speech STT 호출 실패: {resp.status_code} {resp.text}",
-        )
+    params = {"language": language, "format": "detailed"}
+
+    # 앱 수명 동안 유지되는 공유 커넥션 풀 사용 (요청마다 TCP/TLS 핸드셰이크 방지)
+    resp = await _post(
+        get_http_client(HttpBackend.AZURE_SPEECH),
+        url,
+        label="Azure Speech STT",
+        timeout=_request_timeout(audio_seconds),
+        params=params,
+        headers=headers,
+        content=audio_bytes,
+    )
 
     data = resp.json()
 
-    # 대표적인 응답 형태: {"RecognitionStatus": "Success", "DisplayText": "..."}
+    # 세그먼트 단위로 보내면 무음 구간만 담긴 요청이 생길 수 있으므로 "발화 없음"으로 처리
+    if isinstance(data, dict) and data.get("RecognitionStatus") in _AZURE_NO_SPEECH_STATUSES:
+        return SegmentText("")
+
+    # 대표적인 응답 형태: {"RecognitionStatus": "Success", "Offset": ..., "Duration": ..., "DisplayText": "..."}
     text = data.get("DisplayText") if isinstance(data, dict) else None
     if text is None and isinstance(data, dict):
-        # 일부 응답에서는 NBest[0].Display 가 있을 수 있음
+        # detailed 형식은 NBest[0].Display 에 텍스트가 있다
         nbest = data.get("NBest")
         if isinstance(nbest, list) and nbest:
             text = nbest[0].get("Display") or nbest[0].get("Lexical")
@@ -166,16 +233,29 @@ async def transcribe_with_azure_speech(audio_bytes: bytes) -> str:
         raw = resp.text
         if len(raw) > 500:
             raw = raw[:500] + "... (truncated)"
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Azure Speech STT 응답에서 텍스트를 찾을 수 없습니다. raw={raw}",
+        raise SttBackendError(
+            f"Azure Speech STT 응답에서 텍스트를 찾을 수 없습니다. raw={raw}",
+            retryable=False,
         )
 
-    return text
+    offset = data.get("Offset")
+    duration = data.get("Duration")
+    return SegmentText(
+        text,
+        offset_seconds=offset / _AZURE_TICKS_PER_SECOND if isinstance(offset, (int, float)) else None,
+        duration_seconds=duration / _AZURE_TICKS_PER_SECOND if isinstance(duration, (int, float)) else None,
+    )
 
 
-async def transcribe_with_whisper(audio_bytes: bytes) -> str:
-    """외부 Whisper API(예: Simplismart)를 사용해 음성을 텍스트로 변환."""
+async def transcribe_with_whisper(
+    audio_bytes: bytes | WavStream,
+    content_type: str = "audio/wav",
+    audio_seconds: float | None = None,
+) -> SegmentText:
+    """외부 Whisper API(예: Simplismart)를 사용해 음성을 텍스트로 변환.
+
+    응답에 segments[].start/end 가 있으면 첫 시작 ~ 마지막 끝을 발화 구간으로 반환한다.
+    """
 
     if not (settings.whisper_api_base_url and settings.whisper_api_key):
         raise HTTPException(
@@ -188,51 +268,225 @@ async def transcribe_with_whisper(audio_bytes: bytes) -> str:
 
     headers = {
         "Authorization": f"Bearer {settings.whisper_api_key}",
-        "Content-Type": "audio/wav",
+        "Content-Type": content_type,
+        "Content-Length": str(len(audio_bytes)),
         "Accept": "application/json",
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(url, headers=headers, content=audio_bytes)
-
-    if resp.status_code != 200:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Whisper API 호출 실패: {resp.status_code} {resp.text}",
-        )
+    resp = await _post(
+        get_http_client(HttpBackend.WHISPER),
+        url,
+        label="Whisper API",
+        timeout=_request_timeout(audio_seconds),
+        headers=headers,
+        content=audio_bytes,
+    )
 
     data = resp.json()
-    text = data.get("text") or data.get("transcript")
+    text = data.get("text")
+    if text is None:
+        text = data.get("transcript")
+
+    # 키 자체가 없을 때만 에러. ""(빈 문자열)은 무음 세그먼트로 보고 그대로 반환.
+    if not isinstance(text, str):
+        raise SttBackendError("Whisper API 응답에서 텍스트를 찾을 수 없습니다.", retryable=False)
+
+    spans = [
+        (segment["start"], segment["end"])
+        for segment in data.get("segments") or []
+        if isinstance(segment, dict)
+        and isinstance(segment.get("start"), (int, float))
+        and isinstance(segment.get("end"), (int, float))
+    ]
+    if not spans:
+        return SegmentText(text)
+    return SegmentText(text, offset_seconds=spans[0][0], duration_seconds=spans[-1][1] - spans[0][0])
+
+
+async def _azure_speech_segment(audio: PcmAudio) -> SegmentText:
+    # Azure Speech short-audio REST 는 WAV(PCM)/OGG(OPUS)만 받으므로 항상 WAV 로 전송
+    return await transcribe_with_azure_speech(WavStream(audio), audio.duration_seconds)
+
+
+async def _whisper_segment(audio: PcmAudio) -> SegmentText:
+    if settings.stt_audio_encoding == "flac":
+        try:
+            payload = encode_flac(audio)
+        except ImportError:
+            logger.warning("soundfile not installed, sending WAV to Whisper instead of FLAC")
+        else:
+            return await transcribe_with_whisper(payload, "audio/flac", audio.duration_seconds)
+    return await transcribe_with_whisper(WavStream(audio), "audio/wav", audio.duration_seconds)
+
+
+async def _transcribe_segment_with_retry(
+    index: int,
+    segment: PcmAudio,
+    transcribe_one: Callable[[PcmAudio], Awaitable[RoutedResult]],
+) -> RoutedResult:
+    """세그먼트 하나를 전사하고, 5xx 계열 실패 시 해당 세그먼트만 재시도.
+
+    재시도는 이 단계에서만 한다. 한 번의 시도 안에서 라우터가 백엔드마다 최대 한 번씩 보내므로
+    세그먼트 하나의 백엔드 호출은 stt_segment_max_attempts × 백엔드 수를 넘지 않는다.
+    """
 
-    if not text:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Whisper API 응답에서 텍스트를 찾을 수 없습니다.",
+    max_attempts = max(1, settings.stt_segment_max_attempts)
+    attempt = 1
+    while True:
+        try:
+            return await transcribe_one(segment)
+        except HTTPException as exc:
+            # 설정 오류(500)/쿼터(429)/인증 실패 등은 재시도해도 결과가 같으므로 일시적 오류만 재시도
+            if isinstance(exc, SttBackendError):
+                retryable = exc.retryable
+            else:
+                retryable = exc.status_code >= 502
+            if not retryable or attempt >= max_attempts:
+                raise
+            logger.warning(
+                "STT segment %d failed (attempt %d/%d): %s",
+                index,
+                attempt,
+                max_attempts,
+                exc.detail,
+            )
+            await asyncio.sleep(attempt)
+            attempt += 1
+
+
+def _timed_segment(start_seconds: float, piece: PcmAudio, result: RoutedResult) -> TranscriptSegment:
+    """세그먼트 시작 시각에 백엔드가 알려준 발화 구간을 더해, 앞뒤 무음을 뺀 위치로 좁힌다."""
+
+    length = piece.duration_seconds
+    offset = min(max(result.offset_seconds or 0.0, 0.0), length)
+    duration = length - offset if result.duration_seconds is None else result.duration_seconds
+    return TranscriptSegment(
+        start_seconds=start_seconds + offset,
+        duration_seconds=min(max(duration, 0.0), length - offset),
+        text=result.text.strip(),
+        backend=result.backend,
+    )
+
+
+async def transcribe_segments(
+    audio: PcmAudio,
+    transcribe_one: Callable[[PcmAudio], Awaitable[RoutedResult]],
+    *,
+    on_segment: SegmentCallback | None = None,
+    segments: list[TranscriptSegment] | None = None,
+) -> str:
+    """오디오를 무음 경계에서 분할한 뒤 세그먼트를 동시에 전사하고 순서대로 이어 붙인다.
+
+    동시 호출 수는 settings.stt_segment_concurrency 로 제한하며,
+    한 세그먼트가 최종 실패하면 나머지 진행 중인 세그먼트를 취소하고 예외를 올린다.
+    on_segment 가 있으면 세그먼트가 끝날 때마다 (세그먼트 번호, 텍스트)로 호출한다 (완료 순서는 번호 순서와 다를 수 있음).
+    segments 를 넘기면 텍스트가 있는 세그먼트를 audio 기준 시각과 함께 순서대로 추가한다.
+    """
+
+    pieces = split_on_silence(
+        audio,
+        max_seconds=settings.stt_segment_max_seconds,
+        min_seconds=settings.stt_segment_min_seconds,
+    )
+
+    if len(pieces) > 1:
+        logger.info(
+            "STT split %.1fs audio into %d segments", audio.duration_seconds, len(pieces)
         )
 
-    return text
+    semaphore = asyncio.Semaphore(max(1, settings.stt_segment_concurrency))
+
+    async def run(index: int) -> RoutedResult:
+        async with semaphore:
+            result = await _transcribe_segment_with_retry(index, pieces[index], transcribe_one)
+        if on_segment is not None:
+            on_segment(index, result.text)
+        return result
+
+    tasks = [asyncio.create_task(run(i)) for i in range(len(pieces))]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    if segments is not None:
+        # split_on_silence 의 세그먼트는 빈틈없이 이어지므로 앞 세그먼트 길이의 합이 시작 위치
+        start_frame = 0
+        for piece, result in zip(pieces, results):
+            if result.text and result.text.strip():
+                segments.append(_timed_segment(start_frame / audio.sample_rate, piece, result))
+            start_frame += piece.num_frames
+
+    return " ".join(result.text.strip() for result in results if result.text and result.text.strip())
+
+
+def to_source_timeline(
+    segments: list[TranscriptSegment],
+    speech: SpeechAudio | None,
+    *,
+    offset_seconds: float = 0.0,
+) -> list[TranscriptSegment]:
+    """무음을 제거한 오디오 기준 시각을 원본 녹음 기준으로 되돌린다 (VAD 를 쓰지 않았으면 그대로).
+
+    offset_seconds 는 원본 오디오가 녹음 전체에서 시작하는 위치 (실시간 스트림 세그먼트의 시작 시각).
+    """
 
+    timed = []
+    for segment in segments:
+        start = segment.start_seconds
+        end = segment.start_seconds + segment.duration_seconds
+        if speech is not None:
+            start, end = speech.source_seconds_at(start), speech.source_seconds_at(end)
+        timed.append(
+            TranscriptSegment(offset_seconds + start, max(end - start, 0.0), segment.text, segment.backend)
+        )
+    return timed
 
-async def transcribe(audio_bytes: bytes, db: Session, duration_seconds: float) -> str:
-    """플래그와 Azure Speech 무료 쿼터에 따라 STT 백엔드를 선택하고 호출.
 
-    동작 규칙:
-    - settings.use_speech_service 가 True 이고 키/리전이 설정되어 있으면 Azure Speech를 우선 사용
-      - 이번 요청 길이(duration_seconds)를 포함해 월 무료 시간(stt_free_quota_hours_per_month)을 넘기면 429 에러
-    - 그렇지 않고 settings.use_whisper_api 가 True 이고 설정이 있으면 Whisper API 사용
-    - 둘 다 아니면 503 에러
+def _prepare_audio(audio_bytes: AudioBuffer) -> tuple[PcmAudio, str | None, SpeechAudio | None]:
+    """업로드 WAV 정규화 + (설정 시) 무음 제거 + 캐시용 지문 계산. 오디오 스레드 풀에서 실행된다.
+
+    무음을 제거했으면 세그먼트 시각을 원본 기준으로 되돌릴 수 있도록 SpeechAudio 도 반환한다.
     """
 
+    audio = preprocess_audio(audio_bytes, target_rate=settings.stt_target_sample_rate)
+    speech = None
+    if settings.stt_vad_enabled:
+        speech = extract_speech(audio)
+        logger.info(
+            "VAD kept %.1fs of %.1fs audio (%d regions)",
+            speech.speech_seconds,
+            speech.source_seconds,
+            len(speech.regions),
+        )
+        audio = speech.audio
+
+    fingerprint = None
+    if settings.transcript_cache_enabled and audio.num_frames:
+        fingerprint = audio_fingerprint(audio)
+    return audio, fingerprint, speech
+
+
+_SEGMENT_CALLS: dict[SttBackend, SegmentCall] = {
+    SttBackend.AZURE_SPEECH: _azure_speech_segment,
+    SttBackend.WHISPER: _whisper_segment,
+}
+
+
+def _configured_backends() -> list[SttBackend]:
+    """설정(flag + 키)으로 사용할 수 있는 STT 백엔드를 우선순위대로 반환. 하나도 없으면 503."""
+
+    backends: list[SttBackend] = []
+
     # 1) Azure Speech Service 우선 사용 (flag + 키/리전 필요)
     if (
         settings.use_speech_service
         and settings.azure_speech_key
         and settings.azure_speech_region
     ):
-        ensure_can_use_azure_speech(db, duration_seconds)
-        text = await transcribe_with_azure_speech(audio_bytes)
-        register_azure_speech_usage(db, duration_seconds)
-        return text
+        backends.append(SttBackend.AZURE_SPEECH)
 
     # 2) Whisper API (예: Simplismart). 기본값은 use_whisper_api=False 이므로 명시적으로 켜야 함.
     if (
@@ -240,10 +494,173 @@ async def transcribe(audio_bytes: bytes, db: Session, duration_seconds: float) -
         and settings.whisper_api_base_url
         and settings.whisper_api_key
     ):
-        return await transcribe_with_whisper(audio_bytes)
+        backends.append(SttBackend.WHISPER)
 
     # 3) 어떤 백엔드도 사용 불가한 경우
-    raise HTTPException(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        detail="사용 가능한 STT 백엔드가 설정되어 있지 않습니다.",
-    )
+    if not backends:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="사용 가능한 STT 백엔드가 설정되어 있지 않습니다.",
+        )
+    return backends
+
+
+def _language_for(backend: SttBackend) -> str:
+    return settings.azure_speech_language if backend is SttBackend.AZURE_SPEECH else "auto"
+
+
+async def transcribe(
+    audio_bytes: AudioBuffer,
+    db: AsyncSession,
+    duration_seconds: float | None = None,
+    *,
+    latency_critical: bool = False,
+    on_segment: SegmentCallback | None = None,
+    segments: list[TranscriptSegment] | None = None,
+) -> str:
+    """설정된 STT 백엔드들 중 상태가 좋은 쪽으로 세그먼트를 보내 전사.
+
+    동작 규칙:
+    - settings.use_speech_service 가 True 이고 키/리전이 설정되어 있으면 Azure Speech를 우선 사용
+    - settings.use_whisper_api 가 True 이고 설정이 있으면 Whisper API 도 후보가 된다
+    - 세그먼트마다 stt_router 가 circuit breaker / 최근 지연·오류율을 보고 백엔드를 고르며,
+      일시적 오류(5xx/429/네트워크)면 다음 백엔드로 failover 한다
+    - latency_critical=True 이고 stt_hedging_enabled 이면 1순위 백엔드가 p95 지연을 넘길 때
+      2순위 백엔드에도 같은 세그먼트를 보낸다 (hedged request)
+    - Azure Speech 는 전사 전에 이번 요청 길이만큼 쿼터를 예약하고, 월 무료 시간
+      (stt_free_quota_hours_per_month)을 넘기면
+      Whisper 가 설정되어 있으면 Whisper 만 사용하고, 아니면 429 에러
+    - 둘 다 아니면 503 에러
+
+    업로드 WAV 는 먼저 mono / stt_target_sample_rate 로 정규화하고 VAD 로 무음을 제거한다.
+    쿼터 계산/SttUsage 기록에는 클라이언트가 보낸 duration_seconds 대신
+    실제로 Azure Speech 가 처리한 발화 길이를 사용하며, 발화가 없으면 백엔드를 호출하지 않고 "" 를 반환한다.
+    같은 오디오(정규화 PCM 해시) + 백엔드 + 언어 조합은 캐시에서 바로 반환하고 쿼터도 소모하지 않는다.
+    긴 녹음은 stt_segment_max_seconds 이하 세그먼트로 나눠 병렬 전사한다 (transcribe_segments).
+    on_segment 는 세그먼트 전사가 끝날 때마다 호출된다 (캐시 적중 시에는 호출되지 않음).
+    segments 를 넘기면 세그먼트별 전사 결과를 원본 녹음 기준 시각과 함께 추가한다 (meeting_segments 저장용).
+    """
+
+    # 설정 오류는 오디오 처리 전에 바로 503
+    _configured_backends()
+
+    with timed("audio"):
+        audio, fingerprint, speech = await run_in_audio_pool(_prepare_audio, audio_bytes)
+    if duration_seconds is not None:
+        logger.info(
+            "STT request: client duration %.1fs, speech sent %.1fs",
+            duration_seconds,
+            audio.duration_seconds,
+        )
+
+    timed_segments: list[TranscriptSegment] | None = [] if segments is not None else None
+    with timed("stt"):
+        text = await transcribe_audio(
+            audio,
+            db,
+            fingerprint=fingerprint,
+            latency_critical=latency_critical,
+            on_segment=on_segment,
+            segments=timed_segments,
+        )
+    if segments is not None:
+        segments.extend(to_source_timeline(timed_segments, speech))
+    return text
+
+
+async def transcribe_audio(
+    audio: PcmAudio,
+    db: AsyncSession,
+    *,
+    fingerprint: str | None = None,
+    latency_critical: bool = False,
+    on_segment: SegmentCallback | None = None,
+    segments: list[TranscriptSegment] | None = None,
+) -> str:
+    """이미 정규화(mono / stt_target_sample_rate, 무음 제거)된 오디오를 전사한다.
+
+    백엔드 선택/쿼터 예약/캐시 규칙은 transcribe 와 같으며, fingerprint 가 없으면 캐시를 쓰지 않는다.
+    실시간 스트리밍(realtime_service)처럼 오디오를 직접 나눠 넘기는 경로에서 사용한다.
+    쿼터/캐시 조회·기록은 동기 ORM 코드를 AsyncSession.run_sync 로 실행하므로 이벤트 루프를 막지 않는다.
+    segments 를 넘기면 세그먼트별 결과를 audio 기준 시각으로 추가한다.
+    """
+
+    backends = _configured_backends()
+    if audio.num_frames == 0:
+        return ""
+
+    speech_seconds = audio.duration_seconds
+    cache_keys: dict[SttBackend, str] = {}
+    if fingerprint is not None:
+        for backend in backends:
+            cache_keys[backend] = transcript_cache_key(fingerprint, backend.value, _language_for(backend))
+            cached = await db.run_sync(get_cached_transcript, cache_keys[backend])
+            if cached is not None:
+                logger.info("STT cache hit (%s, %.1fs)", backend.value, speech_seconds)
+                if segments is not None:
+                    segments.extend(_cached_segments(cached, backend, speech_seconds))
+                return cached.transcript
+
+    reservation: QuotaReservation | None = None
+    if SttBackend.AZURE_SPEECH in backends:
+        try:
+            reservation = await db.run_sync(reserve_azure_speech_quota, speech_seconds)
+        except HTTPException:
+            if len(backends) == 1:
+                raise
+            logger.info("Azure Speech free quota exhausted, routing to Whisper")
+            backends.remove(SttBackend.AZURE_SPEECH)
+
+    calls = {backend.value: _SEGMENT_CALLS[backend] for backend in backends}
+    hedge = latency_critical and settings.stt_hedging_enabled
+    usage: dict[str, float] = {}
+
+    async def transcribe_one(segment: PcmAudio) -> RoutedResult:
+        return await stt_router.transcribe(segment, calls, hedge=hedge, usage=usage)
+
+    # 캐시에도 저장하므로 호출한 쪽이 segments 를 넘기지 않아도 모은다
+    timed_segments: list[TranscriptSegment] = []
+    try:
+        text = await transcribe_segments(audio, transcribe_one, on_segment=on_segment, segments=timed_segments)
+    finally:
+        # 실패하더라도 Azure 가 이미 처리한 세그먼트는 과금되므로 그만큼만 확정하고 나머지 예약은 반환
+        if reservation is not None:
+            await db.run_sync(commit_quota, reservation, usage.get(SttBackend.AZURE_SPEECH.value, 0.0))
+
+    # 세그먼트가 여러 백엔드로 나뉘었으면 가장 많이 처리한 백엔드의 결과로 캐시
+    served_by = SttBackend(max(usage, key=usage.__getitem__)) if usage else backends[0]
+    if served_by in cache_keys:
+        await db.run_sync(
+            store_transcript,
+            cache_keys[served_by],
+            backend=served_by.value,
+            language=_language_for(served_by),
+            transcript=text,
+            audio_seconds=speech_seconds,
+            segments=[_segment_to_cache(segment) for segment in timed_segments],
+        )
+    if segments is not None:
+        segments.extend(timed_segments)
+    return text
+
+
+def _segment_to_cache(segment: TranscriptSegment) -> dict:
+    return {
+        "start": segment.start_seconds,
+        "duration": segment.duration_seconds,
+        "text": segment.text,
+        "backend": segment.backend,
+    }
+
+
+def _cached_segments(cached: CachedTranscript, backend: SttBackend, audio_seconds: float) -> list[TranscriptSegment]:
+    """캐시 항목의 세그먼트. 세그먼트 없이 저장된 예전 항목은 전사 전체를 한 구간으로 본다."""
+
+    if cached.segments is None:
+        if not cached.transcript:
+            return []
+        return [TranscriptSegment(0.0, audio_seconds, cached.transcript, backend.value)]
+    return [
+        TranscriptSegment(item["start"], item["duration"], item["text"], item.get("backend"))
+        for item in cached.segments
+    ]
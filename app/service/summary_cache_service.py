@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+import hashlib
+import logging
+import time
+
+from prometheus_client import Counter
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import AsyncSessionLocal
+from app.config.settings import get_settings
+from app.models.models import SummaryCacheEntry
+from app.service.cache_service import TtlLruCache
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+SUMMARY_CACHE_LOOKUPS = Counter(
+    "meeting_stt_summary_cache_lookups_total",
+    "요약 결과 캐시 조회 수",
+    ["tier", "result"],
+)
+SUMMARY_CACHE_TOKENS_SAVED = Counter(
+    "meeting_stt_summary_cache_tokens_saved_total",
+    "요약 캐시 적중으로 호출하지 않은 Azure OpenAI 토큰 수",
+)
+
+
+class CachedSummary(NamedTuple):
+    summary: str
+    total_tokens: int
+
+
+_memory_cache: TtlLruCache[str, CachedSummary] = TtlLruCache(
+    max_entries=settings.summary_cache_max_entries,
+    ttl_seconds=settings.summary_cache_ttl_hours * 3600.0,
+)
+
+# 만료 행 정리는 저장할 때마다가 아니라 일정 간격으로만 수행
+_PRUNE_INTERVAL_SECONDS = 600.0
+_last_pruned_at = 0.0
+
+
+def normalize_transcript(transcript: str) -> str:
+    """공백/줄바꿈 차이만 있는 transcript 가 같은 키가 되도록 연속 공백을 하나로 합친다."""
+
+    return " ".join(transcript.split())
+
+
+def summary_cache_key(transcript: str, *, system_prompt: str, deployment: str, temperature: float) -> str:
+    """요약 결과에 영향을 주는 입력(정규화 transcript, system prompt 원문, deployment, temperature)의 SHA-256.
+
+    prompt 파일을 고치면 system_prompt 가 바뀌므로 이전 결과는 자동으로 적중하지 않는다.
+    """
+
+    digest = hashlib.sha256()
+    for part in (deployment, f"{temperature:g}", system_prompt, normalize_transcript(transcript)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def get_cached_summary(cache_key: str) -> str | None:
+    """프로세스 내 LRU → DB 순으로 조회. DB 에서 찾으면 LRU 에도 채워 둔다."""
+
+    cached = _memory_cache.get(cache_key)
+    if cached is not None:
+        SUMMARY_CACHE_LOOKUPS.labels(tier="memory", result="hit").inc()
+        SUMMARY_CACHE_TOKENS_SAVED.inc(cached.total_tokens)
+        return cached.summary
+    SUMMARY_CACHE_LOOKUPS.labels(tier="memory", result="miss").inc()
+
+    async with AsyncSessionLocal() as db:
+        entry = await db.get(SummaryCacheEntry, cache_key)
+        expires_before = datetime.now(timezone.utc) - timedelta(hours=settings.summary_cache_ttl_hours)
+        if entry is None or entry.created_at < expires_before:
+            SUMMARY_CACHE_LOOKUPS.labels(tier="db", result="miss").inc()
+            return None
+
+        SUMMARY_CACHE_LOOKUPS.labels(tier="db", result="hit").inc()
+        SUMMARY_CACHE_TOKENS_SAVED.inc(entry.total_tokens)
+        entry.hit_count += 1
+        entry.last_hit_at = datetime.now(timezone.utc)
+        cached = CachedSummary(entry.summary, entry.total_tokens)
+        await db.commit()
+
+    _memory_cache.set(cache_key, cached)
+    return cached.summary
+
+
+async def store_summary(cache_key: str, *, deployment: str, summary: str, total_tokens: int) -> None:
+    """요약 결과를 두 계층에 저장한다. 같은 키가 이미 있으면 새 결과로 갱신."""
+
+    _memory_cache.set(cache_key, CachedSummary(summary, total_tokens))
+
+    stmt = insert(SummaryCacheEntry).values(
+        cache_key=cache_key,
+        deployment=deployment,
+        summary=summary,
+        total_tokens=total_tokens,
+        hit_count=0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SummaryCacheEntry.cache_key],
+        set_={
+            "summary": stmt.excluded.summary,
+            "total_tokens": stmt.excluded.total_tokens,
+            "created_at": datetime.now(timezone.utc),
+        },
+    )
+    async with AsyncSessionLocal() as db:
+        await db.execute(stmt)
+        await _prune_expired(db)
+        await db.commit()
+
+
+async def _prune_expired(db: AsyncSession) -> None:
+    global _last_pruned_at
+
+    now = time.monotonic()
+    if now - _last_pruned_at < _PRUNE_INTERVAL_SECONDS:
+        return
+    _last_pruned_at = now
+
+    expires_before = datetime.now(timezone.utc) - timedelta(hours=settings.summary_cache_ttl_hours)
+    result = await db.execute(delete(SummaryCacheEntry).where(SummaryCacheEntry.created_at < expires_before))
+    if result.rowcount:
+        logger.info("summary cache pruned %d expired rows", result.rowcount)
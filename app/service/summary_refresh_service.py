@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import asyncio
+import logging
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config.db import SessionLocal
+from app.config.settings import get_settings
+from app.models.meeting import SummaryRefreshRunResponse, SummaryRefreshStatus
+from app.models.models import SummaryRefreshRun
+from app.repository.summary_refresh_repository import (
+    claim_run,
+    create_run,
+    get_run,
+    iter_meeting_batches,
+    list_runs,
+    save_batch,
+    touch_run,
+    update_run_status,
+)
+from app.service.summary_service import prompt_fingerprint, summarize_batch
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+REFRESHED_MEETINGS = Counter(
+    "meeting_stt_summary_refresh_meetings_total",
+    "일괄 재요약으로 처리한 회의 수",
+    ["result"],
+)
+
+# 이 프로세스에서 실행 중인 재요약 (run_id → task)
+_tasks: dict[UUID, asyncio.Task] = {}
+
+
+def _to_response(run: SummaryRefreshRun) -> SummaryRefreshRunResponse:
+    return SummaryRefreshRunResponse(
+        id=run.id,
+        status=SummaryRefreshStatus(run.status),
+        deployment=run.deployment,
+        prompt_hash=run.prompt_hash,
+        batch_size=run.batch_size,
+        concurrency=run.concurrency,
+        total=run.total,
+        processed=run.processed,
+        failed=run.failed,
+        last_meeting_id=run.last_meeting_id,
+        error=run.error,
+        created_at=run.created_at,
+        updated_at=run.updated_at,
+        finished_at=run.finished_at,
+    )
+
+
+def _get_run_or_404(db: Session, run_id: UUID) -> SummaryRefreshRun:
+    run = get_run(db, run_id=run_id)
+    if run is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="재요약 실행을 찾을 수 없습니다.")
+    return run
+
+
+async def _process_batch(db: Session, run: SummaryRefreshRun, rows) -> None:
+    results = await summarize_batch([row.full_transcript for row in rows], max_concurrency=run.concurrency)
+
+    summaries: dict[UUID, str] = {}
+    failed = 0
+    last_error: str | None = None
+    for row, result in zip(rows, results):
+        if isinstance(result, HTTPException):
+            # 실패한 회의는 기존 요약을 그대로 두고 건너뛴다
+            failed += 1
+            last_error = f"{row.id}: {result.detail}"
+        else:
+            summaries[row.id] = result
+
+    await run_in_threadpool(
+        save_batch,
+        db,
+        run,
+        summaries=summaries,
+        failed=failed,
+        last_created_at=rows[-1].created_at,
+        last_meeting_id=rows[-1].id,
+        error=last_error,
+    )
+    REFRESHED_MEETINGS.labels(result="ok").inc(len(summaries))
+    REFRESHED_MEETINGS.labels(result="failed").inc(failed)
+
+
+def _touch(run_id: UUID) -> None:
+    with SessionLocal() as db:
+        touch_run(db, run_id=run_id)
+
+
+def _finish(db: Session, run: SummaryRefreshRun, run_status: SummaryRefreshStatus, **fields) -> None:
+    # 실패한 배치의 트랜잭션을 버리고 상태만 기록
+    db.rollback()
+    update_run_status(db, run, run_status, **fields)
+
+
+def _close(*sessions: Session) -> None:
+    for session in sessions:
+        session.close()
+
+
+async def _heartbeat(run_id: UUID) -> None:
+    """실행 중인 run 의 heartbeat 를 주기적으로 갱신 (배치 하나가 오래 걸려도 다른 프로세스가 resume 하지 않도록)."""
+
+    interval = settings.summary_refresh_stale_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(_touch, run_id)
+
+
+async def run_refresh(run_id: UUID) -> SummaryRefreshRunResponse:
+    """run 의 checkpoint 이후 회의를 배치 단위로 다시 요약한다.
+
+    배치마다 요약 UPDATE 와 checkpoint 를 함께 커밋하므로, 중간에 멈추면(취소/프로세스 종료)
+    INTERRUPTED 로 남고 resume 시 마지막으로 커밋된 배치 다음부터 이어서 처리한다.
+    """
+
+    # 회의를 읽는 server-side cursor 와 결과를 쓰는 트랜잭션은 세션(연결)을 나눈다.
+    # 동기 세션이므로 DB 왕복(조회/커밋/배치 fetch/close)은 모두 스레드 풀에서 실행해 이벤트 루프를 막지 않는다
+    read_db = SessionLocal()
+    db = SessionLocal()
+    try:
+        run = await run_in_threadpool(_get_run_or_404, db, run_id)
+        await run_in_threadpool(update_run_status, db, run, SummaryRefreshStatus.RUNNING)
+        logger.info("summary refresh %s started (%d/%d done)", run.id, run.processed, run.total)
+
+        heartbeat = asyncio.create_task(_heartbeat(run_id))
+        try:
+            batches = iter_meeting_batches(read_db, run)
+            while (rows := await run_in_threadpool(next, batches, None)) is not None:
+                await _process_batch(db, run, rows)
+                logger.info("summary refresh %s: %d/%d (failed %d)", run.id, run.processed, run.total, run.failed)
+        except asyncio.CancelledError:
+            await asyncio.shield(run_in_threadpool(_finish, db, run, SummaryRefreshStatus.INTERRUPTED))
+            logger.info("summary refresh %s interrupted at %d/%d", run.id, run.processed, run.total)
+            raise
+        except Exception as exc:
+            logger.exception("summary refresh %s failed", run.id)
+            await run_in_threadpool(
+                _finish, db, run, SummaryRefreshStatus.FAILED, error=f"처리 중 오류가 발생했습니다: {exc}"
+            )
+            return _to_response(run)
+        finally:
+            heartbeat.cancel()
+
+        await run_in_threadpool(update_run_status, db, run, SummaryRefreshStatus.COMPLETED)
+        logger.info("summary refresh %s completed (%d processed, %d failed)", run.id, run.processed, run.failed)
+        return _to_response(run)
+    finally:
+        await asyncio.shield(run_in_threadpool(_close, read_db, db))
+
+
+def _spawn(run_id: UUID) -> None:
+    # 이벤트 루프에서 호출해야 한다 (라우터는 async def, DB 작업만 스레드 풀에서 실행)
+    task = asyncio.create_task(run_refresh(run_id), name=f"summary-refresh-{run_id}")
+    _tasks[run_id] = task
+    task.add_done_callback(lambda _: _tasks.pop(run_id, None))
+
+
+def create_refresh_run(
+    db: Session,
+    *,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+) -> SummaryRefreshRun:
+    """현재 system prompt/deployment 기준으로 전사가 있는 모든 회의를 대상으로 하는 실행을 만든다."""
+
+    return create_run(
+        db,
+        deployment=settings.azure_openai_deployment_summary,
+        prompt_hash=prompt_fingerprint(),
+        batch_size=max(1, batch_size or settings.summary_refresh_batch_size),
+        concurrency=max(1, concurrency or settings.summary_refresh_concurrency),
+    )
+
+
+def claim_refresh_run(db: Session, *, run_id: UUID) -> SummaryRefreshRun:
+    """이어서 실행할 run 을 가져온다. 완료됐거나 다른 워커/프로세스에서 실행 중(heartbeat 유효)이면 409."""
+
+    run = _get_run_or_404(db, run_id)
+    if run.status == SummaryRefreshStatus.COMPLETED.value:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 완료된 재요약 실행입니다.")
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.summary_refresh_stale_seconds)
+    if not claim_run(db, run_id=run_id, stale_before=stale_before):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 실행 중인 재요약입니다.")
+    return _get_run_or_404(db, run_id)
+
+
+async def start_refresh(
+    db: Session,
+    *,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+) -> SummaryRefreshRunResponse:
+    run = await run_in_threadpool(create_refresh_run, db, batch_size=batch_size, concurrency=concurrency)
+    _spawn(run.id)
+    return _to_response(run)
+
+
+async def resume_refresh(db: Session, *, run_id: UUID) -> SummaryRefreshRunResponse:
+    if run_id in _tasks:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 실행 중인 재요약입니다.")
+
+    run = await run_in_threadpool(claim_refresh_run, db, run_id=run_id)
+    _spawn(run.id)
+    return _to_response(run)
+
+
+async def cancel_refresh(db: Session, *, run_id: UUID) -> SummaryRefreshRunResponse:
+    task = _tasks.get(run_id)
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이 서버에서 실행 중인 재요약이 아닙니다.")
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return _to_response(await run_in_threadpool(_get_run_or_404, db, run_id))
+
+
+def get_run_response(db: Session, *, run_id: UUID) -> SummaryRefreshRunResponse:
+    return _to_response(_get_run_or_404(db, run_id))
+
+
+def list_run_responses(db: Session) -> list[SummaryRefreshRunResponse]:
+    return [_to_response(run) for run in list_runs(db)]
+
+
+async def stop_summary_refresh() -> None:
+    """앱 shutdown 에서 호출. 실행 중인 재요약을 INTERRUPTED 로 남기고 멈춘다."""
+
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
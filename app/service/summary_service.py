@@ -1,14 +1,32 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import AzureChatOpenAI
+from collections.abc import AsyncIterator
 from pathlib import Path
+import asyncio
+import hashlib
+import logging
+import re
 
+from app.config.http import HttpBackend, get_http_client
 from app.config.settings import get_settings
+from app.service.llm_limiter_service import llm_limiter
+from app.service.summary_cache_service import get_cached_summary, store_summary, summary_cache_key
 
 
 settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+
+EMPTY_SUMMARY_MESSAGE = "인식된 발화가 없어 요약할 내용이 없습니다."
+
+# 요약 캐시 키에도 포함되므로 바꾸면 이전 요약은 자동으로 무효화된다
+_TEMPERATURE = 0.2
 
 
 def _build_llm() -> AzureChatOpenAI:
@@ -34,12 +52,17 @@ def _build_llm() -> AzureChatOpenAI:
       api_key=settings.azure_openai_api_key,
       azure_deployment=settings.azure_openai_deployment_summary,
       openai_api_version=settings.azure_openai_api_version,
-      temperature=0.2,
+      temperature=_TEMPERATURE,
+      # 429/5xx 재시도는 llm_limiter 가 대기열을 거쳐 처리 (SDK 가 슬롯을 쥔 채 재시도하지 않도록)
+      max_retries=0,
+      # 앱 수명 동안 유지되는 공유 커넥션 풀 사용
+      http_async_client=get_http_client(HttpBackend.AZURE_OPENAI),
   )
 
 
 _llm: AzureChatOpenAI | None = None
 _system_prompt_cache: str | None = None
+_system_prompt_mtime: int | None = None
 _SYSTEM_PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompt" / "summary_system_prompt.txt"
 
 
@@ -50,10 +73,25 @@ def _get_llm() -> AzureChatOpenAI:
   return _llm
 
 
+def reset_llm() -> None:
+  """shutdown 훅: 닫히는 공유 HTTP 클라이언트를 쥔 LLM 인스턴스를 버려, 다음 startup 에서 새 클라이언트로 다시 만든다."""
+
+  global _llm
+  _llm = None
+
+
 def _get_system_prompt() -> str:
-  global _system_prompt_cache
-  if _system_prompt_cache is not None:
+  """summary_system_prompt.txt 내용. 파일 수정 시각이 바뀌면 재시작 없이 다시 읽는다."""
+
+  global _system_prompt_cache, _system_prompt_mtime
+
+  try:
+      mtime = _SYSTEM_PROMPT_PATH.stat().st_mtime_ns
+  except OSError:
+      mtime = None
+  if _system_prompt_cache is not None and mtime == _system_prompt_mtime:
       return _system_prompt_cache
+  _system_prompt_mtime = mtime
 
   default_prompt = (
       "당신은 회의록을 요약하는 비서입니다. "
@@ -72,40 +110,452 @@ def _get_system_prompt() -> str:
   return _system_prompt_cache
 
 
-async def summarize_meeting(transcript: str) -> str:
-  """LangChain + PromptTemplate 를 사용해 회의 요약을 생성."""
+# 긴 회의를 구간별로 요약(map)할 때 쓰는 프롬프트. 최종(reduce) 요약은 summary_system_prompt.txt 형식을 따른다
+_MAP_SYSTEM_PROMPT = (
+    "당신은 긴 회의록의 일부를 정리하는 비서입니다. "
+    "입력은 한국어 회의 전사의 한 구간입니다. 나중에 다른 구간과 합쳐 전체 회의를 요약할 수 있도록, "
+    "이 구간에서 논의된 내용, 결정 사항, TODO(담당자/마감일 포함)를 빠짐없이 간결한 bullet 로 정리하세요. "
+    "구간에 없는 내용은 추측하지 마세요."
+)
+_REDUCE_USER_PREFIX = "다음은 긴 회의를 시간 순서대로 구간별로 정리한 메모입니다. 이를 하나의 회의 요약으로 합쳐 주세요.\n\n"
 
-  # STT 결과가 비어 있으면 굳이 요약 호출을 하지 않고 고정 메시지 반환
-  if not transcript or not transcript.strip():
-      return "인식된 발화가 없어 요약할 내용이 없습니다."
+# 문장 끝(마침표/물음표/느낌표 뒤 공백) 또는 줄바꿈에서 자른다
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+|\n+")
 
-  llm = _get_llm()
 
-  system_prompt = _get_system_prompt()
+def estimate_tokens(text: str) -> int:
+  """토크나이저 없이 쓰는 보수적인 토큰 수 추정.
+
+  영문/숫자(ASCII)는 약 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰으로 계산한다.
+  """
 
-  prompt = ChatPromptTemplate.from_messages(
+  ascii_chars = sum(1 for ch in text if ch.isascii())
+  return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _split_long_sentence(sentence: str, max_tokens: int) -> list[str]:
+  # 문장 하나가 한도를 넘으면 공백 단위로, 그래도 넘으면 글자 수로 자른다
+  pieces: list[str] = []
+  current = ""
+  for word in sentence.split(" "):
+    candidate = f"{current} {word}" if current else word
+    if current and estimate_tokens(candidate) > max_tokens:
+      pieces.append(current)
+      candidate = word
+    while estimate_tokens(candidate) > max_tokens:
+      pieces.append(candidate[:max_tokens])
+      candidate = candidate[max_tokens:]
+    current = candidate
+  if current:
+    pieces.append(current)
+  return pieces
+
+
+def split_transcript(transcript: str, max_tokens: int) -> list[str]:
+  """문장 경계를 지키면서 각 조각이 max_tokens(추정) 이하가 되도록 전사를 나눈다."""
+
+  chunks: list[str] = []
+  current: list[str] = []
+  current_tokens = 0
+  for sentence in _SENTENCE_BOUNDARY.split(transcript):
+    sentence = sentence.strip()
+    if not sentence:
+      continue
+    tokens = estimate_tokens(sentence) + 1
+    if tokens > max_tokens:
+      pieces = _split_long_sentence(sentence, max_tokens)
+    else:
+      pieces = [sentence]
+    for piece in pieces:
+      piece_tokens = estimate_tokens(piece) + 1
+      if current and current_tokens + piece_tokens > max_tokens:
+        chunks.append(" ".join(current))
+        current, current_tokens = [], 0
+      current.append(piece)
+      current_tokens += piece_tokens
+  if current:
+    chunks.append(" ".join(current))
+  return chunks
+
+
+def _build_prompt(system_prompt: str) -> ChatPromptTemplate:
+  return ChatPromptTemplate.from_messages(
       [
           ("system", system_prompt),
           ("user", "{transcript}"),
       ]
   )
 
-  chain = prompt | llm
+
+def _request_tokens(messages: list[BaseMessage]) -> int:
+  # limiter 의 토큰 예산용: 프롬프트 추정치 + 응답 길이 추정치
+  return sum(estimate_tokens(str(m.content)) for m in messages) + settings.summary_llm_completion_tokens
+
+
+def _usage_tokens(message: BaseMessage) -> int:
+  usage = getattr(message, "usage_metadata", None) or {}
+  return int(usage.get("total_tokens", 0))
+
+
+async def _invoke_llm(prompt_value: PromptValue) -> BaseMessage:
+  """공유 limiter(rpm/tpm, AIMD 동시성, 429 대기열)를 거쳐 요약 모델을 호출."""
+
+  messages = prompt_value.to_messages()
+  return await llm_limiter.call(
+      lambda: _get_llm().ainvoke(messages),
+      tokens=_request_tokens(messages),
+      usage=_usage_tokens,
+  )
+
+
+def _build_chain(system_prompt: str):
+  return _build_prompt(system_prompt) | RunnableLambda(_invoke_llm)
+
+
+def _llm_error(exc: Exception) -> HTTPException:
+  # LangChain 내부 예외를 HTTPException 으로 래핑
+  return HTTPException(
+      status_code=status.HTTP_502_BAD_GATEWAY,
+      detail=f"Azure OpenAI 요약 호출 실패: {exc}",
+  )
+
+
+def _empty_response_error() -> HTTPException:
+  return HTTPException(
+      status_code=status.HTTP_502_BAD_GATEWAY,
+      detail="Azure OpenAI 요약 응답에서 내용을 찾을 수 없습니다.",
+  )
+
+
+async def _complete(system_prompt: str, user_text: str) -> tuple[str, int]:
+  """system/user 프롬프트로 요약 모델을 한 번 호출하고 (응답 텍스트, 사용 토큰 수)를 반환."""
+
+  chain = _build_chain(system_prompt)
 
   try:
-      result = await chain.ainvoke({"transcript": transcript})
-  except Exception as exc:  # LangChain 내부 예외를 HTTPException 으로 래핑
-      raise HTTPException(
-          status_code=status.HTTP_502_BAD_GATEWAY,
-          detail=f"Azure OpenAI 요약 호출 실패: {exc}",
-      ) from exc
+      result = await chain.ainvoke({"transcript": user_text})
+  except HTTPException:
+      raise
+  except Exception as exc:
+      raise _llm_error(exc) from exc
 
   # result 는 AIMessage 이므로 content 에 최종 텍스트가 들어 있음
   content = getattr(result, "content", None)
   if not isinstance(content, str) or not content.strip():
-      raise HTTPException(
-          status_code=status.HTTP_502_BAD_GATEWAY,
-          detail="Azure OpenAI 요약 응답에서 내용을 찾을 수 없습니다.",
+      raise _empty_response_error()
+
+  return content.strip(), _usage_tokens(result)
+
+
+async def _stream_complete(system_prompt: str, user_text: str) -> AsyncIterator[tuple[str, int]]:
+  """_complete 의 스트리밍 버전. (텍스트 조각, 이 조각에 보고된 토큰 수)를 도착하는 대로 yield."""
+
+  messages = _build_prompt(system_prompt).format_messages(transcript=user_text)
+  try:
+      async for chunk in llm_limiter.stream(
+          lambda: _get_llm().astream(messages),
+          tokens=_request_tokens(messages),
+          usage=_usage_tokens,
+      ):
+          content = getattr(chunk, "content", None)
+          yield (content if isinstance(content, str) else ""), _usage_tokens(chunk)
+  except HTTPException:
+      raise
+  except Exception as exc:
+      raise _llm_error(exc) from exc
+
+
+async def _map_chunks(chunks: list[str]) -> list[tuple[str, int]]:
+  """구간별 요약을 summary_map_concurrency 개까지 동시에 실행 (순서 유지)."""
+
+  semaphore = asyncio.Semaphore(max(1, settings.summary_map_concurrency))
+
+  async def run(index: int) -> tuple[str, int]:
+    async with semaphore:
+      return await _complete(
+          _MAP_SYSTEM_PROMPT,
+          f"[구간 {index + 1}/{len(chunks)}]\n{chunks[index]}",
       )
 
-  return content.strip()
+  tasks = [asyncio.create_task(run(i)) for i in range(len(chunks))]
+  try:
+    return await asyncio.gather(*tasks)
+  except BaseException:
+    for task in tasks:
+      task.cancel()
+    raise
+
+
+async def _reduce_input(partials: list[tuple[str, int]], *, rounds: int = 1) -> tuple[str, int]:
+  """구간 요약들을 reduce 입력(구간 메모)으로 합친다.
+
+  합친 것도 한도를 넘으면(매우 긴 회의) 다시 나눠 구간별 요약으로 한 번 더 줄인다.
+  """
+
+  total_tokens = 0
+  while True:
+    total_tokens += sum(tokens for _, tokens in partials)
+    notes = "\n\n".join(f"[구간 {i + 1}]\n{text}" for i, (text, _) in enumerate(partials))
+    if len(partials) == 1 or estimate_tokens(notes) <= settings.summary_single_call_max_tokens:
+      return _REDUCE_USER_PREFIX + notes, total_tokens
+
+    chunks = split_transcript(notes, settings.summary_chunk_tokens)
+    rounds += 1
+    logger.info("summary map round %d: %d chunks (~%d tokens)", rounds, len(chunks), estimate_tokens(notes))
+    partials = await _map_chunks(chunks)
+
+
+async def _map_notes(transcript: str) -> tuple[str, int]:
+  """map-reduce 의 map 단계: 구간별 요약을 병렬로 만들어 reduce 입력(구간 메모)을 반환."""
+
+  chunks = split_transcript(transcript, settings.summary_chunk_tokens)
+  logger.info("summary map round 1: %d chunks (~%d tokens)", len(chunks), estimate_tokens(transcript))
+  return await _reduce_input(await _map_chunks(chunks))
+
+
+async def _lookup(transcript: str, system_prompt: str) -> tuple[str | None, str | None]:
+  """(캐시 키, 캐시된 요약) 반환. 캐시를 쓰지 않으면 둘 다 None."""
+
+  if not settings.summary_cache_enabled:
+    return None, None
+
+  cache_key = summary_cache_key(
+      transcript,
+      system_prompt=system_prompt,
+      deployment=settings.azure_openai_deployment_summary or "",
+      temperature=_TEMPERATURE,
+  )
+  return cache_key, await get_cached_summary(cache_key)
+
+
+async def _prepare(transcript: str) -> tuple[str, str | None, str | None]:
+  """(system prompt, 캐시 키, 캐시된 요약) 반환. 캐시를 쓰지 않으면 키/요약은 None."""
+
+  system_prompt = _get_system_prompt()
+  return (system_prompt, *await _lookup(transcript, system_prompt))
+
+
+def prompt_fingerprint() -> str:
+  """현재 system prompt 원문의 SHA-256 (일괄 재요약 실행 기록용)."""
+
+  return hashlib.sha256(_get_system_prompt().encode("utf-8")).hexdigest()
+
+
+async def _store(cache_key: str | None, summary: str, total_tokens: int) -> None:
+  if cache_key is not None:
+    await store_summary(
+        cache_key,
+        deployment=settings.azure_openai_deployment_summary or "",
+        summary=summary,
+        total_tokens=total_tokens,
+    )
+
+
+async def summarize_meeting(transcript: str) -> str:
+  """LangChain + PromptTemplate 를 사용해 회의 요약을 생성.
+
+  전사가 summary_single_call_max_tokens(추정) 이하면 한 번에 요약하고,
+  더 길면 문장 경계로 나눠 구간별로 병렬 요약한 뒤 합친다 (map-reduce).
+  summary_cache_enabled 이면 같은 transcript/prompt/deployment/temperature 의 이전 요약을 재사용한다.
+  """
+
+  # STT 결과가 비어 있으면 굳이 요약 호출을 하지 않고 고정 메시지 반환
+  if not transcript or not transcript.strip():
+      return EMPTY_SUMMARY_MESSAGE
+
+  system_prompt, cache_key, cached = await _prepare(transcript)
+  if cached is not None:
+    return cached
+
+  user_text, total_tokens = transcript, 0
+  if estimate_tokens(transcript) > settings.summary_single_call_max_tokens:
+    user_text, total_tokens = await _map_notes(transcript)
+
+  summary, tokens = await _complete(system_prompt, user_text)
+  await _store(cache_key, summary, total_tokens + tokens)
+  return summary
+
+
+class IncrementalSummarizer:
+  """전사가 끝나기 전에 요약을 시작하는 파이프라인 모드.
+
+  STT 세그먼트가 끝날 때마다 add() 로 넘기면 번호 순서대로 이어 붙이고, 지금까지의 전사가
+  summary_single_call_max_tokens 를 넘어 map-reduce 가 확실해지면 summary_chunk_tokens 만큼 찰 때마다
+  구간 요약(map)을 바로 시작한다. finish() 에서는 남은 꼬리 구간과 reduce 호출만 남으므로
+  긴 녹음의 전체 지연이 (STT + 요약) 이 아니라 max(STT, 요약) 에 가까워진다.
+
+  전사가 한도 이하로 끝나거나, finish() 로 받은 전사가 add() 로 받은 내용과 다르면(캐시 적중 등)
+  summarize_meeting 과 같은 방식으로 처리한다. async with 블록을 벗어나면 진행 중인 구간 요약을 취소한다.
+  """
+
+  def __init__(self) -> None:
+    self._pending: dict[int, str] = {}
+    self._next_index = 0
+    self._texts: list[str] = []
+    self._tokens = 0
+    self._tail = ""
+    self._pipelining = False
+    self._semaphore = asyncio.Semaphore(max(1, settings.summary_map_concurrency))
+    self._tasks: list[asyncio.Task[tuple[str, int]]] = []
+
+  async def __aenter__(self) -> IncrementalSummarizer:
+    return self
+
+  async def __aexit__(self, *exc_info) -> None:
+    await self.aclose()
+
+  async def aclose(self) -> None:
+    """아직 진행 중인 구간 요약을 취소한다 (전사 실패 등으로 finish() 까지 가지 못한 경우)."""
+
+    for task in self._tasks:
+      task.cancel()
+    await asyncio.gather(*self._tasks, return_exceptions=True)
+
+  def add(self, index: int, text: str) -> None:
+    """세그먼트 index 의 전사 결과. 무음/실패로 텍스트가 없는 세그먼트도 "" 로 넘겨야 뒤 세그먼트가 진행된다."""
+
+    self._pending[index] = text
+    while self._next_index in self._pending:
+      text = self._pending.pop(self._next_index).strip()
+      self._next_index += 1
+      if text:
+        self._texts.append(text)
+        self._tokens += estimate_tokens(text) + 1
+        self._tail = f"{self._tail} {text}" if self._tail else text
+    self._dispatch(final=False)
+
+  def _dispatch(self, *, final: bool) -> None:
+    if not self._pipelining:
+      if not settings.summary_pipeline_enabled or self._tokens <= settings.summary_single_call_max_tokens:
+        return
+      self._pipelining = True
+      logger.info("pipelined summary: started map while transcribing (~%d tokens so far)", self._tokens)
+
+    if not final and estimate_tokens(self._tail) <= settings.summary_chunk_tokens:
+      return
+    chunks = split_transcript(self._tail, settings.summary_chunk_tokens)
+    # 아직 이어질 수 있는 마지막 구간은 더 찰 때까지 남겨 둔다
+    self._tail = "" if final or not chunks else chunks.pop()
+    for chunk in chunks:
+      self._tasks.append(asyncio.create_task(self._map(len(self._tasks), chunk)))
+
+  async def _map(self, index: int, chunk: str) -> tuple[str, int]:
+    async with self._semaphore:
+      return await _complete(_MAP_SYSTEM_PROMPT, f"[구간 {index + 1}]\n{chunk}")
+
+  async def finish(self, transcript: str) -> str:
+    """최종 전사로 요약을 마무리한다. summarize_meeting 과 같은 결과 형식/캐시 규칙을 따른다."""
+
+    if not self._pipelining or " ".join(self._texts) != transcript:
+      return await summarize_meeting(transcript)
+
+    system_prompt, cache_key, cached = await _prepare(transcript)
+    if cached is not None:
+      return cached
+
+    self._dispatch(final=True)
+    partials = await asyncio.gather(*self._tasks)
+    logger.info("pipelined summary: %d chunks mapped, reducing", len(partials))
+    user_text, total_tokens = await _reduce_input(list(partials))
+    summary, tokens = await _complete(system_prompt, user_text)
+    await _store(cache_key, summary, total_tokens + tokens)
+    return summary
+
+
+async def stream_summary(transcript: str) -> AsyncIterator[str]:
+  """summarize_meeting 의 스트리밍 버전 (LangChain astream). 요약 텍스트 조각을 생성되는 대로 yield.
+
+  캐시에 있으면 전체 요약을 한 번에 yield 하고, 긴 전사는 map 단계를 마친 뒤 reduce 호출만 스트리밍한다.
+  끝까지 받은 경우에만 캐시에 저장한다.
+  """
+
+  if not transcript or not transcript.strip():
+    yield EMPTY_SUMMARY_MESSAGE
+    return
+
+  system_prompt, cache_key, cached = await _prepare(transcript)
+  if cached is not None:
+    yield cached
+    return
+
+  user_text, total_tokens = transcript, 0
+  if estimate_tokens(transcript) > settings.summary_single_call_max_tokens:
+    user_text, total_tokens = await _map_notes(transcript)
+
+  parts: list[str] = []
+  async for text, tokens in _stream_complete(system_prompt, user_text):
+    total_tokens += tokens
+    if text:
+      parts.append(text)
+      yield text
+
+  summary = "".join(parts).strip()
+  if not summary:
+    raise _empty_response_error()
+  await _store(cache_key, summary, total_tokens)
+
+
+async def summarize_batch(transcripts: list[str], *, max_concurrency: int) -> list[str | HTTPException]:
+  """여러 회의를 한 번에 요약 (일괄 재요약용). 입력 순서대로 요약 또는 실패 시 HTTPException 을 반환한다.
+
+  - 캐시에 있는 요약은 호출 없이 재사용
+  - 짧은 전사는 한 번 만든 체인으로 abatch(max_concurrency) 실행
+  - 긴 전사는 map-reduce (summarize_meeting) 를 max_concurrency 개까지 동시에 실행
+  """
+
+  results: list[str | HTTPException | None] = [None] * len(transcripts)
+  system_prompt = _get_system_prompt()
+  short: list[tuple[int, str | None]] = []
+  long: list[int] = []
+
+  for index, transcript in enumerate(transcripts):
+    if not transcript or not transcript.strip():
+      results[index] = EMPTY_SUMMARY_MESSAGE
+      continue
+    if estimate_tokens(transcript) > settings.summary_single_call_max_tokens:
+      long.append(index)
+      continue
+    cache_key, cached = await _lookup(transcript, system_prompt)
+    if cached is not None:
+      results[index] = cached
+    else:
+      short.append((index, cache_key))
+
+  if short:
+    chain = _build_chain(system_prompt)
+    outputs = await chain.abatch(
+        [{"transcript": transcripts[index]} for index, _ in short],
+        config={"max_concurrency": max(1, max_concurrency)},
+        return_exceptions=True,
+    )
+    for (index, cache_key), output in zip(short, outputs):
+      if isinstance(output, HTTPException):
+        results[index] = output
+        continue
+      if isinstance(output, Exception):
+        results[index] = _llm_error(output)
+        continue
+      content = getattr(output, "content", None)
+      if not isinstance(content, str) or not content.strip():
+        results[index] = _empty_response_error()
+        continue
+      await _store(cache_key, content.strip(), _usage_tokens(output))
+      results[index] = content.strip()
+
+  if long:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(index: int) -> str:
+      async with semaphore:
+        return await summarize_meeting(transcripts[index])
+
+    outputs = await asyncio.gather(*(run(index) for index in long), return_exceptions=True)
+    for index, output in zip(long, outputs):
+      if isinstance(output, HTTPException):
+        results[index] = output
+      elif isinstance(output, Exception):
+        results[index] = _llm_error(output)
+      else:
+        results[index] = output
+
+  return results
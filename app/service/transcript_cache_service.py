@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+import hashlib
+import logging
+import time
+
+import numpy as np
+from prometheus_client import Counter
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config.settings import get_settings
+from app.models.models import TranscriptCacheEntry
+from app.service.audio_service import PcmAudio
+from app.service.cache_service import TtlLruCache
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+TRANSCRIPT_CACHE_LOOKUPS = Counter(
+    "meeting_stt_transcript_cache_lookups_total",
+    "STT 결과 캐시 조회 수",
+    ["tier", "result"],
+)
+
+
+class CachedTranscript(NamedTuple):
+    transcript: str
+    # 세그먼트별 {"start", "duration", "text", "backend"} (보낸 오디오 기준 초). 세그먼트 저장 전에 캐시된 항목은 None
+    segments: list[dict] | None
+
+
+_memory_cache: TtlLruCache[str, CachedTranscript] = TtlLruCache(
+    max_entries=settings.transcript_cache_max_entries,
+    ttl_seconds=settings.transcript_cache_ttl_hours * 3600.0,
+)
+
+# 만료 행 정리는 저장할 때마다가 아니라 일정 간격으로만 수행
+_PRUNE_INTERVAL_SECONDS = 600.0
+_last_pruned_at = 0.0
+
+
+def audio_fingerprint(audio: PcmAudio) -> str:
+    """백엔드로 보낼 정규화된 PCM(mono/16kHz, 무음 제거 후)의 SHA-256.
+
+    hashlib 은 큰 버퍼를 해시할 때 GIL 을 풀기 때문에 오디오 스레드 풀에서 호출한다.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(f"{audio.sample_rate}:{audio.channels}:".encode())
+    digest.update(np.ascontiguousarray(audio.samples, dtype="<i2").data)
+    return digest.hexdigest()
+
+
+def transcript_cache_key(fingerprint: str, backend: str, language: str) -> str:
+    return hashlib.sha256(f"{fingerprint}:{backend}:{language}".encode()).hexdigest()
+
+
+def get_cached_transcript(db: Session, cache_key: str) -> CachedTranscript | None:
+    """프로세스 내 LRU → DB 순으로 조회. DB 에서 찾으면 LRU 에도 채워 둔다."""
+
+    cached = _memory_cache.get(cache_key)
+    if cached is not None:
+        TRANSCRIPT_CACHE_LOOKUPS.labels(tier="memory", result="hit").inc()
+        return cached
+    TRANSCRIPT_CACHE_LOOKUPS.labels(tier="memory", result="miss").inc()
+
+    entry = db.get(TranscriptCacheEntry, cache_key)
+    expires_before = datetime.now(timezone.utc) - timedelta(hours=settings.transcript_cache_ttl_hours)
+    if entry is None or entry.created_at < expires_before:
+        TRANSCRIPT_CACHE_LOOKUPS.labels(tier="db", result="miss").inc()
+        return None
+
+    TRANSCRIPT_CACHE_LOOKUPS.labels(tier="db", result="hit").inc()
+    entry.hit_count += 1
+    entry.last_hit_at = datetime.now(timezone.utc)
+    db.commit()
+
+    cached = CachedTranscript(entry.transcript, entry.segments)
+    _memory_cache.set(cache_key, cached)
+    return cached
+
+
+def store_transcript(
+    db: Session,
+    cache_key: str,
+    *,
+    backend: str,
+    language: str,
+    transcript: str,
+    audio_seconds: float,
+    segments: list[dict] | None = None,
+) -> None:
+    """전사 결과를 두 계층에 저장한다. 같은 키가 이미 있으면 새 결과로 갱신."""
+
+    _memory_cache.set(cache_key, CachedTranscript(transcript, segments))
+
+    stmt = insert(TranscriptCacheEntry).values(
+        cache_key=cache_key,
+        backend=backend,
+        language=language,
+        transcript=transcript,
+        segments=segments,
+        audio_seconds=audio_seconds,
+        hit_count=0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TranscriptCacheEntry.cache_key],
+        set_={
+            "transcript": stmt.excluded.transcript,
+            "segments": stmt.excluded.segments,
+            "created_at": datetime.now(timezone.utc),
+        },
+    )
+    db.execute(stmt)
+    _prune_expired(db)
+    db.commit()
+
+
+def _prune_expired(db: Session) -> None:
+    global _last_pruned_at
+
+    now = time.monotonic()
+    if now - _last_pruned_at < _PRUNE_INTERVAL_SECONDS:
+        return
+    _last_pruned_at = now
+
+    expires_before = datetime.now(timezone.utc) - timedelta(hours=settings.transcript_cache_ttl_hours)
+    result = db.execute(
+        delete(TranscriptCacheEntry).where(TranscriptCacheEntry.created_at < expires_before)
+    )
+    if result.rowcount:
+        logger.info("transcript cache pruned %d expired rows", result.rowcount)
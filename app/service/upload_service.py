@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import BinaryIO
+import logging
+import mmap
+import os
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
+
+from app.config.settings import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger("meeting-stt")
+
+
+def configure_upload_spooling() -> None:
+    """multipart 업로드 파일을 메모리에 두는 최대 크기를 설정한다.
+
+    Starlette 는 업로드 파일을 SpooledTemporaryFile 에 받으며, 이 크기를 넘으면 임시 파일로 내린다.
+    (기본 1MB, 클래스 속성으로만 조정 가능)
+    """
+
+    MultiPartParser.spool_max_size = settings.upload_spool_max_memory_bytes
+
+
+def _release(view: memoryview, mapped: mmap.mmap) -> None:
+    # 디코딩된 numpy 배열이 아직 버퍼를 참조하고 있으면 닫을 수 없으므로 GC 에 맡긴다
+    try:
+        view.release()
+        mapped.close()
+    except BufferError:
+        logger.debug("mmap still referenced, leaving it to the garbage collector")
+
+
+@contextmanager
+def map_file(file: BinaryIO) -> Iterator[memoryview]:
+    """열린 파일 전체를 읽기 전용 mmap 으로 매핑한 memoryview. 파일 내용을 힙으로 복사하지 않는다."""
+
+    file.flush()
+    if os.fstat(file.fileno()).st_size == 0:
+        yield memoryview(b"")
+        return
+
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        _release(view, mapped)
+
+
+@contextmanager
+def map_path(path: str | Path) -> Iterator[memoryview]:
+    with open(path, "rb") as file, map_file(file) as view:
+        yield view
+
+
+@asynccontextmanager
+async def open_upload(upload: UploadFile) -> AsyncIterator[memoryview]:
+    """UploadFile 을 통째로 read() 하지 않고 memoryview 로 노출한다.
+
+    upload_spool_max_memory_bytes 이하의 작은 업로드는 이미 메모리에 있으므로 그대로 읽고,
+    그보다 크면 Starlette 가 내려 둔 임시 파일을 mmap 해서 넘긴다.
+    """
+
+    if upload.size is not None and upload.size <= settings.upload_spool_max_memory_bytes:
+        yield memoryview(await upload.read())
+        return
+
+    # SpooledTemporaryFile.fileno() 는 아직 메모리에 있으면 디스크로 내린 뒤 fd 를 반환한다
+    await run_in_threadpool(upload.file.fileno)
+    with map_file(upload.file) as view:
+        yield view
+
+
+async def copy_upload(upload: UploadFile, path: Path) -> None:
+    """업로드를 chunk 단위로 path 에 복사한다 (비동기 작업용 보관 파일)."""
+
+    def copy() -> None:
+        upload.file.seek(0)
+        with open(path, "wb") as out:
+            while chunk := upload.file.read(settings.upload_chunk_bytes):
+                out.write(chunk)
+
+    await run_in_threadpool(copy)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.config.settings import get_settings
+from app.service.audio_service import PcmAudio
+
+
+settings = get_settings()
+
+# dBFS 계산 시 log(0) 방지용
+_EPS = 1e-10
+
+
+@dataclass(frozen=True)
+class SpeechAudio:
+    """무음 구간을 제거하고 발화 구간만 이어 붙인 오디오.
+
+    regions 는 원본 오디오 기준 발화 구간 [start, end) 프레임 목록이고,
+    audio 에는 각 구간 사이에 gap_frames 만큼의 무음이 들어 있다.
+    """
+
+    audio: PcmAudio
+    regions: list[tuple[int, int]]
+    gap_frames: int
+    source_seconds: float
+
+    @property
+    def has_speech(self) -> bool:
+        return bool(self.regions)
+
+    @property
+    def speech_seconds(self) -> float:
+        """백엔드로 실제 전송되는(= 과금되는) 길이."""
+
+        return self.audio.duration_seconds
+
+    def source_seconds_at(self, seconds: float) -> float:
+        """이어 붙인 오디오의 시각(초)을 원본 오디오 기준 시각으로 바꾼다. gap 안의 시각은 앞 구간의 끝으로 본다."""
+
+        sample_rate = self.audio.sample_rate
+        frame = round(seconds * sample_rate)
+        offset = 0
+        for start, end in self.regions:
+            length = end - start
+            if frame < offset + length + self.gap_frames:
+                return (start + min(max(frame - offset, 0), length)) / sample_rate
+            offset += length + self.gap_frames
+        return self.regions[-1][1] / sample_rate if self.regions else 0.0
+
+
+# 특징 계산 시 한 번에 처리하는 VAD 프레임 수 (float 중간 배열 크기를 녹음 길이와 무관하게 유지)
+_FEATURE_BLOCK_FRAMES = 4096
+
+
+def _frame_features(audio: PcmAudio, frame_frames: int) -> tuple[np.ndarray, np.ndarray]:
+    """프레임별 에너지(dBFS)와 zero-crossing rate 를 벡터 연산으로 계산."""
+
+    num_frames = audio.num_frames // frame_frames
+    pcm = audio.samples[: num_frames * frame_frames, 0].reshape(num_frames, frame_frames)
+
+    energy_db = np.empty(num_frames, dtype=np.float64)
+    zcr = np.empty(num_frames, dtype=np.float64)
+    for start in range(0, num_frames, _FEATURE_BLOCK_FRAMES):
+        end = min(num_frames, start + _FEATURE_BLOCK_FRAMES)
+        frames = pcm[start:end].astype(np.float32) / 32768.0
+        energy_db[start:end] = 10.0 * np.log10(np.mean(np.square(frames), axis=1) + _EPS)
+        signs = np.signbit(frames)
+        zcr[start:end] = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(frame_frames - 1)
+    return energy_db, zcr
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """bool 배열에서 True 가 연속되는 구간의 [start, end) 인덱스."""
+
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return edges[0::2], edges[1::2]
+
+
+def detect_speech_regions(audio: PcmAudio) -> list[tuple[int, int]]:
+    """프레임 에너지 + ZCR 기반 VAD. 원본 기준 발화 구간 [start, end) 프레임 목록을 반환.
+
+    - 임계값: 하위 10% 프레임 에너지(잡음 바닥) + stt_vad_threshold_db 를
+      [stt_vad_min_energy_dbfs, stt_vad_max_threshold_dbfs] 로 제한
+      (무음 없이 계속 말하는 녹음에서 잡음 바닥이 발화 레벨로 잡혀 발화를 버리지 않도록 상한을 둠)
+    - 임계값을 넘더라도 ZCR 이 높은(히스/바람 같은 광대역 잡음) 약한 프레임은 제외
+    - 짧은 발화 조각은 버리고, 짧은 무음은 메우고, 앞뒤로 padding 을 붙인다
+    """
+
+    frame_ms = settings.stt_vad_frame_ms
+    frame_frames = max(2, audio.sample_rate * frame_ms // 1000)
+    if audio.channels != 1:
+        raise ValueError("VAD expects mono audio")
+    if audio.num_frames < frame_frames:
+        return []
+
+    energy_db, zcr = _frame_features(audio, frame_frames)
+
+    noise_floor = float(np.percentile(energy_db, 10))
+    threshold = min(
+        max(noise_floor + settings.stt_vad_threshold_db, settings.stt_vad_min_energy_dbfs),
+        settings.stt_vad_max_threshold_dbfs,
+    )
+    strong = energy_db >= threshold + settings.stt_vad_strong_margin_db
+    speech = (energy_db >= threshold) & ((zcr <= settings.stt_vad_max_zcr) | strong)
+
+    # 너무 짧은 발화 조각(클릭, 기침 등) 제거
+    min_speech = max(1, settings.stt_vad_min_speech_ms // frame_ms)
+    starts, ends = _runs(speech)
+    for start, end in zip(starts, ends):
+        if end - start < min_speech:
+            speech[start:end] = False
+
+    # 발화 사이의 짧은 무음은 하나의 구간으로 합침
+    min_silence = max(1, settings.stt_vad_min_silence_ms // frame_ms)
+    starts, ends = _runs(~speech)
+    for start, end in zip(starts, ends):
+        if 0 < start and end < len(speech) and end - start < min_silence:
+            speech[start:end] = True
+
+    padding = settings.stt_vad_padding_ms // frame_ms
+    regions: list[tuple[int, int]] = []
+    for start, end in zip(*_runs(speech)):
+        lo = max(0, int(start) - padding) * frame_frames
+        hi = min(audio.num_frames, (int(end) + padding) * frame_frames)
+        if regions and lo <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], hi)
+        else:
+            regions.append((lo, hi))
+    return regions
+
+
+def extract_speech(audio: PcmAudio) -> SpeechAudio:
+    """VAD 로 찾은 발화 구간만 남기고, 구간 사이에는 짧은 무음(gap)을 넣어 이어 붙인다.
+
+    gap 은 단어가 붙어 인식되는 것을 막고, 세그먼트 분할(split_on_silence)이 자를 자리가 된다.
+    """
+
+    regions = detect_speech_regions(audio)
+    gap_frames = audio.sample_rate * settings.stt_vad_gap_ms // 1000
+
+    pieces: list[np.ndarray] = []
+    gap = np.zeros((gap_frames, audio.channels), dtype=np.int16)
+    for i, (start, end) in enumerate(regions):
+        if i:
+            pieces.append(gap)
+        pieces.append(audio.samples[start:end])
+
+    samples = (
+        np.concatenate(pieces) if pieces else np.zeros((0, audio.channels), dtype=np.int16)
+    )
+    return SpeechAudio(
+        audio=PcmAudio(samples=samples, sample_rate=audio.sample_rate),
+        regions=regions,
+        gap_frames=gap_frames,
+        source_seconds=audio.duration_seconds,
+    )
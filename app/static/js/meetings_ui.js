@@ -9,6 +9,8 @@ const tabSttEl = document.getElementById('tabStt');
 const tabSummaryEl = document.getElementById('tabSummary');
 const quotaBtn = document.getElementById('quotaBtn');
 const sttQuotaInfoEl = document.getElementById('sttQuotaInfo');
+const meetingSearchEl = document.getElementById('meetingSearch');
+const meetingAudioEl = document.getElementById('meetingAudio');
 
 function activateTab(tab) {
   const isStt = tab === 'stt';
@@ -37,7 +39,7 @@ function renderMeetingList(items) {
   if (!items || items.length === 0) {
     const empty = document.createElement('div');
     empty.className = 'text-slate-300 text-xs';
-    empty.textContent = '아직 저장된 회의가 없습니다.';
+    empty.textContent = meetingSearchEl?.value.trim() ? '검색 결과가 없습니다.' : '아직 저장된 회의가 없습니다.';
     meetingListEl.appendChild(empty);
     return;
   }
@@ -76,26 +78,89 @@ function renderMeetingList(items) {
       void deleteMeeting(m.id);
     });
 
+    if (m.snippet) {
+      // 검색 결과: 서버가 HTML escape 후 일치 부분만 <mark> 로 감싼 snippet
+      const snippet = document.createElement('div');
+      snippet.className = 'mt-1 text-[11px] text-sky-100/80 line-clamp-3';
+      snippet.innerHTML = m.snippet;
+      labelSpan.appendChild(snippet);
+    }
+
     row.appendChild(labelSpan);
     row.appendChild(deleteBtn);
     meetingListEl.appendChild(row);
   });
 }
 
+let listRequestSeq = 0; // 검색어를 빠르게 바꿀 때 늦게 도착한 이전 응답은 버린다
+
 async function fetchMeetingList() {
+  const query = meetingSearchEl?.value.trim();
+  const seq = ++listRequestSeq;
   try {
-    const resp = await fetch('/meetings');
+    const resp = await fetch(query ? `/meetings/search?q=${encodeURIComponent(query)}` : '/meetings/');
     if (!resp.ok) {
       console.error('[Meeting-STT] 회의 리스트 조회 실패', resp.status);
       return;
     }
     const data = await resp.json();
-    renderMeetingList(data);
+    if (seq !== listRequestSeq) return;
+    renderMeetingList(data.items);
   } catch (err) {
     console.error('[Meeting-STT] 회의 리스트 조회 에러', err);
   }
 }
 
+let searchTimer = null;
+meetingSearchEl?.addEventListener('input', () => {
+  clearTimeout(searchTimer);
+  searchTimer = setTimeout(() => void fetchMeetingList(), 250);
+});
+
+let summarySource = null; // 진행 중인 요약 스트림 (EventSource)
+
+// 요약 토큰을 SSE 로 받아 SUMMARY 탭에 이어 붙인다. 완료되면 서버가 요약을 저장한다
+function streamSummary(id) {
+  if (summarySource) summarySource.close();
+  if (summaryViewEl) summaryViewEl.textContent = '요약 생성 중...';
+
+  const source = new EventSource(`/meetings/${id}/summary/stream`);
+  summarySource = source;
+  let received = '';
+
+  source.addEventListener('delta', (e) => {
+    received += JSON.parse(e.data).text;
+    if (summaryViewEl) summaryViewEl.textContent = received;
+  });
+  source.addEventListener('done', (e) => {
+    if (summaryViewEl) summaryViewEl.textContent = JSON.parse(e.data).summary || '';
+    source.close();
+    if (summarySource === source) summarySource = null;
+    void fetchMeetingList();
+  });
+  source.addEventListener('error', (e) => {
+    // 서버가 보낸 error 이벤트(e.data 있음)와 연결 오류를 모두 여기서 처리
+    const detail = e.data ? JSON.parse(e.data).detail : '연결이 끊겼습니다.';
+    console.error('[Meeting-STT] 요약 스트림 오류', detail);
+    if (summaryViewEl) summaryViewEl.textContent = received || '요약 생성 실패: ' + detail;
+    source.close();
+    if (summarySource === source) summarySource = null;
+  });
+}
+
+function showMeetingAudio(url) {
+  if (!meetingAudioEl) return;
+  // preload="metadata" 라 재생/탐색할 때 필요한 구간만 Range 요청으로 받는다
+  if (url) {
+    meetingAudioEl.src = url;
+    meetingAudioEl.classList.remove('hidden');
+  } else {
+    meetingAudioEl.removeAttribute('src');
+    meetingAudioEl.load();
+    meetingAudioEl.classList.add('hidden');
+  }
+}
+
 async function loadMeetingDetail(id) {
   try {
     const resp = await fetch(`/meetings/${id}`);
@@ -107,7 +172,14 @@ async function loadMeetingDetail(id) {
     console.log('[Meeting-STT] 회의 상세 transcript:', data.full_transcript);
     console.log('[Meeting-STT] 회의 상세 summary:', data.summary);
     if (sttViewEl) sttViewEl.textContent = data.full_transcript || '';
+    showMeetingAudio(data.audio_url);
+    if (summarySource) {
+      summarySource.close();
+      summarySource = null;
+    }
     if (summaryViewEl) summaryViewEl.textContent = data.summary || '';
+    // 실시간 녹음 직후 등 요약이 아직 없는 회의는 스트리밍으로 생성
+    if (data.full_transcript && !data.summary) streamSummary(data.id);
   } catch (err) {
     console.error('[Meeting-STT] 회의 상세 조회 에러', err);
   }
@@ -125,6 +197,7 @@ async function deleteMeeting(id) {
 
     if (sttViewEl) sttViewEl.textContent = '';
     if (summaryViewEl) summaryViewEl.textContent = '';
+    showMeetingAudio(null);
 
     void fetchMeetingList();
   } catch (err) {
@@ -166,10 +239,17 @@ quotaBtn?.addEventListener('click', () => {
 window.meetingUI = {
   fetchMeetingList,
   activateTab,
+  // 실시간 녹음 중 도착한 partial 전사 결과를 STT 탭에 표시
+  showPartialTranscript(text) {
+    activateTab('stt');
+    if (sttViewEl) sttViewEl.textContent = text;
+    if (summaryViewEl) summaryViewEl.textContent = '';
+  },
   updateAfterRecord(data) {
     if (sttViewEl) sttViewEl.textContent = data.transcript || '';
     if (summaryViewEl) summaryViewEl.textContent = data.summary || '';
     void fetchMeetingList();
+    if (data.id && !data.summary) streamSummary(data.id);
   },
 };
 
@@ -11,6 +11,11 @@ let audioProcessor = null;
 let audioChunks = [];
 let audioSampleRate = 44100;
 
+// 실시간 전사(WebSocket) 상태. 연결에 실패하면 기존처럼 녹음 종료 후 업로드한다
+let streamSocket = null;
+let streamPartials = new Map(); // 세그먼트 index → 전사 텍스트
+let streamFinal = null; // final 이벤트를 기다리는 Promise
+
 const startBtn = document.getElementById('startBtn');
 const stopBtn = document.getElementById('stopBtn');
 const statusEl = document.getElementById('status');
@@ -72,6 +77,173 @@ function encodeWAV(samples, sampleRate) {
   return new Blob([view], { type: 'audio/wav' });
 }
 
+function floatToInt16Buffer(input) {
+  const buffer = new ArrayBuffer(input.length * 2);
+  floatTo16BitPCM(new DataView(buffer), 0, input);
+  return buffer;
+}
+
+function renderPartials() {
+  const text = [...streamPartials.entries()]
+    .sort((a, b) => a[0] - b[0])
+    .map(([, t]) => t)
+    .filter((t) => t)
+    .join(' ');
+  if (window.meetingUI?.showPartialTranscript) {
+    window.meetingUI.showPartialTranscript(text);
+  }
+}
+
+// /meetings/stream WebSocket 을 열고, 서버가 started 를 보내면 resolve (실패 시 null)
+function openStreamSocket(sampleRate) {
+  return new Promise((resolve) => {
+    const scheme = window.location.protocol === 'https:' ? 'wss' : 'ws';
+    let socket;
+    try {
+      socket = new WebSocket(`${scheme}://${window.location.host}/meetings/stream?sample_rate=${sampleRate}&defer_summary=true`);
+    } catch (err) {
+      console.warn('[Meeting-STT] WebSocket 생성 실패, 업로드 방식으로 녹음', err);
+      resolve(null);
+      return;
+    }
+    socket.binaryType = 'arraybuffer';
+    streamPartials = new Map();
+
+    let resolveFinal;
+    let rejectFinal;
+    streamFinal = new Promise((res, rej) => {
+      resolveFinal = res;
+      rejectFinal = rej;
+    });
+    // 녹음 중 연결이 끊긴 경우 등 아무도 기다리지 않는 reject 가 콘솔 오류로 남지 않도록
+    streamFinal.catch(() => {});
+
+    let started = false;
+    socket.onmessage = (e) => {
+      const event = JSON.parse(e.data);
+      if (event.type === 'started') {
+        started = true;
+        console.log('[Meeting-STT] 실시간 전사 시작, meeting', event.meeting_id);
+        resolve(socket);
+      } else if (event.type === 'partial') {
+        streamPartials.set(event.index, event.text);
+        renderPartials();
+      } else if (event.type === 'final') {
+        resolveFinal(event);
+      } else if (event.type === 'error') {
+        console.warn('[Meeting-STT] 실시간 전사 오류', event.detail);
+      }
+    };
+    socket.onerror = () => {
+      console.warn('[Meeting-STT] WebSocket 오류');
+    };
+    socket.onclose = () => {
+      if (!started) resolve(null);
+      rejectFinal(new Error('WebSocket 연결이 종료되었습니다.'));
+    };
+  });
+}
+
+async function stopStreaming() {
+  statusEl.textContent = '마지막 구간 인식 및 요약 중...';
+  try {
+    streamSocket.send(JSON.stringify({ type: 'stop' }));
+    const event = await streamFinal;
+    const data = { id: event.meeting_id, transcript: event.transcript, summary: event.summary };
+    statusEl.textContent = '완료';
+
+    console.log('[Meeting-STT] 서버 인식 결과 transcript:', data.transcript);
+    console.log('[Meeting-STT] 서버 요약 결과 summary:', data.summary);
+
+    if (window.meetingUI?.updateAfterRecord) {
+      window.meetingUI.updateAfterRecord(data);
+    }
+  } catch (err) {
+    console.error('[Meeting-STT] 실시간 전사 종료 중 오류', err);
+    statusEl.textContent = '실시간 전사 연결이 끊겼습니다.';
+  } finally {
+    streamSocket = null;
+    streamFinal = null;
+    releaseAudio();
+  }
+}
+
+function releaseAudio() {
+  // 마이크/오디오 리소스 정리
+  if (currentStream) {
+    currentStream.getTracks().forEach((track) => track.stop());
+    currentStream = null;
+  }
+
+  if (audioProcessor) {
+    audioProcessor.disconnect();
+    audioProcessor = null;
+  }
+
+  if (audioSource) {
+    audioSource.disconnect();
+    audioSource = null;
+  }
+
+  if (audioContext) {
+    audioContext.close();
+    audioContext = null;
+  }
+}
+
+const JOB_STATUS_LABELS = {
+  queued: '처리 대기 중...',
+  transcribing: '음성 인식 중...',
+  summarizing: '요약 생성 중...',
+  saving: '저장 중...',
+  completed: '완료',
+  failed: '실패',
+};
+
+function isJobFinished(job) {
+  return job.status === 'completed' || job.status === 'failed';
+}
+
+// SSE 연결이 끊기면(프록시 등) 상태 조회 API 를 주기적으로 호출
+async function pollJob(jobId) {
+  for (;;) {
+    const resp = await fetch(`/meetings/jobs/${jobId}`);
+    if (!resp.ok) {
+      throw new Error('작업 상태 조회 실패: ' + resp.status);
+    }
+    const job = await resp.json();
+    statusEl.textContent = JOB_STATUS_LABELS[job.status] || job.status;
+    if (isJobFinished(job)) return job;
+    await new Promise((resolve) => setTimeout(resolve, 2000));
+  }
+}
+
+// 백그라운드 작업의 단계 변화를 SSE 로 받아 상태 표시줄에 반영하고, 끝나면 최종 상태를 반환
+function waitForJob(jobId) {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`/meetings/jobs/${jobId}/events`);
+    let finished = false;
+
+    source.addEventListener('status', (e) => {
+      const job = JSON.parse(e.data);
+      console.log('[Meeting-STT] 작업 상태', job.status);
+      statusEl.textContent = JOB_STATUS_LABELS[job.status] || job.status;
+      if (isJobFinished(job)) {
+        finished = true;
+        source.close();
+        resolve(job);
+      }
+    });
+
+    source.onerror = () => {
+      if (finished) return;
+      console.warn('[Meeting-STT] SSE 연결 끊김, 상태 조회로 전환');
+      source.close();
+      pollJob(jobId).then(resolve, reject);
+    };
+  });
+}
+
 async function stopRecordingAndUpload() {
   console.log('[Meeting-STT] 녹음 stop 이벤트, WAV 생성');
 
@@ -100,19 +272,34 @@ async function stopRecordingAndUpload() {
   formData.append('duration_seconds', String(durationSeconds));
 
   try {
-    const resp = await fetch('/meetings/record', {
+    // 업로드만 하고 202 + job id 를 받은 뒤, 처리 진행 상황은 SSE 로 받는다
+    const resp = await fetch('/meetings/record/async', {
       method: 'POST',
       body: formData,
     });
 
     if (!resp.ok) {
       const text = await resp.text();
-      console.error('[Meeting-STT] /meetings/record 에러', resp.status, text);
+      console.error('[Meeting-STT] /meetings/record/async 에러', resp.status, text);
       statusEl.textContent = '에러: ' + resp.status + ' ' + text;
       return;
     }
 
-    const data = await resp.json();
+    const job = await waitForJob((await resp.json()).id);
+    if (job.status === 'failed') {
+      console.error('[Meeting-STT] 작업 실패', job.error);
+      statusEl.textContent = '에러: ' + (job.error || '처리 실패');
+      return;
+    }
+
+    const detailResp = await fetch(`/meetings/${job.meeting_id}`);
+    if (!detailResp.ok) {
+      statusEl.textContent = '에러: 회의 조회 실패 ' + detailResp.status;
+      return;
+    }
+
+    const detail = await detailResp.json();
+    const data = { id: detail.id, transcript: detail.full_transcript, summary: detail.summary };
     statusEl.textContent = '완료';
 
     console.log('[Meeting-STT] 서버 인식 결과 transcript:', data.transcript);
@@ -126,26 +313,7 @@ async function stopRecordingAndUpload() {
     console.error('[Meeting-STT] 요청 중 오류', err);
     statusEl.textContent = '요청 중 오류 발생';
   } finally {
-    // 마이크/오디오 리소스 정리
-    if (currentStream) {
-      currentStream.getTracks().forEach((track) => track.stop());
-      currentStream = null;
-    }
-
-    if (audioProcessor) {
-      audioProcessor.disconnect();
-      audioProcessor = null;
-    }
-
-    if (audioSource) {
-      audioSource.disconnect();
-      audioSource = null;
-    }
-
-    if (audioContext) {
-      audioContext.close();
-      audioContext = null;
-    }
+    releaseAudio();
   }
 }
 
@@ -167,8 +335,15 @@ startBtn.onclick = async () => {
     audioSource = audioContext.createMediaStreamSource(stream);
     audioProcessor = audioContext.createScriptProcessor(4096, 1, 1);
 
+    streamSocket = await openStreamSocket(audioSampleRate);
+
     audioProcessor.onaudioprocess = (e) => {
       const input = e.inputBuffer.getChannelData(0);
+      if (streamSocket && streamSocket.readyState === WebSocket.OPEN) {
+        // 실시간 전사: 16bit PCM 으로 바로 전송 (서버가 무음 지점마다 잘라 전사)
+        streamSocket.send(floatToInt16Buffer(input));
+      }
+      // 녹음 중 연결이 끊기면 전체 녹음을 업로드할 수 있도록 계속 보관
       audioChunks.push(new Float32Array(input));
     };
 
@@ -176,7 +351,7 @@ startBtn.onclick = async () => {
     audioProcessor.connect(audioContext.destination);
 
     startTime = Date.now();
-    statusEl.textContent = '녹음 중...';
+    statusEl.textContent = streamSocket ? '녹음 중... (실시간 인식)' : '녹음 중...';
     startBtn.disabled = true;
     stopBtn.disabled = false;
   } catch (err) {
@@ -195,6 +370,11 @@ stopBtn.onclick = () => {
   stopBtn.disabled = true;
   statusEl.textContent = '녹음 종료';
 
+  if (streamSocket && streamSocket.readyState === WebSocket.OPEN) {
+    void stopStreaming();
+    return;
+  }
+
   // Web Audio 기반 녹음 종료 및 업로드
   void stopRecordingAndUpload();
 };
@@ -0,0 +1,108 @@
+"""GET /meetings/{id}/audio 탐색(Range) 비용: 파일 전체를 읽어 잘라 주는 방식과 FileResponse(현재) 비교.
+
+--minutes 분 길이의 WAV(16kHz mono 16bit, 무작위 PCM)로 임시 회의를 만들고, 무작위 위치에서 --range-kb KB 씩
+--seeks 번 요청해 요청당 지연(median)과 Python 메모리 최대 사용량(tracemalloc)을 잰 뒤 회의/파일을 지운다.
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.audio_range --minutes 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import struct
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+import numpy as np
+from fastapi import FastAPI, Response
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.routers.meetings import router
+from app.service.meeting_service import create_meeting, delete_meeting_service
+
+
+SAMPLE_RATE = 16000
+
+
+def write_wav(path: Path, minutes: float) -> None:
+    frames = int(minutes * 60 * SAMPLE_RATE)
+    header = b"RIFF" + struct.pack("<I", 36 + frames * 2) + b"WAVEfmt "
+    header += struct.pack("<IHHIIHH", 16, 1, 1, SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16) + b"data" + struct.pack("<I", frames * 2)
+    rng = np.random.default_rng(0)
+    with open(path, "wb") as file:
+        file.write(header)
+        for start in range(0, frames, SAMPLE_RATE * 60):
+            file.write(rng.integers(-3000, 3000, min(SAMPLE_RATE * 60, frames - start), dtype="<i2").tobytes())
+
+
+def naive_app(path: Path) -> FastAPI:
+    """Range 를 직접 처리하되 매 요청 파일 전체를 메모리로 읽는 방식."""
+
+    app = FastAPI()
+
+    @app.get("/audio")
+    def audio(range: str) -> Response:
+        start, end = (int(value) for value in range.removeprefix("bytes=").split("-"))
+        data = path.read_bytes()
+        return Response(data[start : end + 1], status_code=206, media_type="audio/wav")
+
+    return app
+
+
+async def measure(app: FastAPI, url: str, size: int, args: argparse.Namespace) -> tuple[float, float]:
+    rng = random.Random(1)
+    range_bytes = args.range_kb * 1024
+    timings = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        tracemalloc.start()
+        for _ in range(args.seeks):
+            start = rng.randrange(0, size - range_bytes)
+            header = f"bytes={start}-{start + range_bytes - 1}"
+            started = time.perf_counter()
+            response = await client.get(url, headers={"Range": header}, params={"range": header})
+            timings.append(time.perf_counter() - started)
+            assert response.status_code == 206 and len(response.content) == range_bytes
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return float(np.median(timings)) * 1000, peak / 1024 / 1024
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "long.wav"
+        write_wav(source, args.minutes)
+        size = source.stat().st_size
+        async with AsyncSessionLocal() as db:
+            meeting = await create_meeting(db, transcript="audio-range-bench", summary="", audio=source)
+        try:
+            app = FastAPI()
+            app.include_router(router)
+            print(f"{args.minutes:g} min WAV, {size / 1024 / 1024:.1f} MB, {args.seeks} seeks x {args.range_kb} KB")
+            print(f"{'mode':>14} {'ms/seek':>9} {'peak MB':>9}")
+            ms, peak = await measure(naive_app(source), "/audio", size, args)
+            print(f"{'read + slice':>14} {ms:>9.2f} {peak:>9.1f}")
+            ms, peak = await measure(app, f"/meetings/{meeting.id}/audio", size, args)
+            print(f"{'FileResponse':>14} {ms:>9.2f} {peak:>9.1f}")
+        finally:
+            async with AsyncSessionLocal() as db:
+                await delete_meeting_service(db, meeting_id=meeting.id)
+            await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=60)
+    parser.add_argument("--seeks", type=int, default=50)
+    parser.add_argument("--range-kb", type=int, default=256)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
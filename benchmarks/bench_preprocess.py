@@ -0,0 +1,111 @@
+"""업로드 오디오 전처리(mono/16kHz) 전후의 전송 바이트 수와 end-to-end 지연 비교.
+
+Azure Speech 대신 httpx.MockTransport 로 만든 가짜 백엔드를 사용하며,
+업링크 대역폭(모든 세그먼트가 공유)과 백엔드 처리 시간을 흉내 낸다.
+
+실행:
+    uv run python -m benchmarks.bench_preprocess --minutes 1 10 30 --uplink-mbps 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+import numpy as np
+
+from app.service.audio_service import PcmAudio, decode_wav, encode_wav, preprocess_audio
+from app.service.stt_routing_service import RoutedResult
+from app.service.stt_service import settings, transcribe_segments
+
+
+def synthetic_wav(seconds: float, sample_rate: int = 48000) -> bytes:
+    """발화(잡음 버스트 3~8초)와 무음(0.5~2초)이 번갈아 나오는 mono 16bit WAV."""
+
+    rng = np.random.default_rng(0)
+    parts: list[np.ndarray] = []
+    total = 0
+    target = int(seconds * sample_rate)
+    while total < target:
+        speech = rng.normal(0, 3000, int(rng.uniform(3, 8) * sample_rate))
+        silence = rng.normal(0, 30, int(rng.uniform(0.5, 2) * sample_rate))
+        parts.extend((speech, silence))
+        total += len(speech) + len(silence)
+    samples = np.concatenate(parts)[:target].astype(np.int16).reshape(-1, 1)
+    return encode_wav(PcmAudio(samples=samples, sample_rate=sample_rate))
+
+
+class FakeBackend:
+    """업링크를 공유하는 가짜 STT 백엔드. 전송량과 요청 수를 기록한다."""
+
+    def __init__(self, uplink_mbps: float, processing_seconds: float) -> None:
+        self.bytes_per_second = uplink_mbps * 1_000_000 / 8
+        self.processing_seconds = processing_seconds
+        self.link_free_at = 0.0
+        self.bytes_sent = 0
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        self.bytes_sent += len(body)
+        self.requests += 1
+
+        # 업링크는 한 번에 한 요청씩 직렬로 전송된다고 가정
+        now = time.perf_counter()
+        start = max(now, self.link_free_at)
+        self.link_free_at = start + len(body) / self.bytes_per_second
+        await asyncio.sleep(self.link_free_at - now + self.processing_seconds)
+        return httpx.Response(200, json={"RecognitionStatus": "Success", "DisplayText": "ok"})
+
+
+async def run_pipeline(wav: bytes, *, preprocess: bool, backend: FakeBackend) -> float:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(backend.handle))
+
+    async def transcribe_one(segment: PcmAudio) -> RoutedResult:
+        resp = await client.post("http://fake/stt", content=encode_wav(segment))
+        return RoutedResult(text=resp.json()["DisplayText"], backend="fake")
+
+    started = time.perf_counter()
+    if preprocess:
+        audio = await asyncio.to_thread(
+            preprocess_audio, wav, target_rate=settings.stt_target_sample_rate
+        )
+    else:
+        audio = decode_wav(wav)
+    await transcribe_segments(audio, transcribe_one)
+    elapsed = time.perf_counter() - started
+
+    await client.aclose()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--sample-rate", type=int, default=48000)
+    parser.add_argument("--uplink-mbps", type=float, default=20.0)
+    parser.add_argument("--processing-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(
+        f"uplink={args.uplink_mbps}Mbps processing={args.processing_seconds}s "
+        f"concurrency={settings.stt_segment_concurrency} input={args.sample_rate}Hz"
+    )
+    print(f"{'minutes':>8} {'mode':>12} {'requests':>9} {'wire MB':>9} {'latency s':>10}")
+
+    for minutes in args.minutes:
+        wav = synthetic_wav(minutes * 60, args.sample_rate)
+        for preprocess in (False, True):
+            backend = FakeBackend(args.uplink_mbps, args.processing_seconds)
+            elapsed = await run_pipeline(wav, preprocess=preprocess, backend=backend)
+            mode = "preprocess" if preprocess else "passthrough"
+            print(
+                f"{minutes:>8g} {mode:>12} {backend.requests:>9d} "
+                f"{backend.bytes_sent / 1_000_000:>9.2f} {elapsed:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""대용량 업로드를 동시에 처리할 때의 최대 메모리 사용량 비교 (bytes 로 읽기 vs 임시 파일 mmap).
+
+48kHz stereo 합성 WAV 를 디스크에 만든 뒤, 업로드 N 건을 동시에 STT 파이프라인(정규화 → VAD → 분할 전사)에
+넣고 모드별로 별도 프로세스에서 다음을 측정한다.
+
+- heap peak: tracemalloc 으로 잰 Python/NumPy 힙 최대 사용량 (mmap 된 파일 페이지는 포함되지 않음)
+- max RSS: 프로세스 최대 RSS (mmap 으로 읽은 파일 페이지도 포함되며, 이 페이지는 커널이 회수할 수 있음)
+
+STT 백엔드는 httpx.MockTransport 로 만든 가짜 Whisper 를 사용하므로 네트워크/DB 가 필요 없다.
+--max-heap-mb 를 주면 spooled 모드의 heap peak 가 이를 넘을 때 종료 코드 1 로 끝난다 (회귀 검사용).
+POST /meetings/record 동시 업로드의 heap peak 상한은 tests/test_upload_memory.py,
+무음 분할(split_on_silence)은 tests/test_audio_service.py 가 pytest 로 검사한다.
+
+실행:
+    uv run python -m benchmarks.bench_upload_memory --minutes 20 --concurrency 3
+    uv run python -m benchmarks.bench_upload_memory --minutes 60 --concurrency 2 --max-heap-mb 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+# 설정은 import 시점에 읽히므로 app 모듈보다 먼저 지정
+os.environ.setdefault("USE_SPEECH_SERVICE", "false")
+os.environ.setdefault("USE_WHISPER_API", "true")
+os.environ.setdefault("WHISPER_API_BASE_URL", "http://whisper.invalid")
+os.environ.setdefault("WHISPER_API_KEY", "bench")
+os.environ.setdefault("TRANSCRIPT_CACHE_ENABLED", "false")
+
+import httpx  # noqa: E402
+from fastapi import UploadFile  # noqa: E402
+
+from app.config import http  # noqa: E402
+from app.config.http import HttpBackend  # noqa: E402
+from app.service.audio_service import _wav_header  # noqa: E402
+from app.service.stt_service import transcribe  # noqa: E402
+from app.service.upload_service import open_upload  # noqa: E402
+
+
+def write_synthetic_wav(path: str, seconds: float, sample_rate: int = 48000, channels: int = 2) -> None:
+    """발화(3~8초)와 무음(0.5~2초)이 번갈아 나오는 16bit WAV 를 블록 단위로 디스크에 기록."""
+
+    rng = np.random.default_rng(0)
+    total = int(seconds * sample_rate)
+    with open(path, "wb") as out:
+        out.write(_wav_header(channels, sample_rate, total * channels * 2))
+        written = 0
+        while written < total:
+            speech = rng.normal(0, 3000, (int(rng.uniform(3, 8) * sample_rate), channels))
+            silence = rng.normal(0, 30, (int(rng.uniform(0.5, 2) * sample_rate), channels))
+            block = np.concatenate((speech, silence))[: total - written].astype("<i2")
+            out.write(block.tobytes())
+            written += len(block)
+
+
+async def fake_whisper(request: httpx.Request) -> httpx.Response:
+    await request.aread()
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"text": "ok"})
+
+
+async def run_mode(mode: str, path: str, concurrency: int) -> None:
+    http._clients[HttpBackend.WHISPER] = httpx.AsyncClient(transport=httpx.MockTransport(fake_whisper))
+    size = os.path.getsize(path)
+
+    async def one() -> None:
+        with open(path, "rb") as file:
+            upload = UploadFile(file=file, size=size, filename="recording.wav")
+            if mode == "read":
+                # 이전 방식: await audio.read() 로 업로드 전체를 bytes 로 올림
+                await transcribe(await upload.read(), None)
+            else:
+                async with open_upload(upload) as audio_buffer:
+                    await transcribe(audio_buffer, None)
+
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+
+
+def child(args: argparse.Namespace) -> None:
+    tracemalloc.start()
+    asyncio.run(run_mode(args.mode, args.path, args.concurrency))
+    _, heap_peak = tracemalloc.get_traced_memory()
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{heap_peak / 2**20:.1f} {max_rss_kb / 1024:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--max-heap-mb", type=float, default=None)
+    parser.add_argument("--mode", choices=["read", "spooled"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "upload.wav")
+        write_synthetic_wav(path, args.minutes * 60)
+        file_mb = os.path.getsize(path) / 2**20
+        print(f"upload={file_mb:.0f}MB (48kHz stereo, {args.minutes:g} min) concurrency={args.concurrency}")
+        print(f"{'mode':>8} {'heap peak MB':>13} {'max RSS MB':>11}")
+
+        results: dict[str, float] = {}
+        for mode in ("read", "spooled"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_upload_memory", "--mode", mode, "--path", path,
+                 "--concurrency", str(args.concurrency)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            heap_peak, max_rss = float(out[-2]), float(out[-1])
+            results[mode] = heap_peak
+            print(f"{mode:>8} {heap_peak:>13.1f} {max_rss:>11.1f}")
+
+    if args.max_heap_mb is not None and results["spooled"] > args.max_heap_mb:
+        print(f"FAIL: spooled heap peak {results['spooled']:.1f}MB > {args.max_heap_mb:.1f}MB")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
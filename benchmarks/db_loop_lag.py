@@ -0,0 +1,122 @@
+"""DB 호출이 이벤트 루프를 얼마나 막는지 비교하는 동시성 벤치마크.
+
+/meetings/record 한 건이 DB 에서 하는 일(쿼터 예약/해제 + 회의 저장 + 삭제)을 동시에 여러 개 실행하면서,
+10ms 마다 깨어나는 ticker 가 실제로 얼마나 늦게 깨어나는지(event loop lag)를 잰다.
+
+- sync: 예전 방식. async 함수 안에서 동기 Session 을 바로 호출 (쿼리마다 루프 전체가 멈춤)
+- async: AsyncSession (psycopg async) + 동기 쿼터 코드는 run_sync 로 실행
+
+lag 이 크면 그동안 다른 업로드/STT 응답 처리/WebSocket 메시지가 모두 멈춘다는 뜻이다.
+로컬 DB 는 왕복 시간이 짧아 차이가 작으므로 --db-latency-ms 로 원격 DB 의 왕복 지연을 흉내 낼 수 있다
+(요청마다 SELECT pg_sleep 한 번).
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.db_loop_lag --concurrency 16 --requests 400 --db-latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import numpy as np
+from sqlalchemy import select, func
+
+from app.config.db import AsyncSessionLocal, SessionLocal, close_db, init_db
+from app.models.models import Meeting, MeetingTranscript
+from app.repository.meeting_respository import create_meeting, delete_meeting
+from app.service.quota_service import release_quota, reserve_quota
+
+
+PROVIDER = "loop_bench"
+LIMIT_SECONDS = 1e12
+
+
+def sync_request(latency: float) -> None:
+    with SessionLocal() as db:
+        if latency:
+            db.execute(select(func.pg_sleep(latency)))
+        reservation = reserve_quota(db, PROVIDER, 60.0, limit_seconds=LIMIT_SECONDS)
+        release_quota(db, reservation)
+        meeting = Meeting(id=uuid.uuid4(), summary="loop bench")
+        db.add_all([meeting, MeetingTranscript(meeting_id=meeting.id, content="loop bench")])
+        db.commit()
+        db.delete(meeting)
+        db.commit()
+
+
+async def async_request(latency: float) -> None:
+    async with AsyncSessionLocal() as db:
+        if latency:
+            await db.execute(select(func.pg_sleep(latency)))
+        reservation = await db.run_sync(reserve_quota, PROVIDER, 60.0, limit_seconds=LIMIT_SECONDS)
+        await db.run_sync(release_quota, reservation)
+        meeting = await create_meeting(db, full_transcript="loop bench", summary="loop bench")
+        await delete_meeting(db, meeting_id=meeting.id)
+
+
+async def ticker(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> None:
+    latency = args.db_latency_ms / 1000.0
+    lags: list[float] = []
+    stop = asyncio.Event()
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            if mode == "sync":
+                sync_request(latency)
+                # 동기 호출 사이에 다른 태스크가 돌 수 있도록 (예전 코드의 await 지점에 해당)
+                await asyncio.sleep(0)
+            else:
+                await async_request(latency)
+
+    tick = asyncio.create_task(ticker(args.tick_ms / 1000.0, lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    wall = time.perf_counter() - started
+    stop.set()
+    await tick
+
+    p50, p99 = np.percentile(lags, [50, 99]) * 1000 if lags else (0.0, 0.0)
+    print(
+        f"{mode:>6} {args.requests / wall:>8.1f} {p50:>10.2f} {p99:>10.2f} {max(lags, default=0.0) * 1000:>10.2f} "
+        f"{len(lags):>7}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    # 풀/연결 준비 비용이 측정에 섞이지 않도록 한 번씩 먼저 실행
+    sync_request(0.0)
+    await async_request(0.0)
+
+    print(f"concurrency={args.concurrency} requests={args.requests} db_latency={args.db_latency_ms}ms tick={args.tick_ms}ms")
+    print(f"{'mode':>6} {'req/s':>8} {'lag p50':>10} {'lag p99':>10} {'lag max':>10} {'ticks':>7}   (lag: ms)")
+    for mode in args.modes:
+        await run_mode(mode, args)
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="요청마다 추가하는 DB 왕복 지연 (pg_sleep)")
+    parser.add_argument("--tick-ms", type=float, default=10.0)
+    parser.add_argument("--modes", nargs="+", choices=["sync", "async"], default=["sync", "async"])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
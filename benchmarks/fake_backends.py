@@ -0,0 +1,252 @@
+"""부하 테스트용 가짜 외부 백엔드 서버 (Azure Speech STT REST / Whisper API / Azure OpenAI chat completions).
+
+실제 과금 API 대신 이 서버를 띄우고 앱 설정을 이 주소로 돌리면 /meetings/record 전체 경로를
+비용 없이 부하 테스트할 수 있다. 백엔드별로 다음을 설정할 수 있다.
+
+- median / p95: 응답 지연 분포 (로그정규분포, 초)
+- rtf: 오디오 1초당 추가 처리 시간 (STT 전용, WAV 헤더로 길이 계산)
+- error: 5xx(500/503) 응답 비율
+- throttle: 무작위 429 응답 비율
+- concurrency: 동시 처리 한도. 넘치는 요청은 바로 429 (0 이면 무제한)
+- retry_after: 429 응답의 Retry-After 헤더 값 (초)
+
+예:
+    uv run python -m benchmarks.fake_backends --port 9100 \\
+        --azure-speech median=0.4,p95=1.2,rtf=0.15,error=0.01,concurrency=20 \\
+        --whisper median=0.8,p95=2.5,rtf=0.05,throttle=0.02 \\
+        --azure-openai median=2,p95=6,concurrency=8,retry_after=2
+
+    # 앱 설정
+    AZURE_SPEECH_STT_BASE_URL=http://127.0.0.1:9100
+    WHISPER_API_BASE_URL=http://127.0.0.1:9100
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:9100
+
+GET /_stats 로 백엔드별 요청/응답 코드 수를 조회할 수 있다.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, fields
+import argparse
+import asyncio
+import json
+import math
+import random
+import struct
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class BackendProfile:
+    median: float = 0.3
+    p95: float = 1.0
+    rtf: float = 0.0
+    error: float = 0.0
+    throttle: float = 0.0
+    concurrency: int = 0
+    retry_after: float = 1.0
+
+    @classmethod
+    def parse(cls, spec: str) -> BackendProfile:
+        """"median=0.4,p95=1.2,error=0.01" 형식의 문자열을 파싱."""
+
+        profile = cls()
+        types = {f.name: f.type for f in fields(cls)}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = item.partition("=")
+            if key not in types:
+                raise argparse.ArgumentTypeError(f"unknown option {key!r} (choices: {', '.join(types)})")
+            setattr(profile, key, int(value) if types[key] == "int" else float(value))
+        return profile
+
+    def latency(self, audio_seconds: float = 0.0) -> float:
+        # 중앙값 m, 95 백분위 p 인 로그정규분포: sigma = ln(p / m) / z(0.95)
+        sigma = math.log(max(self.p95, self.median) / self.median) / 1.645 if self.median > 0 else 0.0
+        base = random.lognormvariate(math.log(self.median), sigma) if self.median > 0 else 0.0
+        return base + self.rtf * audio_seconds
+
+
+class FakeBackend:
+    def __init__(self, name: str, profile: BackendProfile) -> None:
+        self.name = name
+        self.profile = profile
+        self.in_flight = 0
+        self.responses: Counter[int] = Counter()
+
+    def _reply(self, status_code: int, body: dict, headers: dict | None = None) -> JSONResponse:
+        self.responses[status_code] += 1
+        return JSONResponse(body, status_code=status_code, headers=headers)
+
+    async def handle(self, audio_seconds: float, body: dict) -> JSONResponse:
+        profile = self.profile
+        if (profile.concurrency and self.in_flight >= profile.concurrency) or random.random() < profile.throttle:
+            return self._reply(
+                429,
+                {"error": {"code": "429", "message": "Too many requests"}},
+                {"Retry-After": f"{profile.retry_after:g}"},
+            )
+
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(profile.latency(audio_seconds))
+        finally:
+            self.in_flight -= 1
+
+        if random.random() < profile.error:
+            return self._reply(random.choice((500, 503)), {"error": {"message": "injected failure"}})
+        return self._reply(200, body)
+
+    async def handle_stream(self, content: str, model: str) -> Response:
+        """chat completions stream=true 응답. 지연의 30% 뒤 첫 토큰, 나머지는 토큰마다 고르게 나눠 보낸다."""
+
+        profile = self.profile
+        if (profile.concurrency and self.in_flight >= profile.concurrency) or random.random() < profile.throttle:
+            return self._reply(
+                429,
+                {"error": {"code": "429", "message": "Too many requests"}},
+                {"Retry-After": f"{profile.retry_after:g}"},
+            )
+        if random.random() < profile.error:
+            return self._reply(random.choice((500, 503)), {"error": {"message": "injected failure"}})
+
+        self.responses[200] += 1
+        tokens = content.split(" ")
+        total = profile.latency()
+
+        def event(delta: dict, finish_reason: str | None = None) -> str:
+            chunk = {
+                "id": "chatcmpl-fake-stream",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+        async def body():
+            self.in_flight += 1
+            try:
+                await asyncio.sleep(total * 0.3)
+                for i, token in enumerate(tokens):
+                    yield event({"content": token if i == 0 else " " + token})
+                    await asyncio.sleep(total * 0.7 / len(tokens))
+                yield event({}, "stop")
+                yield "data: [DONE]\n\n"
+            finally:
+                self.in_flight -= 1
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "requests": sum(self.responses.values()),
+            "responses": {str(code): count for code, count in sorted(self.responses.items())},
+        }
+
+
+def wav_seconds(body: bytes) -> float:
+    """WAV 헤더(fmt/data chunk)로 길이 계산. WAV 가 아니면(FLAC 등) 16kHz mono 16bit 로 가정."""
+
+    if len(body) >= 12 and body[:4] == b"RIFF" and body[8:12] == b"WAVE":
+        offset, byte_rate = 12, 0
+        while offset + 8 <= len(body):
+            chunk_id, size = struct.unpack_from("<4sI", body, offset)
+            if chunk_id == b"fmt " and size >= 16:
+                byte_rate = struct.unpack_from("<I", body, offset + 16)[0]
+            elif chunk_id == b"data" and byte_rate:
+                return min(size, len(body) - offset - 8) / byte_rate
+            offset += 8 + size + (size & 1)
+    return len(body) / 32000.0
+
+
+def create_app(
+    azure_speech: BackendProfile,
+    whisper: BackendProfile,
+    azure_openai: BackendProfile,
+) -> FastAPI:
+    backends = {
+        "azure_speech": FakeBackend("azure_speech", azure_speech),
+        "whisper": FakeBackend("whisper", whisper),
+        "azure_openai": FakeBackend("azure_openai", azure_openai),
+    }
+    app = FastAPI(title="Fake meeting-stt backends")
+
+    @app.post("/speech/recognition/conversation/cognitiveservices/v1")
+    async def azure_speech_stt(request: Request) -> JSONResponse:
+        seconds = wav_seconds(await request.body())
+        return await backends["azure_speech"].handle(
+            seconds,
+            {
+                "RecognitionStatus": "Success",
+                "DisplayText": f"가짜 Azure 전사 결과 {seconds:.1f}초.",
+                "Offset": 0,
+                "Duration": int(seconds * 10_000_000),
+            },
+        )
+
+    @app.post("/transcribe")
+    async def whisper_transcribe(request: Request) -> JSONResponse:
+        seconds = wav_seconds(await request.body())
+        return await backends["whisper"].handle(seconds, {"text": f"가짜 Whisper 전사 결과 {seconds:.1f}초."})
+
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def azure_openai_chat(deployment: str, request: Request) -> Response:
+        payload = await request.json()
+        summary = "- 회의 개요: 가짜 요약\n- TODO: 없음"
+        if payload.get("stream"):
+            return await backends["azure_openai"].handle_stream(summary, deployment)
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in payload.get("messages", []))
+        return await backends["azure_openai"].handle(
+            0.0,
+            {
+                "id": f"chatcmpl-fake-{time.monotonic_ns()}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": deployment,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": summary},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": prompt_chars // 2, "completion_tokens": 20, "total_tokens": prompt_chars // 2 + 20},
+            },
+        )
+
+    # 앱의 HTTP 워밍업(HEAD 기본 URL)용
+    @app.head("/")
+    async def warmup() -> JSONResponse:
+        return JSONResponse({})
+
+    @app.get("/_stats")
+    async def stats() -> dict:
+        return {name: backend.stats() for name, backend in backends.items()}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--azure-speech", type=BackendProfile.parse, default=BackendProfile(median=0.4, p95=1.2, rtf=0.1))
+    parser.add_argument("--whisper", type=BackendProfile.parse, default=BackendProfile(median=0.6, p95=2.0, rtf=0.05))
+    parser.add_argument("--azure-openai", type=BackendProfile.parse, default=BackendProfile(median=1.5, p95=4.0))
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    app = create_app(args.azure_speech, args.whisper, args.azure_openai)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
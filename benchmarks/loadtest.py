@@ -0,0 +1,290 @@
+"""/meetings/record 엔드투엔드 부하 테스트.
+
+가짜 백엔드(benchmarks.fake_backends)를 별도 프로세스로 띄우고, 실제 FastAPI 앱에 합성 WAV 업로드를
+목표 동시성으로 계속 보낸 뒤 다음을 출력한다.
+
+- 처리량: 성공한 요청의 오디오 길이 합 / 경과 시간 (audio-seconds per wall-second), req/s
+- 단계별 p50/p95/p99 지연: total(클라이언트 측정) + Server-Timing 헤더의 audio / stt / summary / db
+- 오류 분류: 상태 코드 + detail 별 건수, 가짜 백엔드가 돌려준 응답 코드 수
+
+기본은 앱을 같은 프로세스에서 httpx.ASGITransport 로 호출한다 (DATABASE_URL 의 DB 필요).
+--url 을 주면 이미 떠 있는 서버로 요청을 보낸다. 이때 서버는 SERVER_TIMING_ENABLED=true 이고
+STT/요약 설정이 가짜 백엔드(--backends-url 또는 이 스크립트가 띄운 서버)를 가리켜야 한다.
+
+실행:
+    uv run python -m benchmarks.loadtest --concurrency 8 --requests 200 --audio-seconds 30:120
+    uv run python -m benchmarks.loadtest --duration 60 --concurrency 16 \\
+        --azure-speech median=0.4,p95=1.2,rtf=0.1,throttle=0.05 --azure-openai median=2,p95=6,concurrency=4
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+import argparse
+import asyncio
+import io
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+import httpx
+
+
+@dataclass
+class Result:
+    status_code: int
+    audio_seconds: float
+    total_seconds: float
+    stages: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def synthetic_wav(seconds: float, seed: int, sample_rate: int = 48000) -> bytes:
+    """발화(3~8초)/무음(0.5~2초)이 번갈아 나오는 16bit mono WAV.
+
+    요청마다 seed 를 다르게 해 transcript 캐시에 걸리지 않게 한다.
+    """
+
+    from app.service.audio_service import _wav_header
+
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    blocks, written = [], 0
+    while written < total:
+        speech = rng.normal(0, 3000, int(rng.uniform(3, 8) * sample_rate))
+        silence = rng.normal(0, 30, int(rng.uniform(0.5, 2) * sample_rate))
+        block = np.concatenate((speech, silence))[: total - written]
+        blocks.append(block)
+        written += len(block)
+    pcm = np.clip(np.concatenate(blocks), -32768, 32767).astype("<i2").tobytes()
+    return _wav_header(1, sample_rate, len(pcm)) + pcm
+
+
+def parse_server_timing(header: str | None) -> dict[str, float]:
+    stages: dict[str, float] = {}
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if name and key == "dur":
+                stages[name] = float(value) / 1000.0
+    return stages
+
+
+def parse_range(value: str) -> tuple[float, float]:
+    low, _, high = value.partition(":")
+    return float(low), float(high or low)
+
+
+def start_fake_backends(args: argparse.Namespace, port: int) -> subprocess.Popen:
+    cmd = [sys.executable, "-m", "benchmarks.fake_backends", "--port", str(port)]
+    for name in ("azure_speech", "whisper", "azure_openai"):
+        spec = getattr(args, name)
+        if spec:
+            cmd += [f"--{name.replace('_', '-')}", spec]
+    if args.seed is not None:
+        cmd += ["--seed", str(args.seed)]
+    proc = subprocess.Popen(cmd)
+
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/_stats", timeout=0.5).raise_for_status()
+            return proc
+        except httpx.HTTPError:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit("fake backends failed to start")
+
+
+def configure_app_env(backends_url: str, stt: str) -> None:
+    """앱 모듈 import 전에 호출. 외부 백엔드를 모두 가짜 서버로 돌린다 (이미 지정된 값은 유지)."""
+
+    env = {
+        "USE_SPEECH_SERVICE": str(stt in ("azure", "both")).lower(),
+        "USE_WHISPER_API": str(stt in ("whisper", "both")).lower(),
+        "AZURE_SPEECH_KEY": "loadtest",
+        "AZURE_SPEECH_REGION": "loadtest",
+        "AZURE_SPEECH_STT_BASE_URL": backends_url,
+        "WHISPER_API_BASE_URL": backends_url,
+        "WHISPER_API_KEY": "loadtest",
+        "AZURE_OPENAI_ENDPOINT": backends_url,
+        "AZURE_OPENAI_API_KEY": "loadtest",
+        "AZURE_OPENAI_DEPLOYMENT_SUMMARY": "loadtest",
+        "SERVER_TIMING_ENABLED": "true",
+        "TRANSCRIPT_CACHE_ENABLED": "false",
+        "SUMMARY_CACHE_ENABLED": "false",
+        # 부하 테스트가 월 무료 쿼터에 걸려 Whisper 로 넘어가거나 429 가 나지 않도록
+        "STT_FREE_QUOTA_HOURS_PER_MONTH": "1000000",
+        "MEETING_JOB_WORKERS": "0",
+    }
+    for key, value in env.items():
+        os.environ.setdefault(key, value)
+
+
+async def send_one(client: httpx.AsyncClient, audio: bytes, audio_seconds: float) -> Result:
+    files = {"audio": ("recording.wav", io.BytesIO(audio), "audio/wav")}
+    started = time.perf_counter()
+    try:
+        resp = await client.post("/meetings/record", files=files, data={"duration_seconds": f"{audio_seconds:.2f}"})
+    except httpx.HTTPError as exc:
+        return Result(0, audio_seconds, time.perf_counter() - started, error=type(exc).__name__)
+    elapsed = time.perf_counter() - started
+
+    error = None
+    if resp.status_code != 201:
+        try:
+            detail = str(resp.json().get("detail"))
+        except ValueError:
+            detail = resp.text
+        error = detail[:80]
+    return Result(resp.status_code, audio_seconds, elapsed, parse_server_timing(resp.headers.get("server-timing")), error)
+
+
+async def drive(client: httpx.AsyncClient, args: argparse.Namespace) -> tuple[list[Result], float]:
+    low, high = parse_range(args.audio_seconds)
+    rng = random.Random(args.seed)
+
+    # 업로드 본문 생성은 측정에서 제외하기 위해 미리 만들어 둔다 (서로 다른 seed 로 pool 개)
+    pool_size = max(args.concurrency * 2, 8)
+    if args.requests is not None:
+        pool_size = min(pool_size, args.requests)
+    pool = []
+    for i in range(pool_size):
+        seconds = rng.uniform(low, high)
+        pool.append((synthetic_wav(seconds, seed=i), seconds))
+
+    results: list[Result] = []
+    sent = 0
+    deadline = time.perf_counter() + args.duration if args.duration else None
+
+    async def worker() -> None:
+        nonlocal sent
+        while True:
+            if args.requests is not None and sent >= args.requests:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            audio, seconds = pool[sent % len(pool)]
+            sent += 1
+            results.append(await send_one(client, audio, seconds))
+            if len(results) % max(1, args.concurrency) == 0:
+                ok = sum(r.status_code == 201 for r in results)
+                print(f"  ... {len(results)} done ({ok} ok)", file=sys.stderr)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return results, time.perf_counter() - started
+
+
+def report(results: list[Result], wall: float, backend_stats: dict | None) -> None:
+    ok = [r for r in results if r.status_code == 201]
+    audio_total = sum(r.audio_seconds for r in ok)
+    print(f"\nrequests={len(results)} ok={len(ok)} failed={len(results) - len(ok)} wall={wall:.1f}s")
+    print(f"throughput: {audio_total / wall:.2f} audio-s/s, {len(ok) / wall:.2f} req/s "
+          f"(audio processed {audio_total:.0f}s)")
+
+    stages: dict[str, list[float]] = defaultdict(list)
+    for r in ok:
+        stages["total"].append(r.total_seconds)
+        for name, seconds in r.stages.items():
+            stages[name].append(seconds)
+
+    if stages:
+        print(f"\n{'stage':>8} {'n':>6} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'max s':>8}")
+        for name in ("total", "audio", "stt", "summary", "db", *sorted(set(stages) - {"total", "audio", "stt", "summary", "db"})):
+            values = stages.get(name)
+            if not values:
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            print(f"{name:>8} {len(values):>6} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f} {max(values):>8.2f}")
+        if not any(r.stages for r in ok):
+            print("(Server-Timing 헤더 없음: 서버에 SERVER_TIMING_ENABLED=true 필요)")
+
+    errors = Counter((r.status_code, r.error) for r in results if r.status_code != 201)
+    if errors:
+        print("\nerrors:")
+        for (code, detail), count in errors.most_common():
+            print(f"  {count:>5} × {code} {detail}")
+
+    if backend_stats:
+        print("\nfake backends:")
+        for name, stats in backend_stats.items():
+            print(f"  {name:>12}: {stats['requests']} requests {stats['responses']}")
+
+
+async def run(args: argparse.Namespace, backends_url: str | None) -> None:
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        results, wall = await drive(client, args)
+        await client.aclose()
+    else:
+        import app.main as app_main
+
+        await app_main.on_startup()
+        try:
+            transport = httpx.ASGITransport(app=app_main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://app", timeout=args.timeout) as client:
+                results, wall = await drive(client, args)
+        finally:
+            await app_main.on_shutdown()
+
+    backend_stats = None
+    if backends_url:
+        try:
+            backend_stats = httpx.get(f"{backends_url}/_stats", timeout=5).json()
+        except httpx.HTTPError:
+            pass
+    report(results, wall, backend_stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=None, help="총 요청 수 (--duration 과 함께 없으면 50)")
+    parser.add_argument("--duration", type=float, default=None, help="이 시간(초) 동안 계속 요청")
+    parser.add_argument("--audio-seconds", default="30:90", help="업로드 길이 범위 (예: 30 또는 20:120)")
+    parser.add_argument("--stt", choices=["azure", "whisper", "both"], default="azure")
+    parser.add_argument("--url", default=None, help="이미 떠 있는 앱 서버 주소 (없으면 같은 프로세스에서 실행)")
+    parser.add_argument("--backends-url", default=None, help="이미 떠 있는 가짜 백엔드 주소 (없으면 새로 띄움)")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--azure-speech", default=None, help="fake_backends 프로필 (예: median=0.4,p95=1.2,rtf=0.1)")
+    parser.add_argument("--whisper", default=None)
+    parser.add_argument("--azure-openai", default=None)
+    args = parser.parse_args()
+    if args.requests is None and args.duration is None:
+        args.requests = 50
+
+    proc = None
+    backends_url = args.backends_url
+    if backends_url is None:
+        port = free_port()
+        proc = start_fake_backends(args, port)
+        backends_url = f"http://127.0.0.1:{port}"
+    configure_app_env(backends_url, args.stt)
+
+    print(f"concurrency={args.concurrency} audio={args.audio_seconds}s stt={args.stt} backends={backends_url}")
+    try:
+        asyncio.run(run(args, backends_url))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""GET /meetings, GET /meetings/{id} 응답 캐시: 매번 조회 + 직렬화(예전) / 캐시 적중 / If-None-Match 304 비교.
+
+임시 회의를 --meetings 개 만들고(전사 --transcript-chars 자), 목록 첫 페이지와 회의 상세를 세 방식으로 --repeat 번씩
+처리하는 시간(median)과 본문 크기를 잰 뒤 만든 회의를 지운다. 서비스 계층에서 재므로 HTTP 전송 시간은 빠져 있다
+(304 는 본문이 없어 실제로는 전송량도 줄어든다).
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.meeting_cache --meetings 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import delete, insert
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.models.models import Meeting, MeetingTranscript
+from app.service.meeting_service import MeetingService, get_meeting_service, list_meetings_service
+
+
+TITLE = "meeting-cache-bench"
+
+
+async def seed(args: argparse.Namespace) -> list[uuid.UUID]:
+    transcript = ("가나다라마바사 " * (args.transcript_chars // 8 + 1))[: args.transcript_chars]
+    base = datetime.now(timezone.utc) + timedelta(days=1)
+    ids = [uuid.uuid4() for _ in range(args.meetings)]
+    async with AsyncSessionLocal() as db:
+        # 목록 첫 페이지가 벤치마크 회의가 되도록 현재보다 나중 시각으로 만든다
+        await db.execute(
+            insert(Meeting),
+            [
+                {"id": meeting_id, "title": TITLE, "summary": "요약 문장입니다. " * 100, "created_at": base + timedelta(seconds=i)}
+                for i, meeting_id in enumerate(ids)
+            ],
+        )
+        await db.execute(insert(MeetingTranscript), [{"meeting_id": meeting_id, "content": transcript} for meeting_id in ids])
+        await db.commit()
+    return ids
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Meeting).where(Meeting.title == TITLE))
+        await db.commit()
+
+
+async def measure(fn, repeat: int) -> tuple[float, int]:
+    await fn()
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = await fn()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000, size
+
+
+async def uncached_list(limit: int) -> int:
+    async with AsyncSessionLocal() as db:
+        return len((await list_meetings_service(db, limit=limit)).model_dump_json().encode())
+
+
+async def uncached_detail(meeting_id: uuid.UUID) -> int:
+    async with AsyncSessionLocal() as db:
+        return len((await get_meeting_service(db, meeting_id=meeting_id)).model_dump_json().encode())
+
+
+async def cached_list(limit: int, if_none_match: str | None = None) -> int:
+    async with AsyncSessionLocal() as db:
+        return len((await MeetingService(db).list_meetings(limit=limit, if_none_match=if_none_match)).body)
+
+
+async def cached_detail(meeting_id: uuid.UUID, if_none_match: str | None = None) -> int:
+    async with AsyncSessionLocal() as db:
+        return len((await MeetingService(db).get_meeting(meeting_id=meeting_id, if_none_match=if_none_match)).body)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    await cleanup()
+    ids = await seed(args)
+    try:
+        async with AsyncSessionLocal() as db:
+            service = MeetingService(db)
+            list_etag = (await service.list_meetings(limit=args.limit)).headers["etag"]
+            detail_etag = (await service.get_meeting(meeting_id=ids[0])).headers["etag"]
+
+        print(f"repeat={args.repeat} (ms: median)")
+        print(f"{'endpoint':>8} {'mode':>10} {'ms':>8} {'bytes':>8}")
+        cases = {
+            "list": {
+                "uncached": lambda: uncached_list(args.limit),
+                "cache hit": lambda: cached_list(args.limit),
+                "304": lambda: cached_list(args.limit, list_etag),
+            },
+            "detail": {
+                "uncached": lambda: uncached_detail(ids[0]),
+                "cache hit": lambda: cached_detail(ids[0]),
+                "304": lambda: cached_detail(ids[0], detail_etag),
+            },
+        }
+        for endpoint, modes in cases.items():
+            for mode, fn in modes.items():
+                ms, size = await measure(fn, args.repeat)
+                print(f"{endpoint:>8} {mode:>10} {ms:>8.2f} {size:>8}")
+    finally:
+        await cleanup()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--transcript-chars", type=int, default=30000)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""GET /meetings/export: 서버 측 cursor 스트리밍(현재)과 한 번에 읽어 직렬화(buffered) 비교.
+
+임시 회의를 --meetings 개 만들고(전사 --transcript-chars 자), 전체 컬럼을 NDJSON 으로 내보내면서
+첫 chunk 까지 걸린 시간, 전체 시간, Python 메모리 최대 사용량(tracemalloc), 출력 크기를 잰 뒤 만든 회의를 지운다.
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.meeting_export --meetings 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.models.meeting import MeetingExportRow
+from app.models.models import Meeting, MeetingTranscript
+from app.repository.meeting_respository import EXPORT_COLUMNS
+from app.service.meeting_service import export_meetings_ndjson
+
+
+TITLE = "meeting-export-bench"
+# 실제 회의와 섞이지 않도록 이 구간에만 만들고 내보낸다
+BASE = datetime(1990, 1, 1, tzinfo=timezone.utc)
+
+
+async def seed(args: argparse.Namespace) -> None:
+    transcript = ("가나다라마바사 " * (args.transcript_chars // 8 + 1))[: args.transcript_chars]
+    async with AsyncSessionLocal() as db:
+        for start in range(0, args.meetings, 1000):
+            ids = [uuid.uuid4() for _ in range(start, min(start + 1000, args.meetings))]
+            await db.execute(
+                insert(Meeting),
+                [
+                    {"id": meeting_id, "title": TITLE, "summary": "요약 문장입니다. " * 50, "created_at": BASE + timedelta(minutes=start + i)}
+                    for i, meeting_id in enumerate(ids)
+                ],
+            )
+            await db.execute(insert(MeetingTranscript), [{"meeting_id": meeting_id, "content": transcript} for meeting_id in ids])
+            await db.commit()
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Meeting).where(Meeting.title == TITLE))
+        await db.commit()
+
+
+async def buffered(created_to: datetime) -> AsyncIterator[bytes]:
+    """서버 측 cursor 없이 전체를 읽은 뒤 한 번에 직렬화 (offset 페이지를 모두 모으는 것과 같은 메모리 특성)."""
+
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(Meeting.id, Meeting.created_at, *EXPORT_COLUMNS.values())
+            .outerjoin(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+            .where(Meeting.created_at < created_to)
+            .order_by(Meeting.created_at, Meeting.id)
+        )
+        rows = (await db.execute(stmt)).all()
+    yield "".join(MeetingExportRow(**row._mapping).model_dump_json(exclude_unset=True) + "\n" for row in rows).encode()
+
+
+async def run(label: str, chunks: AsyncIterator[bytes]) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    size = 0
+    async for chunk in chunks:
+        if first is None:
+            first = time.perf_counter() - started
+        size += len(chunk)
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>14} {first * 1000:>10.1f} {total:>9.2f} {peak / 1024 / 1024:>11.1f} {size / 1024 / 1024:>10.1f}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    await cleanup()
+    print(f"seeding {args.meetings} meetings ...")
+    await seed(args)
+    created_to = BASE + timedelta(minutes=args.meetings)
+    try:
+        print(f"{'mode':>14} {'first ms':>10} {'total s':>9} {'peak MB':>11} {'output MB':>10}")
+        await run("buffered", buffered(created_to))
+        await run("stream", export_meetings_ndjson(fields=list(EXPORT_COLUMNS), created_to=created_to))
+        await run("stream+gzip", export_meetings_ndjson(fields=list(EXPORT_COLUMNS), created_to=created_to, gzip=True))
+    finally:
+        await cleanup()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--transcript-chars", type=int, default=3000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""GET /meetings 목록 조회: OFFSET + 전체 ORM 로드(예전) 와 keyset + 컬럼 projection(현재) 비교.
+
+임시 회의를 --meetings 개 만들고(전사 --transcript-chars 자, 요약 --summary-chars 자),
+페이지 깊이별로 한 페이지를 읽는 시간과 JSON 응답 크기를 잰 뒤 만든 회의를 지운다.
+
+- offset: SELECT meetings.* + 전사 ORDER BY created_at DESC OFFSET n LIMIT k (예전처럼 전사 전문까지 읽은 뒤 버림)
+- keyset: 이전 페이지의 (created_at, id) 이후부터 id/title/created_at/요약 앞부분만 읽음
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.meeting_list --meetings 20000 --limit 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import delete, insert, select, text
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.models.meeting import MeetingListItem, MeetingListPage
+from app.models.models import Meeting, MeetingTranscript
+from app.service.meeting_service import _encode_cursor, list_meetings_service
+
+
+TITLE = "meeting-list-bench"
+
+
+async def seed(args: argparse.Namespace) -> None:
+    transcript = ("가나다라마바사 " * (args.transcript_chars // 8 + 1))[: args.transcript_chars]
+    summary = ("요약 문장입니다. " * (args.summary_chars // 10 + 1))[: args.summary_chars]
+    base = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    async with AsyncSessionLocal() as db:
+        for start in range(0, args.meetings, 1000):
+            ids = [uuid.uuid4() for _ in range(start, min(start + 1000, args.meetings))]
+            await db.execute(
+                insert(Meeting),
+                [
+                    {
+                        "id": meeting_id,
+                        "title": TITLE,
+                        "summary": summary,
+                        # 같은 시각의 회의도 섞어 (created_at, id) 순서가 필요한 상황을 만든다
+                        "created_at": base + timedelta(seconds=(start + i) // 3),
+                    }
+                    for i, meeting_id in enumerate(ids)
+                ],
+            )
+            await db.execute(
+                insert(MeetingTranscript), [{"meeting_id": meeting_id, "content": transcript} for meeting_id in ids]
+            )
+        # 플래너가 새 행 수를 보고 인덱스를 쓰도록 통계 갱신
+        await db.execute(text("ANALYZE meetings"))
+        await db.commit()
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Meeting).where(Meeting.title == TITLE))
+        await db.commit()
+
+
+async def offset_page(offset: int, limit: int) -> bytes:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Meeting, MeetingTranscript.content)
+            .outerjoin(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+            .order_by(Meeting.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        items = [
+            MeetingListItem(id=m.id, title=m.title, summary=m.summary, created_at=m.created_at)
+            for m, _ in result.all()
+        ]
+    return b"[" + b",".join(item.model_dump_json().encode() for item in items) + b"]"
+
+
+async def keyset_page(cursor: str | None, limit: int) -> bytes:
+    async with AsyncSessionLocal() as db:
+        page: MeetingListPage = await list_meetings_service(db, cursor=cursor, limit=limit)
+    return page.model_dump_json().encode()
+
+
+async def cursor_at(offset: int) -> str | None:
+    """offset 번째 행 직전까지 넘긴 상태의 cursor (keyset 으로 같은 페이지를 읽기 위해)."""
+
+    if offset == 0:
+        return None
+    async with AsyncSessionLocal() as db:
+        row = (
+            await db.execute(
+                select(Meeting.created_at, Meeting.id)
+                .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+                .offset(offset - 1)
+                .limit(1)
+            )
+        ).one()
+    return _encode_cursor(row.created_at, row.id)
+
+
+async def measure(fn, repeat: int) -> tuple[float, int]:
+    await fn()
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await fn()
+        timings.append(time.perf_counter() - started)
+        size = len(body)
+    return float(np.median(timings)) * 1000, size
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    await cleanup()
+    print(f"seeding {args.meetings} meetings ...")
+    await seed(args)
+    try:
+        print(f"limit={args.limit} repeat={args.repeat} (ms: median)")
+        print(f"{'page':>7} {'offset ms':>10} {'keyset ms':>10} {'offset bytes':>13} {'keyset bytes':>13}")
+        depths = sorted({min(d, args.meetings - args.limit) for d in (0, 100, 1000, 10000, args.meetings - args.limit)})
+        for depth in depths:
+            cursor = await cursor_at(depth)
+            offset_ms, offset_size = await measure(lambda: offset_page(depth, args.limit), args.repeat)
+            keyset_ms, keyset_size = await measure(lambda: keyset_page(cursor, args.limit), args.repeat)
+            print(
+                f"{depth // args.limit + 1:>7} {offset_ms:>10.2f} {keyset_ms:>10.2f} "
+                f"{offset_size:>13} {keyset_size:>13}"
+            )
+    finally:
+        await cleanup()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--transcript-chars", type=int, default=8000)
+    parser.add_argument("--summary-chars", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""GET /meetings/search 검색 지연 측정: search_vector(GIN) 검색과 전사 본문 ILIKE 전체 스캔 비교.
+
+임의 어휘로 만든 임시 회의를 --meetings 개 넣고(전사 --transcript-chars 자), 흔한 단어/드문 단어/여러 단어 검색의
+첫 페이지 지연(median)과 ILIKE 로 같은 단어를 찾는 시간을 잰 뒤 만든 회의를 지운다.
+
+실행 (DATABASE_URL 의 DB 필요. 10만 건 생성에 몇 분 걸림):
+    uv run python -m benchmarks.meeting_search --meetings 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select, text
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.models.models import Meeting, MeetingTranscript
+from app.service.meeting_service import search_meetings_service
+
+
+TITLE = "meeting-search-bench"
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추"
+PARTICLES = ["", "", "은", "는", "이", "가", "을", "를", "에서", "으로", "도"]
+
+
+def vocabulary(size: int, rng: random.Random) -> list[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def transcript(words: list[str], weights: np.ndarray, chars: int, rng: np.random.Generator) -> str:
+    # 지프 분포로 단어를 뽑아 실제 대화처럼 흔한 단어와 드문 단어가 섞이게 한다
+    picked = rng.choice(len(words), size=chars // 4, p=weights)
+    return " ".join(words[i] + PARTICLES[i % len(PARTICLES)] for i in picked)[:chars]
+
+
+async def seed(args: argparse.Namespace, words: list[str]) -> None:
+    ranks = np.arange(1, len(words) + 1)
+    weights = 1.0 / ranks
+    weights /= weights.sum()
+    rng = np.random.default_rng(args.seed)
+    base = datetime(2001, 1, 1, tzinfo=timezone.utc)
+    async with AsyncSessionLocal() as db:
+        for start in range(0, args.meetings, 500):
+            ids = [uuid.uuid4() for _ in range(start, min(start + 500, args.meetings))]
+            await db.execute(
+                insert(Meeting),
+                [
+                    {
+                        "id": meeting_id,
+                        "title": TITLE,
+                        "summary": transcript(words, weights, args.transcript_chars // 10, rng),
+                        "created_at": base + timedelta(minutes=start + i),
+                    }
+                    for i, meeting_id in enumerate(ids)
+                ],
+            )
+            await db.execute(
+                insert(MeetingTranscript),
+                [
+                    {"meeting_id": meeting_id, "content": transcript(words, weights, args.transcript_chars, rng)}
+                    for meeting_id in ids
+                ],
+            )
+            await db.commit()
+            if (start // 500) % 20 == 0:
+                print(f"  {start + 500}/{args.meetings}")
+        await db.execute(text("ANALYZE meetings, meeting_transcripts"))
+        await db.commit()
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Meeting).where(Meeting.title == TITLE))
+        await db.commit()
+
+
+async def measure(fn, repeat: int) -> tuple[float, object]:
+    result = await fn()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fn()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000, result
+
+
+async def search(query: str, limit: int):
+    async with AsyncSessionLocal() as db:
+        return await search_meetings_service(db, query=query, limit=limit)
+
+
+async def scan(word: str, limit: int):
+    async with AsyncSessionLocal() as db:
+        return (
+            await db.execute(
+                select(Meeting.id)
+                .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+                .where(MeetingTranscript.content.ilike(f"%{word}%"))
+                .order_by(Meeting.created_at.desc())
+                .limit(limit)
+            )
+        ).all()
+
+
+async def count_matches(query: str) -> int:
+    terms = " & ".join(f"{term}:*" for term in query.split())
+    vector = Meeting.search_vector.op("||")(MeetingTranscript.search_vector)
+    async with AsyncSessionLocal() as db:
+        return (
+            await db.execute(
+                select(func.count())
+                .select_from(Meeting)
+                .join(MeetingTranscript, MeetingTranscript.meeting_id == Meeting.id)
+                .where(vector.bool_op("@@")(func.to_tsquery("simple", terms)))
+            )
+        ).scalar_one()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    words = vocabulary(args.vocabulary, random.Random(args.seed))
+    init_db()
+    if not args.reuse:
+        await cleanup()
+        print(f"seeding {args.meetings} meetings ({args.transcript_chars} chars) ...")
+        started = time.perf_counter()
+        await seed(args, words)
+        print(f"seeded in {time.perf_counter() - started:.1f}s")
+    try:
+        queries = {
+            "common": words[0],
+            "mid": words[200],
+            "rare": words[-1],
+            "two words": f"{words[5]} {words[300]}",
+        }
+        print(f"limit={args.limit} repeat={args.repeat} (ms: median)")
+        print(f"{'query':>10} {'matches':>8} {'search ms':>10} {'ILIKE scan ms':>14}")
+        for label, query in queries.items():
+            matches = await count_matches(query)
+            search_ms, _ = await measure(lambda: search(query, args.limit), args.repeat)
+            scan_ms, _ = await measure(lambda: scan(query.split()[0], args.limit), max(1, args.repeat // 5))
+            print(f"{label:>10} {matches:>8} {search_ms:>10.2f} {scan_ms:>14.2f}")
+    finally:
+        if not args.keep:
+            await cleanup()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=100000)
+    parser.add_argument("--transcript-chars", type=int, default=3000)
+    parser.add_argument("--vocabulary", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 만든 회의를 지우지 않음 (--reuse 로 다시 측정)")
+    parser.add_argument("--reuse", action="store_true", help="이전 --keep 실행의 회의를 그대로 사용")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""재생 위치 주변 자막 조회: 회의 상세(전사 전문)를 읽어 자르는 방식과 GET /meetings/{id}/segments(현재) 비교.
+
+--hours 시간 길이의 임시 회의를 세그먼트(--segment-seconds 초, 세그먼트당 --segment-chars 자)와 전사 전문으로 만들고,
+무작위 재생 위치에서 --window-seconds 초 구간의 자막을 --repeat 번 조회하는 시간(median)과 응답 크기를 잰 뒤 회의를 지운다.
+서비스 계층에서 재므로 HTTP 전송 시간은 빠져 있다.
+
+실행 (DATABASE_URL 의 DB 필요):
+    uv run python -m benchmarks.meeting_segments --hours 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+import numpy as np
+
+from app.config.db import AsyncSessionLocal, close_db, init_db
+from app.service.meeting_service import (
+    create_meeting,
+    delete_meeting_service,
+    get_meeting_service,
+    list_meeting_segments_service,
+)
+from app.service.stt_service import TranscriptSegment
+
+
+def make_segments(args: argparse.Namespace) -> list[TranscriptSegment]:
+    text = ("가나다라마바사 " * (args.segment_chars // 8 + 1))[: args.segment_chars]
+    count = int(args.hours * 3600 / args.segment_seconds)
+    # 발화 사이에 0.5초 무음이 있는 것처럼 구간을 조금씩 띄운다
+    return [
+        TranscriptSegment(i * args.segment_seconds, args.segment_seconds - 0.5, f"{i} {text}", "azure_speech")
+        for i in range(count)
+    ]
+
+
+async def measure(fn, positions: list[float]) -> tuple[float, int]:
+    await fn(positions[0])
+    timings = []
+    size = 0
+    for position in positions:
+        started = time.perf_counter()
+        size = await fn(position)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000, size
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    init_db()
+    segments = make_segments(args)
+    async with AsyncSessionLocal() as db:
+        meeting = await create_meeting(
+            db,
+            transcript=" ".join(segment.text for segment in segments),
+            summary="meeting-segments-bench",
+            segments=segments,
+        )
+    meeting_id: uuid.UUID = meeting.id
+    rng = random.Random(0)
+    positions = [rng.uniform(0, args.hours * 3600 - args.window_seconds) for _ in range(args.repeat)]
+
+    async def full_transcript(position: float) -> int:
+        # 전사 전문만 있으면 전체를 받아 클라이언트가 재생 위치를 어림해 잘라야 한다
+        async with AsyncSessionLocal() as db:
+            detail = await get_meeting_service(db, meeting_id=meeting_id)
+        return len(detail.model_dump_json().encode())
+
+    async def segment_window(position: float) -> int:
+        async with AsyncSessionLocal() as db:
+            page = await list_meeting_segments_service(
+                db, meeting_id=meeting_id, start=position, end=position + args.window_seconds
+            )
+        return len(page.model_dump_json().encode())
+
+    try:
+        print(f"{args.hours:g} h meeting, {len(segments)} segments, window {args.window_seconds:g}s, repeat={args.repeat}")
+        print(f"{'mode':>16} {'ms':>8} {'bytes':>10}")
+        for label, fn in (("full transcript", full_transcript), ("segments window", segment_window)):
+            ms, size = await measure(fn, positions)
+            print(f"{label:>16} {ms:>8.2f} {size:>10}")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await delete_meeting_service(db, meeting_id=meeting_id)
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=3)
+    parser.add_argument("--segment-seconds", type=float, default=8)
+    parser.add_argument("--segment-chars", type=int, default=120)
+    parser.add_argument("--window-seconds", type=float, default=60)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
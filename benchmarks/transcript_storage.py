@@ -0,0 +1,242 @@
+"""전사 저장 방식 비교: meetings 한 행에 전사까지(예전) vs meetings + meeting_transcripts 분리(현재).
+
+별도 스키마(bench_storage)에 두 구조의 테이블을 만들고 같은 합성 회의 --meetings 개를 넣은 뒤
+테이블 크기(heap / TOAST / 인덱스)와 목록 조회, ID 조회, 삭제, 전체 스캔 지연을 비교하고 스키마를 지운다.
+전사 길이는 로그정규 분포(중앙값 --median-chars)라 2KB 미만 압축 후 행에 그대로 들어가는 짧은 전사도 섞인다.
+검색용 tsvector 는 두 구조 모두 제외하고 저장 방식 차이만 잰다.
+
+실행 (DATABASE_URL 의 DB 필요. 10만 건 생성에 몇 분 걸림):
+    uv run python -m benchmarks.transcript_storage --meetings 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from app.config.db import engine
+
+
+SCHEMA = "bench_storage"
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추"
+
+DDL = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""
+    CREATE TABLE {SCHEMA}.wide (
+        id uuid PRIMARY KEY, title text, started_at timestamptz, ended_at timestamptz,
+        full_transcript text, summary text,
+        created_at timestamptz NOT NULL, updated_at timestamptz NOT NULL
+    )
+    """,
+    f"CREATE INDEX ON {SCHEMA}.wide (created_at, id)",
+    f"""
+    CREATE TABLE {SCHEMA}.meetings (
+        id uuid PRIMARY KEY, title text, started_at timestamptz, ended_at timestamptz,
+        summary text,
+        created_at timestamptz NOT NULL, updated_at timestamptz NOT NULL
+    )
+    """,
+    f"CREATE INDEX ON {SCHEMA}.meetings (created_at, id)",
+    f"""
+    CREATE TABLE {SCHEMA}.meeting_transcripts (
+        meeting_id uuid PRIMARY KEY REFERENCES {SCHEMA}.meetings (id) ON DELETE CASCADE,
+        content text NOT NULL
+    ) WITH (toast_tuple_target = 256)
+    """,
+]
+
+LIST_SQL = {
+    "wide": f"SELECT id, title, created_at, left(summary, 200) FROM {SCHEMA}.wide "
+    "WHERE (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC LIMIT 20",
+    "split": f"SELECT id, title, created_at, left(summary, 200) FROM {SCHEMA}.meetings "
+    "WHERE (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC LIMIT 20",
+}
+# 요약 스트리밍/조회 전 존재 확인처럼 전사가 필요 없는 단건 조회 (ORM 의 db.get(Meeting) 과 같은 컬럼)
+LOOKUP_SQL = {
+    "wide": f"SELECT * FROM {SCHEMA}.wide WHERE id = :id",
+    "split": f"SELECT * FROM {SCHEMA}.meetings WHERE id = :id",
+}
+DELETE_SQL = {
+    "wide": f"DELETE FROM {SCHEMA}.wide WHERE id = :id",
+    "split": f"DELETE FROM {SCHEMA}.meetings WHERE id = :id",
+}
+SCAN_SQL = {
+    "wide": f"SELECT date_trunc('month', created_at), count(*) FROM {SCHEMA}.wide GROUP BY 1",
+    "split": f"SELECT date_trunc('month', created_at), count(*) FROM {SCHEMA}.meetings GROUP BY 1",
+}
+
+
+def sentence(rng: random.Random, words: list[str]) -> str:
+    return " ".join(rng.choice(words) for _ in range(rng.randint(4, 12))) + "."
+
+
+def make_text(rng: random.Random, words: list[str], chars: int) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < chars:
+        parts.append(sentence(rng, words))
+        size += len(parts[-1]) + 1
+    return " ".join(parts)[:chars]
+
+
+def seed(conn: Connection, args: argparse.Namespace) -> list[uuid.UUID]:
+    rng = random.Random(args.seed)
+    words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))) for _ in range(3000)]
+    lengths = np.random.default_rng(args.seed).lognormal(np.log(args.median_chars), 0.9, args.meetings)
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    ids: list[uuid.UUID] = []
+    for start in range(0, args.meetings, 1000):
+        rows = []
+        for i in range(start, min(start + 1000, args.meetings)):
+            meeting_id = uuid.uuid4()
+            ids.append(meeting_id)
+            created = base + timedelta(minutes=10 * i)
+            rows.append(
+                {
+                    "id": meeting_id,
+                    "transcript": make_text(rng, words, int(min(lengths[i], 60000))),
+                    "summary": make_text(rng, words, rng.randint(200, 800)),
+                    "created_at": created,
+                }
+            )
+        conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA}.wide (id, full_transcript, summary, created_at, updated_at) "
+                "VALUES (:id, :transcript, :summary, :created_at, :created_at)"
+            ),
+            rows,
+        )
+        conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA}.meetings (id, summary, created_at, updated_at) "
+                "VALUES (:id, :summary, :created_at, :created_at)"
+            ),
+            rows,
+        )
+        conn.execute(
+            text(f"INSERT INTO {SCHEMA}.meeting_transcripts (meeting_id, content) VALUES (:id, :transcript)"),
+            rows,
+        )
+        conn.commit()
+        if (start // 1000) % 10 == 0:
+            print(f"  {start + len(rows)}/{args.meetings}")
+    conn.execute(text(f"ANALYZE {SCHEMA}.wide, {SCHEMA}.meetings, {SCHEMA}.meeting_transcripts"))
+    conn.commit()
+    return ids
+
+
+def sizes(conn: Connection, table: str) -> tuple[int, int, int]:
+    row = conn.execute(
+        text(
+            "SELECT pg_relation_size(c.oid), coalesce(pg_total_relation_size(nullif(c.reltoastrelid, 0)), 0), "
+            "pg_indexes_size(c.oid) FROM pg_class c WHERE c.oid = CAST(:table AS regclass)"
+        ),
+        {"table": f"{SCHEMA}.{table}"},
+    ).one()
+    return int(row[0]), int(row[1]), int(row[2])
+
+
+def timed(conn: Connection, sql: str, params_list: list[dict]) -> float:
+    statement = text(sql)
+    timings = []
+    for params in params_list:
+        started = time.perf_counter()
+        conn.execute(statement, params).all() if statement.is_select else conn.execute(statement, params)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000
+
+
+def timed_deletes(conn: Connection, sql: str, ids: list[uuid.UUID]) -> float:
+    statement = text(sql)
+    timings = []
+    for meeting_id in ids:
+        started = time.perf_counter()
+        conn.execute(statement, {"id": meeting_id})
+        conn.commit()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=100000)
+    parser.add_argument("--median-chars", type=int, default=1500, help="전사 길이 중앙값(문자)")
+    parser.add_argument("--samples", type=int, default=300, help="조회/삭제 측정 횟수")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        for statement in DDL:
+            conn.execute(text(statement))
+        try:
+            conn.execute(text(f"ALTER TABLE {SCHEMA}.meeting_transcripts ALTER COLUMN content SET COMPRESSION lz4"))
+            compression = "lz4"
+        except DBAPIError:
+            conn.rollback()
+            for statement in DDL:
+                conn.execute(text(statement))
+            compression = "pglz"
+        conn.commit()
+
+        try:
+            print(f"seeding {args.meetings} meetings (transcript median {args.median_chars} chars) ...")
+            started = time.perf_counter()
+            ids = seed(conn, args)
+            print(f"seeded in {time.perf_counter() - started:.1f}s (transcript compression: {compression})")
+
+            rng = random.Random(args.seed)
+            ordered = conn.execute(
+                text(f"SELECT created_at, id FROM {SCHEMA}.meetings ORDER BY created_at DESC, id DESC")
+            ).all()
+            cursors = [{"created_at": row[0], "id": row[1]} for row in rng.sample(ordered, args.samples)]
+            lookups = [{"id": meeting_id} for meeting_id in rng.sample(ids, args.samples)]
+            victims = rng.sample(ids, args.samples)
+
+            def mb(value: int) -> str:
+                return f"{value / 1024 / 1024:.1f}"
+
+            wide = sizes(conn, "wide")
+            split_meetings = sizes(conn, "meetings")
+            split_transcripts = sizes(conn, "meeting_transcripts")
+            print()
+            print(f"{'table size (MB)':<28} {'heap':>8} {'toast':>8} {'index':>8} {'total':>8}")
+            for label, (heap, toast, index) in (
+                ("wide: meetings", wide),
+                ("split: meetings", split_meetings),
+                ("split: meeting_transcripts", split_transcripts),
+            ):
+                print(f"{label:<28} {mb(heap):>8} {mb(toast):>8} {mb(index):>8} {mb(heap + toast + index):>8}")
+
+            print()
+            print(f"{'latency (ms, median)':<28} {'wide':>8} {'split':>8}")
+            for label, queries, params in (
+                ("list page (keyset, 20)", LIST_SQL, cursors),
+                ("lookup by id", LOOKUP_SQL, lookups),
+                ("full scan (count/month)", SCAN_SQL, [{}] * 5),
+            ):
+                # 캐시 상태를 맞추기 위해 한 번씩 먼저 실행
+                timed(conn, queries["wide"], params[:20])
+                timed(conn, queries["split"], params[:20])
+                print(f"{label:<28} {timed(conn, queries['wide'], params):>8.2f} {timed(conn, queries['split'], params):>8.2f}")
+            print(
+                f"{'delete (commit each)':<28} {timed_deletes(conn, DELETE_SQL['wide'], victims):>8.2f} "
+                f"{timed_deletes(conn, DELETE_SQL['split'], victims):>8.2f}"
+            )
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""DB 가 필요한 테스트용 공통 설정.
+
+DATABASE_URL 의 PostgreSQL 에 연결하며, 연결할 수 없으면 해당 테스트는 건너뛴다.
+비동기 작업 워커는 테스트와 섞이지 않도록 끈다.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("MEETING_JOB_WORKERS", "0")
+
+
+@pytest.fixture(scope="session")
+def db_available() -> None:
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    from app.config.db import engine
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except OperationalError as exc:
+        pytest.skip(f"database unavailable: {exc.orig}")
+
+
+@pytest.fixture
+def client(db_available):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.config.db import SessionLocal
+from app.models.models import SummaryRefreshRun
+from app.service import summary_refresh_service
+from app.service.summary_refresh_service import create_refresh_run
+
+
+class StartedRuns(list):
+    def __init__(self) -> None:
+        super().__init__()
+        self.event = threading.Event()
+
+
+@pytest.fixture
+def started(monkeypatch) -> StartedRuns:
+    """run_refresh 대신 이벤트 루프에서 시작됐는지만 기록하고 취소될 때까지 기다린다 (LLM 호출 없음)."""
+
+    runs = StartedRuns()
+
+    async def fake_run_refresh(run_id: UUID):
+        runs.append(run_id)
+        runs.event.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(summary_refresh_service, "run_refresh", fake_run_refresh)
+    return runs
+
+
+@pytest.fixture
+def run_ids():
+    ids: list[UUID] = []
+    yield ids
+    with SessionLocal() as db:
+        db.execute(delete(SummaryRefreshRun).where(SummaryRefreshRun.id.in_(ids)))
+        db.commit()
+
+
+def test_start_spawns_refresh_on_event_loop(client, started, run_ids):
+    response = client.post("/admin/summaries/refresh", params={"batch_size": 10})
+    assert response.status_code == 202
+    run_id = UUID(response.json()["id"])
+    run_ids.append(run_id)
+    assert response.json()["status"] == "running"
+
+    assert started.event.wait(5)
+    assert started == [run_id]
+
+    # 같은 프로세스에서 실행 중이면 resume 은 409
+    assert client.post(f"/admin/summaries/refresh/{run_id}/resume").status_code == 409
+    assert client.post(f"/admin/summaries/refresh/{run_id}/cancel").status_code == 200
+
+
+def test_resume_rejects_run_active_in_other_process(client, started, run_ids):
+    # 다른 워커/CLI 가 만든 실행: RUNNING + 방금 갱신된 heartbeat
+    with SessionLocal() as db:
+        run_id = create_refresh_run(db, batch_size=10).id
+    run_ids.append(run_id)
+
+    assert client.post(f"/admin/summaries/refresh/{run_id}/resume").status_code == 409
+    assert started == []
+
+    # heartbeat 가 끊기면 이어서 실행할 수 있다
+    with SessionLocal() as db:
+        db.execute(
+            update(SummaryRefreshRun)
+            .where(SummaryRefreshRun.id == run_id)
+            .values(heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        )
+        db.commit()
+    response = client.post(f"/admin/summaries/refresh/{run_id}/resume")
+    assert response.status_code == 202
+    assert started.event.wait(5)
+    assert started == [run_id]
+    assert client.post(f"/admin/summaries/refresh/{run_id}/cancel").status_code == 200
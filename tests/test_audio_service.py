@@ -0,0 +1,93 @@
+"""오디오 분할의 메모리 사용량 회귀 테스트 (DB 불필요)."""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+
+from app.service.audio_service import PcmAudio, _window_energies, split_on_silence
+
+
+def _synthetic_audio(seconds: float, sample_rate: int = 16000, channels: int = 2) -> PcmAudio:
+    """발화(3~8초)와 무음(0.5~2초)이 번갈아 나오는 16bit 오디오."""
+
+    rng = np.random.default_rng(0)
+    total = int(seconds * sample_rate)
+    samples = np.empty((total, channels), dtype=np.int16)
+    written = 0
+    while written < total:
+        speech = int(rng.uniform(3, 8) * sample_rate)
+        silence = int(rng.uniform(0.5, 2) * sample_rate)
+        end = min(total, written + speech)
+        samples[written:end] = rng.integers(-3000, 3000, (end - written, channels), dtype=np.int16)
+        samples[end : min(total, end + silence)] = 0
+        written = end + silence
+    return PcmAudio(samples=samples, sample_rate=sample_rate)
+
+
+def test_window_energies_matches_full_computation() -> None:
+    audio = _synthetic_audio(90)
+    window_frames = 320
+    num_windows = audio.num_frames // window_frames
+
+    mono = audio.samples[: num_windows * window_frames].astype(np.float32).mean(axis=1)
+    expected = np.square(mono).reshape(num_windows, window_frames).mean(axis=1)
+
+    np.testing.assert_allclose(_window_energies(audio, window_frames), expected, rtol=1e-5)
+
+
+def test_split_on_silence_peak_memory_is_bounded() -> None:
+    # 30분 16kHz stereo (약 110MB). 전체를 float32 로 복사하던 방식은 이것만으로 200MB 이상을 썼다
+    audio = _synthetic_audio(30 * 60)
+
+    tracemalloc.start()
+    try:
+        segments = split_on_silence(audio, max_seconds=60, min_seconds=20)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert sum(segment.num_frames for segment in segments) == audio.num_frames
+    assert all(segment.duration_seconds <= 60 for segment in segments)
+    assert peak < 32 * 2**20, f"split_on_silence heap peak {peak / 2**20:.1f}MB"
+
+
+def _speech_with_pauses(speech_seconds: float, pauses: int, sample_rate: int = 16000) -> tuple[PcmAudio, list[tuple[int, int]]]:
+    """speech_seconds 길이 발화 사이에 1초 무음을 pauses 번 넣은 mono 오디오와 무음 구간 [start, end) 프레임 목록."""
+
+    rng = np.random.default_rng(1)
+    speech = int(speech_seconds * sample_rate)
+    pieces, silences, written = [], [], 0
+    for i in range(pauses + 1):
+        pieces.append(rng.integers(-3000, 3000, (speech, 1), dtype=np.int16))
+        written += speech
+        if i < pauses:
+            pieces.append(np.zeros((sample_rate, 1), dtype=np.int16))
+            silences.append((written, written + sample_rate))
+            written += sample_rate
+    return PcmAudio(samples=np.concatenate(pieces), sample_rate=sample_rate), silences
+
+
+def test_short_audio_is_not_split() -> None:
+    audio = _synthetic_audio(50)
+
+    segments = split_on_silence(audio, max_seconds=55, min_seconds=20)
+
+    assert len(segments) == 1 and segments[0] is audio
+
+
+def test_split_cuts_inside_pauses() -> None:
+    audio, silences = _speech_with_pauses(25, pauses=5)
+
+    segments = split_on_silence(audio, max_seconds=55, min_seconds=20)
+
+    assert len(segments) > 1
+    assert sum(segment.num_frames for segment in segments) == audio.num_frames
+    cut = 0
+    for segment in segments[:-1]:
+        assert 20 <= segment.duration_seconds <= 55
+        cut += segment.num_frames
+        assert any(start <= cut <= end for start, end in silences), f"cut at {cut / audio.sample_rate:.2f}s is not in a pause"
+    # 세그먼트는 원본의 view (복사 없음)
+    assert all(np.shares_memory(segment.samples, audio.samples) for segment in segments)
@@ -0,0 +1,31 @@
+"""HTTP 커넥션 풀 메트릭 테스트 (DB, 네트워크 불필요)."""
+
+from __future__ import annotations
+
+import httpx
+
+from app.config import http
+from app.config.http import HttpBackend
+
+
+def _samples(monkeypatch, clients: dict) -> dict[tuple[str, tuple], float]:
+    monkeypatch.setattr(http, "_clients", clients)
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in http._PoolStatsCollector().collect()
+        for sample in family.samples
+    }
+
+
+def test_pool_stats_read_httpcore_pool(monkeypatch) -> None:
+    samples = _samples(monkeypatch, {HttpBackend.WHISPER: httpx.AsyncClient()})
+
+    assert samples[("meeting_stt_http_pool_connections", (("backend", "whisper"), ("state", "idle")))] == 0
+    assert ("meeting_stt_http_pool_max_connections", (("backend", "whisper"),)) in samples
+
+
+def test_pool_stats_skip_unreadable_pool(monkeypatch) -> None:
+    # httpx 내부 구조가 바뀌어도 scrape 는 실패하지 않고 커넥션 수만 빠진다
+    samples = _samples(monkeypatch, {HttpBackend.WHISPER: object()})
+
+    assert list(samples) == [("meeting_stt_http_pool_max_connections", (("backend", "whisper"),))]
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+
+from app.config.db import AsyncSessionLocal, SessionLocal, async_engine
+from app.models.meeting import JobStatus
+from app.models.models import Meeting, MeetingJob, MeetingTranscript
+from app.repository.job_repository import claim_next_job
+from app.service import job_service
+
+
+def _write(*statements) -> None:
+    with SessionLocal() as db:
+        for statement in statements:
+            db.execute(statement)
+        db.commit()
+
+
+def _run(coro_fn):
+    async def scenario():
+        try:
+            return await coro_fn()
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def _insert_job(tmp_path, **values) -> MeetingJob:
+    job_id = uuid.uuid4()
+    audio_path = tmp_path / f"{job_id}.wav"
+    audio_path.write_bytes(b"RIFF")
+    stale = datetime.now(timezone.utc) - timedelta(hours=1)
+    _write(insert(MeetingJob).values(id=job_id, audio_path=str(audio_path), heartbeat_at=stale, **values))
+    with SessionLocal() as db:
+        job = db.get(MeetingJob, job_id)
+        db.expunge(job)
+    return job
+
+
+def _claim(stale_before: datetime) -> uuid.UUID | None:
+    async def claim():
+        async with AsyncSessionLocal() as db:
+            job = await claim_next_job(db, stale_before=stale_before)
+            return job.id if job is not None else None
+
+    return _run(claim)
+
+
+def test_claim_takes_oldest_job_first(db_available, tmp_path):
+    # 다른 테스트/개발 데이터보다 먼저 잡히도록 아주 오래된 created_at 을 준다
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    older = _insert_job(tmp_path, status=JobStatus.QUEUED.value, attempts=0, created_at=epoch)
+    newer = _insert_job(tmp_path, status=JobStatus.QUEUED.value, attempts=0, created_at=epoch + timedelta(days=1))
+    try:
+        stale_before = datetime.now(timezone.utc) - timedelta(hours=2)
+        assert _claim(stale_before) == older.id
+        # 처리 중으로 바뀐 작업은 다시 잡히지 않는다
+        assert _claim(stale_before) == newer.id
+
+        with SessionLocal() as db:
+            claimed = db.get(MeetingJob, older.id)
+            assert claimed.status == JobStatus.TRANSCRIBING.value
+            assert claimed.attempts == 1
+            assert claimed.heartbeat_at > stale_before
+    finally:
+        _write(delete(MeetingJob).where(MeetingJob.id.in_([older.id, newer.id])))
+
+
+def test_stale_active_job_is_recovered(db_available, tmp_path):
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    # _insert_job 은 heartbeat 를 1시간 전으로 둔다
+    stale = _insert_job(tmp_path, status=JobStatus.SUMMARIZING.value, attempts=1, created_at=epoch)
+    alive = _insert_job(tmp_path, status=JobStatus.TRANSCRIBING.value, attempts=1, created_at=epoch)
+    _write(update(MeetingJob).where(MeetingJob.id == alive.id).values(heartbeat_at=datetime.now(timezone.utc)))
+    try:
+        stale_before = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert _claim(stale_before) == stale.id
+        assert _claim(stale_before) != alive.id
+
+        with SessionLocal() as db:
+            recovered = db.get(MeetingJob, stale.id)
+            assert recovered.status == JobStatus.TRANSCRIBING.value
+            assert recovered.attempts == 2
+    finally:
+        _write(delete(MeetingJob).where(MeetingJob.id.in_([stale.id, alive.id])))
+
+
+def test_job_over_max_attempts_fails_without_running(db_available, tmp_path, monkeypatch):
+    job = _insert_job(tmp_path, status=JobStatus.TRANSCRIBING.value, attempts=job_service.settings.meeting_job_max_attempts + 1)
+
+    async def must_not_transcribe(**kwargs):
+        raise AssertionError("job over max_attempts was transcribed")
+
+    monkeypatch.setattr(job_service, "transcribe", must_not_transcribe)
+    try:
+        _run(lambda: job_service._run_job(job))
+
+        with SessionLocal() as db:
+            failed = db.get(MeetingJob, job.id)
+            assert failed.status == JobStatus.FAILED.value
+            assert failed.error
+            assert failed.finished_at is not None
+        assert not (tmp_path / f"{job.id}.wav").exists()
+    finally:
+        _write(delete(MeetingJob).where(MeetingJob.id == job.id))
+
+
+def test_recovered_job_does_not_duplicate_saved_meeting(db_available, tmp_path, monkeypatch):
+    # 회의를 저장한 직후, COMPLETED 로 바꾸기 전에 워커가 죽은 상황
+    meeting_id = uuid.uuid4()
+    _write(
+        insert(Meeting).values(id=meeting_id, summary="saved"),
+        insert(MeetingTranscript).values(meeting_id=meeting_id, content="saved"),
+    )
+    job = _insert_job(tmp_path, status=JobStatus.SAVING.value, meeting_id=meeting_id, attempts=1)
+
+    async def must_not_transcribe(**kwargs):
+        raise AssertionError("saved job was transcribed again")
+
+    monkeypatch.setattr(job_service, "transcribe", must_not_transcribe)
+    try:
+        _run(lambda: job_service._run_job(job))
+
+        with SessionLocal() as db:
+            finished = db.get(MeetingJob, job.id)
+            assert finished.status == JobStatus.COMPLETED.value
+            assert finished.meeting_id == meeting_id
+            assert finished.finished_at is not None
+            assert db.scalar(select(func.count()).select_from(Meeting).where(Meeting.summary == "saved")) == 1
+        assert not (tmp_path / f"{job.id}.wav").exists()
+    finally:
+        _write(delete(MeetingJob).where(MeetingJob.id == job.id), delete(Meeting).where(Meeting.id == meeting_id))
+
+
+def test_pending_meeting_id_is_hidden_until_completed(db_available, tmp_path):
+    job = _insert_job(tmp_path, status=JobStatus.SAVING.value, meeting_id=uuid.uuid4(), attempts=1)
+    try:
+        assert job_service._to_response(job).meeting_id is None
+        job.status = JobStatus.COMPLETED.value
+        assert job_service._to_response(job).meeting_id == job.meeting_id
+    finally:
+        _write(delete(MeetingJob).where(MeetingJob.id == job.id))
+
+
+def test_failed_upload_copy_removes_partial_file(db_available, tmp_path, monkeypatch):
+    monkeypatch.setattr(job_service.settings, "meeting_job_upload_dir", str(tmp_path))
+
+    async def broken_copy(upload, path):
+        path.write_bytes(b"partial")
+        raise OSError("connection reset")
+
+    monkeypatch.setattr(job_service, "copy_upload", broken_copy)
+
+    async def submit():
+        async with AsyncSessionLocal() as db:
+            await job_service.submit_job(db, upload=None)
+
+    with pytest.raises(OSError):
+        _run(submit)
+    assert list(tmp_path.iterdir()) == []
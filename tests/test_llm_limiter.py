@@ -0,0 +1,131 @@
+"""Azure OpenAI limiter 테스트 (DB, 네트워크 불필요)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import openai
+import pytest
+from fastapi import HTTPException
+
+from app.service.llm_limiter_service import LlmLimiter, _Lease, _TokenBucket
+
+
+def _limiter(**overrides) -> LlmLimiter:
+    options = dict(rpm=0, tpm=0, initial_concurrency=1, max_concurrency=1, queue_timeout=5.0, max_retries=2)
+    options.update(overrides)
+    return LlmLimiter(**options)
+
+
+def _rate_limited(retry_after_ms: int = 20) -> openai.RateLimitError:
+    response = httpx.Response(
+        429,
+        headers={"retry-after-ms": str(retry_after_ms)},
+        request=httpx.Request("POST", "https://example.invalid"),
+    )
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def test_throttled_request_keeps_its_place_in_queue():
+    limiter = _limiter()
+    calls: list[str] = []
+
+    def request(name: str, *, throttle: bool):
+        async def fn():
+            calls.append(name)
+            await asyncio.sleep(0.01)
+            if throttle and calls.count(name) == 1:
+                raise _rate_limited()
+            return name
+
+        return fn
+
+    async def scenario():
+        first = asyncio.create_task(limiter.call(request("first", throttle=True), tokens=1))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(limiter.call(request("second", throttle=False), tokens=1))
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(scenario()) == ["first", "second"]
+    # 429 를 받은 요청이 뒤에 온 요청보다 먼저 다시 나간다
+    assert calls == ["first", "first", "second"]
+
+
+def test_token_bucket_refills_per_minute() -> None:
+    bucket = _TokenBucket.per_minute(60, now=0.0)
+    bucket.take(60, now=0.0)
+
+    # 60/분 = 초당 1
+    assert bucket.wait_time(1, now=0.0) == pytest.approx(1.0)
+    assert bucket.wait_time(1, now=0.5) == pytest.approx(0.5)
+    assert bucket.wait_time(1, now=1.0) == 0.0
+    # 한 번에 1분치를 넘게 채우지 않는다
+    assert bucket.wait_time(60, now=600.0) == 0.0
+    assert bucket.level == 60
+
+
+def test_token_bucket_caps_oversized_request_and_carries_debt() -> None:
+    bucket = _TokenBucket.per_minute(100, now=0.0)
+
+    # 1분치보다 큰 요청도 버킷이 가득 차면 보낼 수 있다
+    assert bucket.wait_time(500, now=0.0) == 0.0
+    bucket.take(500, now=0.0)
+    # 초과분은 빚으로 남아 다음 요청이 그만큼 기다린다
+    assert bucket.wait_time(1, now=0.0) == pytest.approx(401 * 60 / 100)
+
+
+def test_disabled_limits_have_no_bucket() -> None:
+    assert _TokenBucket.per_minute(0, now=0.0) is None
+
+
+def test_aimd_increases_on_success_and_halves_once_per_burst() -> None:
+    limiter = _limiter(initial_concurrency=4, max_concurrency=8)
+
+    async def ok():
+        return "ok"
+
+    asyncio.run(limiter.call(ok, tokens=1))
+    assert limiter.limit == pytest.approx(4.25)
+
+    # 같은 시점에 보낸 호출들의 429 는 한 번만 줄인다
+    leases = [_Lease(started=time.monotonic(), tokens=1) for _ in range(3)]
+    limiter.in_flight = len(leases)
+    for lease in leases:
+        limiter._throttled(lease, retry_after=0.0)
+    assert limiter.limit == pytest.approx(2.125)
+    assert limiter.in_flight == 0
+
+    # 한도는 1 아래로 내려가지 않는다
+    for _ in range(5):
+        limiter.in_flight = 1
+        limiter._throttled(_Lease(started=time.monotonic(), tokens=1), retry_after=0.0)
+    assert limiter.limit == 1.0
+
+
+def test_queue_timeout_returns_503() -> None:
+    limiter = _limiter(queue_timeout=0.05)
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "slow"
+
+    async def fast():
+        return "fast"
+
+    async def scenario():
+        holder = asyncio.create_task(limiter.call(slow, tokens=1))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(HTTPException) as excinfo:
+                await limiter.call(fast, tokens=1)
+        finally:
+            release.set()
+            await holder
+        return excinfo.value
+
+    assert asyncio.run(scenario()).status_code == 503
+    assert limiter.in_flight == 0
+    assert not limiter._waiters
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import delete, insert, update
+
+from app.config.db import SessionLocal
+from app.models.models import Meeting, MeetingTranscript
+from app.service.meeting_cache_service import etag_matches
+
+
+def _write(*statements) -> None:
+    with SessionLocal() as db:
+        for statement in statements:
+            db.execute(statement)
+        db.commit()
+
+
+def test_versions_are_per_meeting_and_list(client):
+    first, second = uuid.uuid4(), uuid.uuid4()
+    _write(
+        insert(Meeting).values([{"id": first, "title": "cache", "summary": "a"}, {"id": second, "title": "cache", "summary": "b"}]),
+        insert(MeetingTranscript).values([{"meeting_id": first, "content": "a"}, {"meeting_id": second, "content": "b"}]),
+    )
+    try:
+        list_etag = client.get("/meetings/").headers["etag"]
+        first_etag = client.get(f"/meetings/{first}").headers["etag"]
+        second_etag = client.get(f"/meetings/{second}").headers["etag"]
+
+        # 잘못된 cursor 는 ETag 가 같아도 400
+        response = client.get("/meetings/", params={"cursor": "not-a-cursor"}, headers={"If-None-Match": list_etag})
+        assert response.status_code == 400
+
+        # 전사만 바뀌면 그 회의 상세만 다시 만들고, 다른 회의와 목록은 304
+        _write(update(MeetingTranscript).where(MeetingTranscript.meeting_id == first).values(content="changed"))
+        assert client.get(f"/meetings/{first}", headers={"If-None-Match": first_etag}).status_code == 200
+        assert client.get(f"/meetings/{second}", headers={"If-None-Match": second_etag}).status_code == 304
+        assert client.get("/meetings/", headers={"If-None-Match": list_etag}).status_code == 304
+
+        # 목록에 보이는 요약이 바뀌면 목록도 새 버전
+        _write(update(Meeting).where(Meeting.id == first).values(summary="changed"))
+        assert client.get("/meetings/", headers={"If-None-Match": list_etag}).status_code == 200
+
+        # 지운 회의는 어떤 If-None-Match 에도 304 가 아니라 404
+        _write(delete(Meeting).where(Meeting.id == first))
+        assert client.get(f"/meetings/{first}", headers={"If-None-Match": "*"}).status_code == 404
+    finally:
+        _write(delete(Meeting).where(Meeting.id.in_([first, second])))
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ('"42"', True),
+        ('"41"', False),
+        ("*", True),
+        (' "41" , *', True),
+        ('W/"42"', True),  # weak 비교
+        ('"40", W/"42"', True),
+        ('"40","41"', False),
+        ("42", False),  # 따옴표 없는 값은 다른 ETag
+    ],
+)
+def test_etag_matches(if_none_match, expected) -> None:
+    assert etag_matches(if_none_match, '"42"') is expected
@@ -0,0 +1,72 @@
+"""목록/검색/세그먼트 cursor 인코딩 테스트 (DB 불필요)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import base64
+import json
+import uuid
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from app.service.meeting_service import _decode_cursor, _encode_cursor
+
+
+def _raw_cursor(values: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def test_round_trip() -> None:
+    created_at = datetime(2024, 1, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    meeting_id = uuid.uuid4()
+
+    assert _decode_cursor(_encode_cursor(created_at, meeting_id), datetime, UUID) == (created_at, meeting_id)
+    assert _decode_cursor(_encode_cursor("fulltext", 0.1, created_at, meeting_id), str, float, datetime, UUID) == (
+        "fulltext",
+        0.1,
+        created_at,
+        meeting_id,
+    )
+    assert _decode_cursor(_encode_cursor(12.5, 42), float, int) == (12.5, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        _raw_cursor({"created_at": "2024-01-01T00:00:00+00:00"}),
+        _raw_cursor(["2024-01-01T00:00:00+00:00"]),
+        _raw_cursor(["2024-01-01T00:00:00+00:00", "not-a-uuid"]),
+        # JSON 타입이 다른 값: UUID(5) 는 AttributeError, fromisoformat(5) 는 TypeError
+        _raw_cursor(["2024-01-01T00:00:00+00:00", 5]),
+        _raw_cursor([5, str(uuid.uuid4())]),
+        _raw_cursor([None, [1]]),
+        # timezone 이 없는 시각은 timestamptz 와 비교할 수 없다
+        _raw_cursor(["2024-01-01T00:00:00", str(uuid.uuid4())]),
+    ],
+)
+def test_malformed_list_cursor_is_400(cursor: str) -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        _decode_cursor(cursor, datetime, UUID)
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.parametrize("values", [["fulltext", "0.1", "2024-01-01T00:00:00+00:00", str(uuid.uuid4())], [1, 0.1, "x", "y"]])
+def test_malformed_search_cursor_is_400(values: list) -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        _decode_cursor(_raw_cursor(values), str, float, datetime, UUID)
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.parametrize("values", [[1.0, 4.5], [1.0, None], [True, "3"]])
+def test_malformed_segment_cursor_is_400(values: list) -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        _decode_cursor(_raw_cursor(values), float, int)
+    assert excinfo.value.status_code == 400
+
+
+def test_malformed_cursor_is_400_over_http(client) -> None:
+    response = client.get("/meetings/", params={"cursor": _raw_cursor(["2024-01-01T00:00:00+00:00", 5])})
+    assert response.status_code == 400
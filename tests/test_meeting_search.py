@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import asyncio
+import uuid
+
+from sqlalchemy import delete, insert
+
+from app.config.db import AsyncSessionLocal, async_engine
+from app.models.models import Meeting, MeetingTranscript
+from app.service.meeting_service import search_meetings_service
+
+
+async def _search_all_pages(query: str, limit: int) -> list[uuid.UUID]:
+    seen: list[uuid.UUID] = []
+    cursor = None
+    async with AsyncSessionLocal() as db:
+        while True:
+            page = await search_meetings_service(db, query=query, cursor=cursor, limit=limit)
+            seen += [hit.id for hit in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                return seen
+
+
+def test_fulltext_pages_keep_tied_ranks(client):
+    # 같은 본문이라 rank(ts_rank_cd, float4 0.4)가 모두 같다. cursor 의 float8 값과 비교가 어긋나면 다음 페이지가 빠진다
+    ids = [uuid.uuid4() for _ in range(7)]
+    base = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+    async def scenario() -> list[uuid.UUID]:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                insert(Meeting),
+                [{"id": meeting_id, "title": "rank-tie", "summary": "", "created_at": base + timedelta(minutes=i)} for i, meeting_id in enumerate(ids)],
+            )
+            await db.execute(
+                insert(MeetingTranscript),
+                [{"meeting_id": meeting_id, "content": "qzvkx 회의 내용 qzvkx 기타"} for meeting_id in ids],
+            )
+            await db.commit()
+        try:
+            return await _search_all_pages("qzvkx", limit=2)
+        finally:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(Meeting).where(Meeting.id.in_(ids)))
+                await db.commit()
+            await async_engine.dispose()
+
+    seen = asyncio.run(scenario())
+    assert sorted(seen) == sorted(ids)
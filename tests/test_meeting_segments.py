@@ -0,0 +1,86 @@
+"""GET /meetings/{id}/segments 시간 구간 조회와 페이지네이션 테스트."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import delete, insert
+
+from app.config.db import SessionLocal
+from app.models.models import Meeting, MeetingSegment, MeetingTranscript
+
+
+def _write(*statements) -> None:
+    with SessionLocal() as db:
+        for statement in statements:
+            db.execute(statement)
+        db.commit()
+
+
+@pytest.fixture
+def meeting_id(db_available):
+    # 10초짜리 세그먼트 0~50초, 무음 뒤 80~90초
+    starts = [0, 10, 20, 30, 40, 80]
+    meeting_id = uuid.uuid4()
+    _write(
+        insert(Meeting).values(id=meeting_id, summary="segments"),
+        insert(MeetingTranscript).values(meeting_id=meeting_id, content="segments"),
+        insert(MeetingSegment).values(
+            [
+                {"meeting_id": meeting_id, "start_seconds": float(start), "duration_seconds": 10.0, "text": f"at {start}"}
+                for start in starts
+            ]
+        ),
+    )
+    yield meeting_id
+    _write(delete(Meeting).where(Meeting.id == meeting_id))
+
+
+def _starts(client, meeting_id, **params) -> list[float]:
+    response = client.get(f"/meetings/{meeting_id}/segments", params=params)
+    assert response.status_code == 200
+    return [item["start"] for item in response.json()["items"]]
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        ({}, [0, 10, 20, 30, 40, 80]),
+        ({"start": 25, "end": 45}, [20, 30, 40]),
+        # 경계에서 끝나는 세그먼트는 [start, end) 와 겹치지 않는다
+        ({"start": 30, "end": 40}, [30]),
+        # 무음 구간 안에서 시작하면 다음 세그먼트부터
+        ({"start": 60}, [80]),
+        ({"end": 15}, [0, 10]),
+        ({"start": 95}, []),
+    ],
+)
+def test_window_returns_overlapping_segments(client, meeting_id, params, expected) -> None:
+    assert _starts(client, meeting_id, **params) == expected
+
+
+def test_pages_cover_window_without_gaps_or_duplicates(client, meeting_id) -> None:
+    starts: list[float] = []
+    params = {"start": 5, "limit": 2}
+    while True:
+        response = client.get(f"/meetings/{meeting_id}/segments", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        starts += [item["start"] for item in page["items"]]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert starts == [0, 10, 20, 30, 40, 80]
+
+
+def test_item_end_is_start_plus_duration(client, meeting_id) -> None:
+    item = client.get(f"/meetings/{meeting_id}/segments", params={"start": 80}).json()["items"][0]
+    assert (item["start"], item["end"], item["text"]) == (80, 90, "at 80")
+
+
+def test_invalid_window_and_unknown_meeting(client, meeting_id) -> None:
+    assert client.get(f"/meetings/{meeting_id}/segments", params={"start": 40, "end": 40}).status_code == 400
+    assert client.get(f"/meetings/{uuid.uuid4()}/segments").status_code == 404
@@ -0,0 +1,83 @@
+"""STT 쿼터 예약/확정 산술 테스트. 테스트마다 별도 provider 이름을 써서 실제 사용량 행과 섞이지 않는다."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import uuid
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.config.db import SessionLocal
+from app.models.models import SttQuotaReservation, SttUsage, SttUsageMonthly
+from app.service import quota_service
+from app.service.quota_service import commit_quota, current_month, month_range, release_quota, reserve_quota
+
+
+@pytest.fixture
+def provider(db_available):
+    name = f"test-{uuid.uuid4()}"
+    yield name
+    with SessionLocal() as db:
+        for model in (SttQuotaReservation, SttUsage, SttUsageMonthly):
+            db.execute(delete(model).where(model.provider == name))
+        db.commit()
+
+
+def _rollup(provider: str) -> tuple[float, float]:
+    with SessionLocal() as db:
+        row = db.get(SttUsageMonthly, (provider, current_month()))
+        return row.used_seconds, row.reserved_seconds
+
+
+def test_month_range_wraps_december() -> None:
+    assert current_month(datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc)) == date(2026, 12, 1)
+    assert month_range(date(2026, 12, 1)) == (
+        datetime(2026, 12, 1, tzinfo=timezone.utc),
+        datetime(2027, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_reserve_rejects_over_limit(provider) -> None:
+    with SessionLocal() as db:
+        first = reserve_quota(db, provider, 60.0, limit_seconds=100.0)
+        assert first is not None and first.seconds == 60.0
+        # used + reserved + 요청 > 한도
+        assert reserve_quota(db, provider, 41.0, limit_seconds=100.0) is None
+        assert reserve_quota(db, provider, 40.0, limit_seconds=100.0) is not None
+
+    assert _rollup(provider) == (0.0, 100.0)
+
+
+def test_commit_moves_actual_usage_and_returns_the_rest(provider) -> None:
+    with SessionLocal() as db:
+        reservation = reserve_quota(db, provider, 60.0, limit_seconds=100.0)
+        other = reserve_quota(db, provider, 30.0, limit_seconds=100.0)
+
+        commit_quota(db, reservation, 45.0)
+        assert _rollup(provider) == (45.0, 30.0)
+
+        release_quota(db, other)
+        assert _rollup(provider) == (45.0, 0.0)
+        # 반환된 만큼 다시 예약할 수 있다
+        assert reserve_quota(db, provider, 55.0, limit_seconds=100.0) is not None
+        assert reserve_quota(db, provider, 1.0, limit_seconds=100.0) is None
+
+
+def test_expired_reservation_is_returned_once(provider, monkeypatch) -> None:
+    with SessionLocal() as db:
+        reservation = reserve_quota(db, provider, 60.0, limit_seconds=100.0)
+        db.execute(
+            update(SttQuotaReservation)
+            .where(SttQuotaReservation.id == reservation.id)
+            .values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        db.commit()
+
+        monkeypatch.setattr(quota_service, "_last_swept_at", 0.0)
+        assert reserve_quota(db, provider, 10.0, limit_seconds=100.0) is not None
+        assert _rollup(provider) == (0.0, 10.0)
+
+        # 회수된 뒤 늦게 확정해도 reserved 를 한 번 더 빼지 않고 사용량만 기록
+        commit_quota(db, reservation, 20.0)
+        assert _rollup(provider) == (20.0, 10.0)
@@ -0,0 +1,101 @@
+"""STT 라우터 failover / 재시도 횟수 테스트 (DB, 네트워크 불필요)."""
+
+from __future__ import annotations
+
+from collections import Counter
+import asyncio
+import time
+
+import httpx
+import numpy as np
+import pytest
+
+from app.service import stt_service
+from app.service.audio_service import PcmAudio
+from app.service.stt_routing_service import CircuitState, SegmentText, SttBackendError, SttRouter
+
+AUDIO = PcmAudio(samples=np.zeros((16000, 1), dtype=np.int16), sample_rate=16000)
+
+
+def _backends(calls: Counter, *, slow: str | None = None, ok: str | None = None) -> dict:
+    def make(name: str):
+        async def call(audio: PcmAudio) -> SegmentText:
+            calls[name] += 1
+            if name == slow:
+                await asyncio.sleep(0.05)
+            if name == ok:
+                return SegmentText(text=name)
+            raise SttBackendError(f"{name} 503", retryable=True, upstream_status=503)
+
+        return call
+
+    return {name: make(name) for name in ("azure_speech", "whisper", "spare")}
+
+
+def _with_hedge_samples(router: SttRouter, backend: str) -> SttRouter:
+    # p95 지연이 짧은 1순위라 바로 hedging 한다
+    now = time.monotonic()
+    for _ in range(20):
+        router.health(backend).record_success(0.01, 1.0, now)
+    return router
+
+
+def test_failover_skips_backend_already_hedged() -> None:
+    calls: Counter = Counter()
+    router = _with_hedge_samples(SttRouter(), "azure_speech")
+
+    result = asyncio.run(router.transcribe(AUDIO, _backends(calls, slow="azure_speech", ok="spare"), hedge=True))
+
+    assert result.backend == "spare"
+    assert calls == {"azure_speech": 1, "whisper": 1, "spare": 1}
+
+
+def test_failover_rechecks_circuit_breaker() -> None:
+    calls: Counter = Counter()
+    router = SttRouter()
+    router.health("whisper")._set_state(CircuitState.HALF_OPEN)
+    backends = _backends(calls, ok="spare")
+    primary = backends["azure_speech"]
+
+    async def azure_speech(audio: PcmAudio) -> SegmentText:
+        # rank 이후 다른 요청이 whisper 의 half-open probe 를 보내는 중
+        router.health("whisper").probe_in_flight = True
+        return await primary(audio)
+
+    backends["azure_speech"] = azure_speech
+    result = asyncio.run(router.transcribe(AUDIO, backends))
+
+    assert result.backend == "spare"
+    assert calls == {"azure_speech": 1, "spare": 1}
+
+
+def test_segment_calls_bounded_by_attempts_times_backends(monkeypatch) -> None:
+    monkeypatch.setattr(stt_service.settings, "stt_segment_max_attempts", 2)
+    calls: Counter = Counter()
+    router = SttRouter()
+    backends = _backends(calls)
+
+    async def transcribe_one(segment: PcmAudio):
+        return await router.transcribe(segment, backends)
+
+    with pytest.raises(SttBackendError):
+        asyncio.run(stt_service._transcribe_segment_with_retry(0, AUDIO, transcribe_one))
+    assert calls == {"azure_speech": 2, "whisper": 2, "spare": 2}
+
+
+def test_network_error_is_not_retried_per_request() -> None:
+    requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        raise httpx.ConnectError("boom", request=request)
+
+    async def post() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await stt_service._post(client, "http://stt.invalid/v1", label="Whisper", timeout=1.0)
+
+    with pytest.raises(SttBackendError) as excinfo:
+        asyncio.run(post())
+    assert excinfo.value.retryable
+    assert requests == 1
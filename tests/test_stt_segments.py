@@ -0,0 +1,85 @@
+"""긴 녹음의 세그먼트 분할 전사(fan-out) 테스트 (DB, 네트워크 불필요)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.service import stt_service
+from app.service.audio_service import PcmAudio
+from app.service.stt_routing_service import RoutedResult, SttBackendError
+from app.service.stt_service import TranscriptSegment, transcribe_segments
+
+SAMPLE_RATE = 100
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch) -> None:
+    # 1초 오디오를 최대 0.1초 세그먼트 10개로 나눈다
+    monkeypatch.setattr(stt_service.settings, "stt_segment_max_seconds", 0.1)
+    monkeypatch.setattr(stt_service.settings, "stt_segment_min_seconds", 0.1)
+    monkeypatch.setattr(stt_service.settings, "stt_segment_concurrency", 3)
+
+
+def _audio() -> PcmAudio:
+    # 세그먼트마다 첫 샘플에 번호를 넣어 전사 결과로 돌려준다
+    samples = np.zeros((SAMPLE_RATE, 1), dtype=np.int16)
+    samples[::10, 0] = np.arange(10)
+    return PcmAudio(samples=samples, sample_rate=SAMPLE_RATE)
+
+
+def test_segments_run_concurrently_and_join_in_order() -> None:
+    running = peak = 0
+    completed: list[int] = []
+
+    async def transcribe_one(piece: PcmAudio) -> RoutedResult:
+        nonlocal running, peak
+        index = int(piece.samples[0, 0])
+        running += 1
+        peak = max(peak, running)
+        # 뒤 세그먼트가 먼저 끝나도록
+        await asyncio.sleep(0.001 * (10 - index))
+        running -= 1
+        completed.append(index)
+        return RoutedResult(text=f" s{index} " if index != 4 else "  ", backend="whisper")
+
+    segments: list[TranscriptSegment] = []
+    callbacks: list[tuple[int, str]] = []
+    transcript = asyncio.run(
+        transcribe_segments(_audio(), transcribe_one, on_segment=lambda i, text: callbacks.append((i, text)), segments=segments)
+    )
+
+    assert peak == 3
+    assert completed != sorted(completed)
+    # 빈 세그먼트는 건너뛰고 번호 순서로 이어 붙인다
+    assert transcript == "s0 s1 s2 s3 s5 s6 s7 s8 s9"
+    assert sorted(index for index, _ in callbacks) == list(range(10))
+    assert [(segment.start_seconds, segment.text) for segment in segments] == [
+        (pytest.approx(i / 10), f"s{i}") for i in range(10) if i != 4
+    ]
+
+
+def test_failed_segment_cancels_the_rest() -> None:
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def transcribe_one(piece: PcmAudio) -> RoutedResult:
+        index = int(piece.samples[0, 0])
+        started.append(index)
+        if index == 1:
+            raise SttBackendError("invalid audio", retryable=False, upstream_status=400)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return RoutedResult(text="late", backend="whisper")
+
+    with pytest.raises(SttBackendError):
+        asyncio.run(transcribe_segments(_audio(), transcribe_one))
+
+    # 시작한 나머지 세그먼트는 취소되고, 동시 한도 때문에 기다리던 세그먼트는 시작하지 않는다
+    assert sorted(cancelled) == sorted(set(started) - {1})
+    assert len(started) < 10
@@ -0,0 +1,91 @@
+"""프로세스 내 TTL/LRU 캐시와 STT 결과 캐시 키 테스트 (DB 불필요)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.service import cache_service
+from app.service.audio_service import PcmAudio
+from app.service.cache_service import TtlLruCache
+from app.service.transcript_cache_service import audio_fingerprint, transcript_cache_key
+
+
+def _clock(monkeypatch, start: float = 1000.0) -> list[float]:
+    now = [start]
+    monkeypatch.setattr(cache_service.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(monkeypatch) -> None:
+    now = _clock(monkeypatch)
+    cache: TtlLruCache[str, str] = TtlLruCache(max_entries=4, ttl_seconds=60)
+    cache.set("a", "1")
+
+    now[0] += 60
+    assert cache.get("a") == "1"
+    now[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_without_ttl_entries_do_not_expire(monkeypatch) -> None:
+    now = _clock(monkeypatch)
+    cache: TtlLruCache[str, str] = TtlLruCache(max_entries=4)
+    cache.set("a", "1")
+
+    now[0] += 365 * 24 * 3600
+    assert cache.get("a") == "1"
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TtlLruCache[str, int] = TtlLruCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a 가 최근 사용으로 바뀌어 b 가 가장 오래됨
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_refreshes_ttl_and_recency(monkeypatch) -> None:
+    now = _clock(monkeypatch)
+    cache: TtlLruCache[str, int] = TtlLruCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    now[0] += 50
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    now[0] += 50
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def _audio(sample_rate: int = 16000, channels: int = 1, seed: int = 0) -> PcmAudio:
+    samples = np.random.default_rng(seed).integers(-3000, 3000, (sample_rate, channels), dtype=np.int16)
+    return PcmAudio(samples=samples, sample_rate=sample_rate)
+
+
+def test_fingerprint_depends_on_samples_and_format() -> None:
+    audio = _audio()
+
+    assert audio_fingerprint(audio) == audio_fingerprint(_audio())
+    assert audio_fingerprint(audio) != audio_fingerprint(_audio(seed=1))
+    # 같은 바이트라도 샘플레이트/채널이 다르면 다른 오디오
+    same_bytes = PcmAudio(samples=audio.samples.reshape(-1, 2), sample_rate=16000)
+    assert audio_fingerprint(audio) != audio_fingerprint(same_bytes)
+    assert audio_fingerprint(audio) != audio_fingerprint(PcmAudio(samples=audio.samples, sample_rate=8000))
+
+
+def test_cache_key_includes_backend_and_language() -> None:
+    fingerprint = audio_fingerprint(_audio())
+    key = transcript_cache_key(fingerprint, "whisper", "ko")
+
+    assert key == transcript_cache_key(fingerprint, "whisper", "ko")
+    assert key != transcript_cache_key(fingerprint, "azure_speech", "ko")
+    assert key != transcript_cache_key(fingerprint, "whisper", "en")
+    assert key != transcript_cache_key(audio_fingerprint(_audio(seed=1)), "whisper", "ko")
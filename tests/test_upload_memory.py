@@ -0,0 +1,107 @@
+"""대용량 업로드를 동시에 처리할 때의 힙 최대 사용량 회귀 테스트 (POST /meetings/record).
+
+업로드 임시 파일 mmap → decode_wav(memoryview) → preprocess_audio → WavStream 경로가
+녹음 길이 × 동시 요청 수에 비례하는 복사본을 만들지 않는지 tracemalloc 으로 확인한다.
+STT 는 httpx.MockTransport 가짜 Whisper, 요약은 고정 문자열로 대신하고 회의 저장에는 DATABASE_URL 의 DB 를 쓴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+
+import httpx
+import numpy as np
+
+from app.config import http
+from app.config.db import async_engine, init_db
+from app.config.http import HttpBackend
+from app.main import app
+from app.service import meeting_service, stt_service
+from app.service.audio_service import _wav_header
+
+UPLOADS = 3
+MINUTES = 5
+# 요청마다 정규화된 16kHz mono PCM(5분 ≈ 10MB)과 크기가 고정된 VAD 특징 블록(≈15MB)만 남는다 (측정 ≈ 86MB).
+# 업로드를 bytes 로 통째로 읽으면 업로드 크기(≈165MB)가 더해져 이 상한을 넘는다
+HEAP_LIMIT_MB = 128
+
+
+def _write_wav(path, *, seconds: float, seed: int, sample_rate: int = 48000, channels: int = 2) -> None:
+    """발화(3~8초)와 무음(0.5~2초)이 번갈아 나오는 16bit WAV. 업로드마다 내용이 달라 오디오 저장소에서 합쳐지지 않는다."""
+
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    with open(path, "wb") as out:
+        out.write(_wav_header(channels, sample_rate, total * channels * 2))
+        written = 0
+        while written < total:
+            speech = rng.normal(0, 3000, (int(rng.uniform(3, 8) * sample_rate), channels))
+            silence = rng.normal(0, 30, (int(rng.uniform(0.5, 2) * sample_rate), channels))
+            block = np.concatenate((speech, silence))[: total - written].astype("<i2")
+            out.write(block.tobytes())
+            written += len(block)
+
+
+async def _fake_whisper(request: httpx.Request) -> httpx.Response:
+    await request.aread()
+    return httpx.Response(200, json={"text": "ok"})
+
+
+class _FakeSummarizer:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def add(self, index: int, text: str) -> None:
+        pass
+
+    async def finish(self, transcript: str) -> str:
+        return "요약"
+
+
+def test_concurrent_record_uploads_heap_is_bounded(db_available, monkeypatch, tmp_path) -> None:
+    settings = stt_service.settings
+    monkeypatch.setattr(settings, "use_speech_service", False)
+    monkeypatch.setattr(settings, "use_whisper_api", True)
+    monkeypatch.setattr(settings, "whisper_api_base_url", "http://whisper.invalid")
+    monkeypatch.setattr(settings, "whisper_api_key", "test")
+    monkeypatch.setattr(settings, "transcript_cache_enabled", False)
+    monkeypatch.setattr(settings, "audio_store_dir", str(tmp_path / "audio"))
+    monkeypatch.setattr(meeting_service, "IncrementalSummarizer", _FakeSummarizer)
+
+    init_db()
+    paths = [tmp_path / f"upload-{i}.wav" for i in range(UPLOADS)]
+    for seed, path in enumerate(paths):
+        _write_wav(path, seconds=MINUTES * 60, seed=seed)
+    upload_mb = sum(path.stat().st_size for path in paths) / 2**20
+
+    async def scenario() -> tuple[list[httpx.Response], int]:
+        http._clients[HttpBackend.WHISPER] = httpx.AsyncClient(transport=httpx.MockTransport(_fake_whisper))
+        # ASGITransport 는 multipart 본문을 파일에서 chunk 단위로 흘려 보내므로 클라이언트 쪽 복사본은 힙에 남지 않는다
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+
+            async def post(path) -> httpx.Response:
+                with open(path, "rb") as file:
+                    return await client.post("/meetings/record", files={"audio": ("recording.wav", file, "audio/wav")})
+
+            tracemalloc.start()
+            try:
+                responses = await asyncio.gather(*(post(path) for path in paths))
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            for response in responses:
+                if response.status_code == 201:
+                    await client.delete(f"/meetings/{response.json()['id']}")
+        await http.close_http_clients()
+        await async_engine.dispose()
+        return responses, peak
+
+    responses, peak = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [201] * UPLOADS
+    assert peak < HEAP_LIMIT_MB * 2**20, f"heap peak {peak / 2**20:.1f}MB for {upload_mb:.0f}MB of uploads"
@@ -0,0 +1,97 @@
+"""VAD 발화 구간 검출과 시각 변환 테스트 (DB 불필요)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.service.audio_service import PcmAudio
+from app.service.vad_service import SpeechAudio, detect_speech_regions, extract_speech
+
+SAMPLE_RATE = 16000
+FRAME = SAMPLE_RATE * 30 // 1000
+PADDING = 8 * FRAME  # stt_vad_padding_ms(240) / stt_vad_frame_ms(30)
+
+
+def _audio(*parts: tuple[str, float]) -> PcmAudio:
+    """("tone"|"silence", 초) 를 이어 붙인 모노 오디오. tone 은 ZCR 이 낮은 440Hz 사인파."""
+
+    pieces = []
+    for kind, seconds in parts:
+        frames = int(seconds * SAMPLE_RATE)
+        if kind == "tone":
+            t = np.arange(frames) / SAMPLE_RATE
+            pieces.append((8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16))
+        else:
+            pieces.append(np.zeros(frames, dtype=np.int16))
+    return PcmAudio(samples=np.concatenate(pieces)[:, None], sample_rate=SAMPLE_RATE)
+
+
+def test_detects_tone_regions_with_padding() -> None:
+    audio = _audio(("silence", 2), ("tone", 3), ("silence", 3), ("tone", 2), ("silence", 1))
+
+    regions = detect_speech_regions(audio)
+
+    expected = [(2 * SAMPLE_RATE - PADDING, 5 * SAMPLE_RATE + PADDING), (8 * SAMPLE_RATE - PADDING, 10 * SAMPLE_RATE + PADDING)]
+    assert len(regions) == 2
+    for (start, end), (expected_start, expected_end) in zip(regions, expected):
+        # 경계는 30ms 프레임 단위로 맞춰진다
+        assert abs(start - expected_start) <= FRAME
+        assert abs(end - expected_end) <= FRAME
+
+
+def test_short_silence_is_merged_and_short_click_dropped() -> None:
+    audio = _audio(("silence", 1), ("tone", 1), ("silence", 0.3), ("tone", 1), ("silence", 2), ("tone", 0.06), ("silence", 2))
+
+    regions = detect_speech_regions(audio)
+
+    assert len(regions) == 1
+    assert regions[0][1] < int(4.1 * SAMPLE_RATE)
+
+
+def test_silence_has_no_speech() -> None:
+    speech = extract_speech(_audio(("silence", 5)))
+
+    assert speech.regions == []
+    assert not speech.has_speech
+    assert speech.speech_seconds == 0.0
+    assert speech.source_seconds_at(1.0) == 0.0
+
+
+def test_extract_speech_joins_regions_with_gap() -> None:
+    audio = _audio(("silence", 2), ("tone", 3), ("silence", 3), ("tone", 2), ("silence", 1))
+
+    speech = extract_speech(audio)
+
+    lengths = [end - start for start, end in speech.regions]
+    assert speech.audio.num_frames == sum(lengths) + speech.gap_frames
+    assert speech.source_seconds == audio.duration_seconds
+
+
+def _speech(regions: list[tuple[int, int]], gap_frames: int) -> SpeechAudio:
+    total = sum(end - start for start, end in regions) + gap_frames * (len(regions) - 1)
+    return SpeechAudio(
+        audio=PcmAudio(samples=np.zeros((total, 1), dtype=np.int16), sample_rate=10),
+        regions=regions,
+        gap_frames=gap_frames,
+        source_seconds=10.0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (0.0, 1.0),  # 첫 구간 시작
+        (1.5, 2.5),  # 첫 구간 안
+        (2.0, 3.0),  # 첫 구간 끝 = gap 시작
+        (2.3, 3.0),  # gap 안은 앞 구간의 끝
+        (2.5, 6.0),  # 두 번째 구간 시작
+        (3.5, 7.0),  # 두 번째 구간 끝
+        (9.0, 7.0),  # 범위를 넘으면 마지막 구간의 끝
+    ],
+)
+def test_source_seconds_at_maps_through_gaps(seconds: float, expected: float) -> None:
+    # 원본 [1s, 3s) 와 [6s, 7s) 를 0.5초 gap 으로 이어 붙인 10Hz 오디오
+    speech = _speech([(10, 30), (60, 70)], gap_frames=5)
+
+    assert speech.source_seconds_at(seconds) == pytest.approx(expected)